@@ -0,0 +1,43 @@
+"""
+Compare building a large declarative form widget by widget with building it
+through batched Tcl scripts.
+
+Usage: python benchmarks/bench_build.py [widgets]
+"""
+import sys
+import time
+import tkinter as tk
+
+from tkreform import Window
+from tkreform.declarative import W, Gridder
+
+
+def form(n: int):
+    return (
+        W(tk.Frame) * Gridder(row=i // 2, column=i % 2) / (
+            W(tk.Label, text=f"Field {i}") * Gridder(column=0),
+            W(tk.Entry, width=20) * Gridder(column=1)
+        ) for i in range(n // 3)
+    )
+
+
+def bench(n: int, scripted: bool):
+    win = Window(tk.Tk())
+    win.wmhide()
+    start = time.perf_counter()
+    if scripted:
+        win.load_script(form(n))
+    else:
+        win.load_sub(form(n))
+    win.update()
+    elapsed = time.perf_counter() - start
+    win.destroy()
+    return elapsed
+
+
+n = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+per_widget = bench(n, False)
+scripted = bench(n, True)
+print(f"{n} widgets")
+print(f"per widget: {per_widget * 1000:.1f} ms")
+print(f"scripted:   {scripted * 1000:.1f} ms ({per_widget / scripted:.2f}x)")
@@ -0,0 +1,117 @@
+"""
+Import time benchmark of tkreform.
+
+Every case is a statement run in a fresh interpreter with `-X importtime`;
+its cost is the self time of the modules it imports beyond those Python
+imports at startup. Every case is run `--repeat` times (after a run writing
+the bytecode caches) and the best run is kept.
+
+Results are written and compared with a baseline as in `suite.py`, relative
+to importing a fixed set of standard modules. Import times of a fraction
+of a millisecond are mostly noise: slowdowns below `--floor` ms are not
+regressions.
+
+Usage:
+    python benchmarks/bench_import.py [--top 15]
+    python benchmarks/bench_import.py --save benchmarks/import_baseline.json
+    python benchmarks/bench_import.py --baseline benchmarks/import_baseline.json
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from suite import Result, compare, timed  # noqa: E402
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+# the reference workload, scaling baselines to the machine
+REFERENCE = "import argparse, decimal, email.message, json"
+CASES = {
+    "import_package": "import tkreform",
+    "import_window": "from tkreform import Window",
+    "import_declarative": "from tkreform.declarative import W, Packer",
+    "import_catalog": "from tkreform.catalog import load_catalogs",
+}
+
+
+def importtime(statement: str) -> Dict[str, int]:
+    """Self time (us) of every module imported running a statement."""
+    env = dict(os.environ)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, (ROOT, env.get("PYTHONPATH"))))
+    out = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        env=env, stderr=subprocess.PIPE, stdout=subprocess.DEVNULL,
+        universal_newlines=True, check=True
+    ).stderr
+    times = {}
+    for line in out.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        own, _, name = line[len("import time:"):].split("|")
+        times[name.strip()] = int(own)
+    return times
+
+
+def measure(statement: str, startup: Dict[str, int], repeat: int) -> Tuple[Result, Dict[str, int]]:
+    """The import time (ms) of a statement, and the self times of its best run."""
+    importtime(statement)  # write the bytecode caches
+    runs = []
+    for _ in range(repeat):
+        times = {k: v for k, v in importtime(statement).items() if k not in startup}
+        runs.append((sum(times.values()) / 1000, times))
+    runs.sort(key=lambda x: x[0])
+    return timed("ms", [ms for ms, _ in runs]), runs[0][1]
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="runs per case, the best is kept")
+    parser.add_argument("--top", type=int, default=0, help="list the slowest modules of each case")
+    parser.add_argument("--out", help="write the results to this JSON file")
+    parser.add_argument("--save", help="write the results as a new baseline")
+    parser.add_argument("--baseline", help="compare with this baseline")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="slowdown ratio allowed")
+    parser.add_argument("--floor", type=float, default=1.0, help="slowdown allowed, in ms")
+    args = parser.parse_args()
+
+    startup = importtime("pass")
+    results = {}
+    for name, statement in CASES.items():
+        result, times = measure(statement, startup, args.repeat)
+        results[name] = result
+        if args.top:
+            slowest: List[Tuple[str, int]] = sorted(times.items(), key=lambda x: -x[1])
+            print(f"{name}: {result['value']:.2f} ms")
+            for module, us in slowest[:args.top]:
+                print(f"    {us / 1000:8.2f} ms  {module}")
+    results = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "reference": measure(REFERENCE, startup, args.repeat)[0],
+        "results": results,
+    }
+    text = json.dumps(results, indent=2)
+    for path in (args.out, args.save):
+        if path:
+            with open(path, "w") as f:
+                f.write(text + "\n")
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(results, json.load(f), args.tolerance, args.floor)
+        if regressions:
+            sys.exit(f"{len(regressions)} regression(s): {', '.join(regressions)}")
+    elif not (args.out or args.save or args.top):
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
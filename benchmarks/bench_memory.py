@@ -0,0 +1,100 @@
+"""
+Measure the Python memory held per node of a large declarative tree: the
+`W` nodes with their geometry specs, and the `Widget` wrappers built from
+them (measured around placeholder objects, without Tcl widgets).
+
+The results are printed next to a baseline: by default
+`memory_baseline.json`, measured on the tree before nodes and wrappers were
+slotted, geometry specs shared and wrapper containers created on first use.
+Sizes do not depend on the speed of the machine, only on the Python version.
+
+Usage:
+    python benchmarks/bench_memory.py [--nodes 20000]
+    python benchmarks/bench_memory.py --save benchmarks/memory_baseline.json
+"""
+import argparse
+import gc
+import json
+import os
+import platform
+import sys
+import tkinter as tk
+import tracemalloc
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(HERE, ".."))
+
+from tkreform import Widget  # noqa: E402
+from tkreform.declarative import Gridder, Packer, W  # noqa: E402
+
+CASES = {
+    "node": "W node + geometry spec",
+    "widget": "Widget wrapper",
+}
+
+
+def tree(n: int):
+    return tuple(
+        W(tk.Frame) * Gridder(row=i % 100, sticky="nw") / (
+            W(tk.Label, text="Name") * Packer(side="left"),
+            W(tk.Entry, width=20) * Packer(side="right", padx=4),
+        ) for i in range(n // 3)
+    )
+
+
+def measure(build):
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    kept = build()
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del kept
+    return after - before
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--nodes", type=int, default=20000, help="nodes in the tree")
+    parser.add_argument(
+        "--baseline", default=os.path.join(HERE, "memory_baseline.json"),
+        help="compare with this baseline"
+    )
+    parser.add_argument("--save", help="write the results as a new baseline")
+    args = parser.parse_args()
+
+    n = args.nodes
+    sizes = {
+        "node": measure(lambda: tree(n)) / n,
+        "widget": measure(lambda: [Widget(object()) for _ in range(n)]) / n,  # type: ignore
+    }
+    results = {
+        "python": platform.python_version(),
+        "nodes": n,
+        "results": {k: round(v, 1) for k, v in sizes.items()},
+    }
+    if args.save:
+        with open(args.save, "w") as f:
+            f.write(json.dumps(results, indent=2) + "\n")
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+    print(f"{n} nodes, bytes/node")
+    if baseline:
+        print(f"{'':24}{'now':>8}{'baseline':>10}{'change':>9}")
+    for name, label in CASES.items():
+        line = f"{label + ':':24}{sizes[name]:8.1f}"
+        before = baseline.get("results", {}).get(name)
+        if before:
+            line += f"{before:10.1f}{(sizes[name] - before) / before:+9.0%}"
+        print(line)
+    if baseline and baseline.get("python") != results["python"]:
+        print(f"baseline measured on Python {baseline.get('python')}")
+
+
+if __name__ == "__main__":
+    main()
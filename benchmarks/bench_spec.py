@@ -0,0 +1,53 @@
+"""
+Measure loading a large declarative tree from a JSON spec: parsing and
+validating it, and loading it again from the parsed tree cache.
+
+Usage: python benchmarks/bench_spec.py [nodes]
+"""
+import os
+import shutil
+import sys
+import tempfile
+import time
+import tkinter as tk
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from tkreform.declarative import Gridder, Packer, W, dumps, load  # noqa: E402
+
+
+def tree(n: int):
+    return tuple(
+        W(tk.Frame) * Gridder(row=i % 100, sticky="nw") / (
+            W(tk.Label, text=f"Field {i}") * Packer(side="left"),
+            W(tk.Entry, width=20) * Packer(side="right", padx=4),
+        ) for i in range(n // 3)
+    )
+
+
+n = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+root = tempfile.mkdtemp()
+try:
+    path = os.path.join(root, "layout.json")
+    cache = os.path.join(root, "cache")
+    with open(path, "w") as f:
+        f.write(dumps(tree(n)))
+    size = os.path.getsize(path)
+    times = []
+    for _ in range(3):
+        start = time.perf_counter()
+        load(path, None)
+        times.append(time.perf_counter() - start)
+    parsed = min(times)
+    load(path, cache)
+    times = []
+    for _ in range(3):
+        start = time.perf_counter()
+        load(path, cache)
+        times.append(time.perf_counter() - start)
+    cached = min(times)
+finally:
+    shutil.rmtree(root)
+print(f"{n} nodes, {size >> 10} KiB of JSON")
+print(f"parse and validate: {parsed * 1e3:8.1f} ms")
+print(f"from cache:         {cached * 1e3:8.1f} ms")
@@ -0,0 +1,337 @@
+"""
+Benchmark suite of tkreform hot paths.
+
+Measures building and destroying declarative trees (100, 1k and 10k
+widgets), `Widget.apply`, keyed re-renders through `/`, property writes and
+reads, event dispatch through `event_generate` (plain bindings and
+`ActionGroup`) and Python memory per widget. Every case is run `--repeat`
+times and the best run is kept.
+
+Without a display, an Xvfb server is started for the run (Xvfb must be
+installed).
+
+Results are written as JSON, and compared with a baseline: a case slower
+than its baseline by more than the tolerance is a regression, and the
+suite exits with status 1. Timings are compared relative to a reference
+workload (Python -> Tcl round trips) run in the same process, so that a
+baseline saved on another machine still applies, and differences within
+the noise of the repeated runs are not regressions. No baseline is stored
+in the repository: save one first, on a machine with a display or Xvfb.
+
+Usage:
+    python benchmarks/suite.py [--quick] [--out results.json]
+    python benchmarks/suite.py --save benchmarks/baseline.json
+    python benchmarks/suite.py --baseline benchmarks/baseline.json [--tolerance 0.25]
+"""
+import argparse
+import gc
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import time
+import tkinter as tk
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from tkreform import Window  # noqa: E402
+from tkreform.declarative import Gridder, Packer, W  # noqa: E402
+from tkreform.groups import ActionGroup  # noqa: E402
+
+Result = Dict[str, Any]
+
+
+def start_display() -> Optional[subprocess.Popen]:
+    """Start an Xvfb server if there is no display."""
+    if os.environ.get("DISPLAY") or sys.platform in ("win32", "darwin"):
+        return None
+    if shutil.which("Xvfb") is None:
+        sys.exit("no display, and Xvfb is not installed.")
+    display = f":{90 + os.getpid() % 100}"
+    server = subprocess.Popen(
+        ["Xvfb", display, "-screen", "0", "1280x1024x24", "-nolisten", "tcp"],
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    os.environ["DISPLAY"] = display
+    for _ in range(50):
+        try:
+            tk.Tk().destroy()
+            return server
+        except tk.TclError:
+            time.sleep(0.1)
+    server.terminate()
+    sys.exit("Xvfb did not start.")
+
+
+def tree(n: int, tag: str = ""):
+    # rows of a label and an entry in frames, n widgets in all
+    return tuple(
+        W(tk.Frame) @ i * Gridder(row=i) / (
+            W(tk.Label, text=f"{tag}Field {i}") * Packer(side="left"),
+            W(tk.Entry, width=20) * Packer(side="left")
+        ) for i in range(n // 3)
+    )
+
+
+def runs(fn: Callable[[], float], repeat: int) -> List[float]:
+    times = []
+    for _ in range(repeat):
+        gc.collect()
+        times.append(fn())
+    return times
+
+
+def case(unit: str, value: float, noise: float = 0.0, relative: bool = True) -> Result:
+    """
+    A result. `noise` is the spread of its repeated runs, and `relative`
+    whether it scales with the speed of the machine (timings, not sizes).
+    """
+    return {
+        "value": value, "unit": unit, "better": "lower", "noise": noise, "relative": relative
+    }
+
+
+def timed(unit: str, times: List[float], scale: float = 1.0) -> Result:
+    """Result of repeated timings: the best one, its noise the gap to the median."""
+    times = sorted(t * scale for t in times)
+    return case(unit, times[0], times[len(times) // 2] - times[0])
+
+
+def reference(repeat: int) -> Result:
+    """Time of a fixed workload, Python -> Tcl round trips, to compare machines."""
+    interp = tk.Tcl()
+    n = 20000
+
+    def run():
+        start = time.perf_counter()
+        for i in range(n):
+            interp.tk.call("set", "tkreform_bench", i)
+        return time.perf_counter() - start
+    return timed("us/call", runs(run, max(repeat, 5)), 1e6 / n)
+
+
+def bench_build(win: Window, n: int, repeat: int) -> Tuple[Result, Result]:
+    build: List[float] = []
+    teardown: List[float] = []
+    for _ in range(repeat):
+        gc.collect()
+        frame = win.add_widget(tk.Frame)
+        start = time.perf_counter()
+        frame.load_sub(tree(n))
+        win.base.update_idletasks()
+        build.append(time.perf_counter() - start)
+        start = time.perf_counter()
+        frame.destroy()
+        win.base.update_idletasks()
+        teardown.append(time.perf_counter() - start)
+        win._sub_widget.remove(frame)
+    return timed("us/widget", build, 1e6 / n), timed("us/widget", teardown, 1e6 / n)
+
+
+def bench_apply(win: Window, repeat: int) -> Result:
+    frame = win.add_widget(tk.Frame)
+    widgets = [frame.add_widget(tk.Label) for _ in range(1000)]
+
+    def run():
+        start = time.perf_counter()
+        for i, w in enumerate(widgets):
+            w.apply(Gridder(row=i % 50, column=i // 50))
+        return time.perf_counter() - start
+    result = timed("us/call", runs(run, repeat), 1e6 / len(widgets))
+    frame.destroy()
+    win._sub_widget.remove(frame)
+    return result
+
+
+def bench_rerender(win: Window, repeat: int) -> Tuple[Result, Result]:
+    frame = win.add_widget(tk.Frame)
+    frame.reconciling = True
+    frame /= tree(1000)
+
+    def same():
+        start = time.perf_counter()
+        frame /= tree(1000)
+        return time.perf_counter() - start
+
+    flip = [0]
+
+    def changed():
+        flip[0] += 1
+        start = time.perf_counter()
+        frame /= tree(1000, str(flip[0]))
+        return time.perf_counter() - start
+    result = (timed("ms", runs(same, repeat), 1e3), timed("ms", runs(changed, repeat), 1e3))
+    frame.destroy()
+    win._sub_widget.remove(frame)
+    return result
+
+
+def bench_properties(win: Window, repeat: int) -> Tuple[Result, Result]:
+    label = win.add_widget(tk.Label)
+    n = 10000
+
+    def write():
+        start = time.perf_counter()
+        for i in range(n):
+            label.text = "x" if i & 1 else "y"
+            label.width = i & 15
+        return time.perf_counter() - start
+
+    def read():
+        start = time.perf_counter()
+        for _ in range(n):
+            label.text
+            label.width
+        return time.perf_counter() - start
+    result = (
+        timed("us/op", runs(write, repeat), 1e6 / (2 * n)),
+        timed("us/op", runs(read, repeat), 1e6 / (2 * n)),
+    )
+    label.destroy()
+    win._sub_widget.remove(label)
+    return result
+
+
+def bench_dispatch(win: Window, repeat: int) -> Tuple[Result, Result]:
+    frame = win.add_widget(tk.Frame)
+    widgets = [frame.add_widget(tk.Label) for _ in range(100)]
+    hits = [0]
+
+    def handler(event: tk.Event):
+        hits[0] += 1
+    for w in widgets[:50]:
+        w.on("<<Bench>>")(handler)
+    group = ActionGroup(*widgets[50:])
+    group.on("<<Bench>>")(handler)
+    n = 2000
+
+    def run(targets: List[Any]):
+        def go():
+            start = time.perf_counter()
+            for i in range(n):
+                targets[i % len(targets)].base.event_generate("<<Bench>>", when="now")
+            return time.perf_counter() - start
+        return go
+    result = (
+        timed("us/event", runs(run(widgets[:50]), repeat), 1e6 / n),
+        timed("us/event", runs(run(widgets[50:]), repeat), 1e6 / n),
+    )
+    assert hits[0] == 2 * n * repeat, "events were not dispatched"
+    frame.destroy()
+    win._sub_widget.remove(frame)
+    return result
+
+
+def bench_memory(win: Window) -> Result:
+    n = 1000
+    frame = win.add_widget(tk.Frame)
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    frame.load_sub(tree(n))
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    frame.destroy()
+    win._sub_widget.remove(frame)
+    return case("bytes/widget", (after - before) / n, relative=False)
+
+
+def run(quick: bool, repeat: int) -> Dict[str, Any]:
+    win = Window(tk.Tk())
+    win.base.withdraw()
+    results: Dict[str, Result] = {}
+    for n in (100, 1000) if quick else (100, 1000, 10000):
+        results[f"build_{n}"], results[f"teardown_{n}"] = bench_build(win, n, repeat)
+    results["apply"] = bench_apply(win, repeat)
+    results["rerender_same"], results["rerender_changed"] = bench_rerender(win, repeat)
+    results["property_write"], results["property_read"] = bench_properties(win, repeat)
+    results["dispatch_bind"], results["dispatch_group"] = bench_dispatch(win, repeat)
+    results["memory_per_widget"] = bench_memory(win)
+    win.destroy()
+    return {
+        "python": platform.python_version(),
+        "tk": str(tk.TkVersion),
+        "platform": platform.platform(),
+        "reference": reference(repeat),
+        "results": results,
+    }
+
+
+def compare(
+    results: Dict[str, Any], baseline: Dict[str, Any], tolerance: float, floor: float = 0.0
+) -> List[str]:
+    """
+    Names of the cases of `results` regressing from `baseline`.
+
+    Relative results are first scaled by the ratio of the reference runs of
+    both, when both have one. A case regresses when it is worse than its
+    scaled baseline by more than the largest of: `tolerance` times the
+    baseline, `floor` (in the unit of the case), and twice the noise of
+    either run.
+    """
+    speed = 1.0
+    if results.get("reference") and baseline.get("reference"):
+        speed = results["reference"]["value"] / baseline["reference"]["value"]
+        print(f"{'reference':20} {speed:6.2f}x")
+    regressions = []
+    for name, base in baseline["results"].items():
+        result = results["results"].get(name)
+        if result is None:
+            continue
+        scale = speed if base.get("relative", True) and result.get("relative", True) else 1.0
+        expected = base["value"] * scale
+        noise = max(base.get("noise", 0.0) * scale, result.get("noise", 0.0))
+        slack = max(expected * tolerance, floor, 2 * noise)
+        worse = result["value"] - expected
+        if base.get("better", "lower") == "higher":
+            worse = -worse
+        ratio = result["value"] / expected if expected else 1.0
+        mark = "REGRESSION" if worse > slack else ""
+        print(f"{name:20} {expected:12.2f} -> {result['value']:12.2f} "
+              f"{result['unit']:12} {ratio:6.2f}x {mark}")
+        if mark:
+            regressions.append(name)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--quick", action="store_true", help="skip the 10k widget trees")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per case, the best is kept")
+    parser.add_argument("--out", help="write the results to this JSON file")
+    parser.add_argument("--save", help="write the results as a new baseline")
+    parser.add_argument("--baseline", help="compare with this baseline")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="slowdown ratio allowed")
+    parser.add_argument(
+        "--floor", type=float, default=0.0, help="slowdown allowed, in the unit of each case"
+    )
+    args = parser.parse_args()
+
+    server = start_display()
+    try:
+        results = run(args.quick, args.repeat)
+    finally:
+        if server is not None:
+            server.terminate()
+    text = json.dumps(results, indent=2)
+    for path in (args.out, args.save):
+        if path:
+            with open(path, "w") as f:
+                f.write(text + "\n")
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(results, json.load(f), args.tolerance, args.floor)
+        if regressions:
+            sys.exit(f"{len(regressions)} regression(s): {', '.join(regressions)}")
+    elif not (args.out or args.save):
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,22 @@
+import tkinter as tk
+
+import pytest
+
+# test.py and test_declarative.py open demo windows:
+# run them by hand, with a display
+collect_ignore = ["test.py", "test_declarative.py"]
+
+
+@pytest.fixture
+def root():
+    """A withdrawn Tk root, or the test is skipped without a display."""
+    try:
+        r = tk.Tk()
+    except tk.TclError:
+        pytest.skip("no display")
+    r.withdraw()
+    yield r
+    try:
+        r.destroy()
+    except tk.TclError:  # destroyed by the test
+        pass
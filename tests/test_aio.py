@@ -0,0 +1,88 @@
+import asyncio
+import selectors
+import socket
+import tkinter as tk
+
+import pytest
+
+from tkreform import aio
+
+pytestmark = pytest.mark.skipif(not aio.HAS_FILEHANDLER, reason="no Tk file handlers")
+
+
+def test_socket_readable():
+    r = tk.Tcl()
+
+    async def main():
+        a, b = socket.socketpair()
+        reader, writer = await asyncio.open_connection(sock=a)
+        b.sendall(b"hello\n")
+        line = await reader.readline()
+        writer.close()
+        b.close()
+        return line
+    assert aio.run(main(), r) == b"hello\n"
+
+
+def test_call_later_order():
+    r = tk.Tcl()
+
+    async def main():
+        loop = asyncio.get_running_loop()
+        got = []
+        done = loop.create_future()
+        loop.call_later(0.03, got.append, 3)
+        loop.call_later(0.01, got.append, 1)
+        loop.call_soon(got.append, 0)
+        loop.call_later(0.02, got.append, 2)
+        loop.call_later(0.04, done.set_result, None)
+        await done
+        return got
+    assert aio.run(main(), r) == [0, 1, 2, 3]
+
+
+def test_tcl_events_run_meanwhile():
+    r = tk.Tcl()
+    r.after(10, r.setvar, "ticked", 1)
+
+    async def main():
+        await asyncio.sleep(0.05)
+        return r.getvar("ticked")
+    assert aio.run(main(), r) == 1
+
+
+def test_selector_keys():
+    r = tk.Tcl()
+    sel = aio.TkSelector(r.tk)
+    a, b = socket.socketpair()
+    try:
+        key = sel.register(a, selectors.EVENT_READ, "data")
+        assert sel.get_key(a) is key and sel.get_key(a.fileno()) is key
+        with pytest.raises(KeyError):
+            sel.register(a, selectors.EVENT_READ)
+        assert sel.select(0) == []
+        b.sendall(b"x")
+        assert sel.select(1) == [(key, selectors.EVENT_READ)]
+        key = sel.modify(a, selectors.EVENT_READ | selectors.EVENT_WRITE)
+        assert sel.get_key(a).events == selectors.EVENT_READ | selectors.EVENT_WRITE
+        sel.unregister(a)
+        with pytest.raises(KeyError):
+            sel.get_key(a)
+        sel.close()
+        with pytest.raises(RuntimeError):
+            sel.get_key(a)
+    finally:
+        a.close()
+        b.close()
+
+
+def test_async_loop_returns_with_its_window(root):
+    from tkreform import Window
+
+    top = Window(tk.Toplevel(root))
+
+    async def main():
+        asyncio.get_running_loop().call_later(0.05, top.destroy)
+        await top.async_loop()
+        return root.winfo_exists()
+    assert Window(root).run_async(main())
@@ -0,0 +1,60 @@
+import tkinter as tk
+
+from tkreform import Window
+from tkreform.batch import Batch
+
+
+class Target:
+    """Stand-in for a window / widget with pending writes."""
+    def __init__(self, flushed):
+        self.flushed = flushed
+        self._writes = {}
+
+    def _flush_writes(self):
+        self.flushed.append(self)
+
+
+def test_one_batch_per_interpreter():
+    r = tk.Tcl()
+    outer = Batch(r).start()
+    inner = Batch(r).start()
+    assert Batch.of(r) is outer
+    inner.stop()
+    assert Batch.of(r) is outer
+    outer.stop()
+    assert Batch.of(r) is None
+
+
+def test_flush_at_the_end():
+    r = tk.Tcl()
+    flushed = []
+    a, b = Target(flushed), Target(flushed)
+    with Batch(r) as batch:
+        batch.record(a)
+        batch.record(b)
+        assert not flushed
+    assert flushed == [a, b] and batch.flushes == 1
+
+
+def test_flush_when_idle():
+    r = tk.Tcl()
+    flushed = []
+    batch = Batch(r, idle=True).start()
+    batch.record(Target(flushed))
+    batch.record(Target(flushed))
+    assert not flushed
+    r.update_idletasks()
+    assert len(flushed) == 2 and batch.flushes == 1
+    batch.stop()
+
+
+def test_writes_coalesced(root):
+    win = Window(root)
+    label = win.add_widget(tk.Label, text="")
+    with win.batch() as batch:
+        label.text = "a"
+        label.text = "b"
+        assert label.text == "b"
+        assert label.base.cget("text") == ""
+    assert label.base.cget("text") == "b"
+    assert (batch.writes, batch.flushes) == (2, 1)
@@ -0,0 +1,55 @@
+import threading
+import time
+
+from tkreform import Window
+
+
+def run_until(root, done, timeout=5):
+    end = time.time() + timeout
+    while not done() and time.time() < end:
+        root.update()
+
+
+def test_calls_from_a_thread_in_order(root):
+    win = Window(root)
+    win.calls.start()
+    got = []
+
+    def worker():
+        for i in range(1000):
+            win.call_soon_threadsafe(got.append, i)
+    t = threading.Thread(target=worker)
+    t.start()
+    run_until(root, lambda: len(got) == 1000)
+    t.join()
+    assert got == list(range(1000))
+
+
+def test_post_result(root):
+    win = Window(root)
+    win.calls.start()
+    fut = win.post(threading.current_thread)
+    run_until(root, fut.done)
+    assert fut.result() is threading.main_thread()
+
+
+def test_budget(root):
+    win = Window(root)
+    win.calls.budget = 0
+    got = []
+    for i in range(3):
+        win.call_soon_threadsafe(got.append, i)
+    root.update()
+    assert got  # the first wake starts the queue
+    run_until(root, lambda: len(got) == 3)
+    assert got == [0, 1, 2]
+
+
+def test_closed_with_the_root(root):
+    win = Window(root)
+    calls = win.calls
+    calls.start()
+    root.destroy()
+    assert calls._closed and calls._pipe is None
+    calls.put(print)
+    assert not len(calls)
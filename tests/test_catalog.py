@@ -0,0 +1,75 @@
+import pytest
+
+from tkreform.catalog import MappedMessages, compile_catalog, load_catalogs, main
+from tkreform.exceptions import MessageNotFound
+from tkreform.linguist import KVPairLinguist
+
+
+@pytest.fixture
+def catalogs(tmp_path):
+    for lang, words in (("en_US", ("Exit", "Open")), ("zh_CN", ("退出", "打开")),
+                        ("de_DE", ("Beenden", "Öffnen")), ("fr_FR", ("Quitter", "Ouvrir"))):
+        messages = {f"k.{i}": f"{lang} {i}" for i in range(2000)}
+        messages.update({"button.exit": words[0], "button.open": words[1]})
+        compile_catalog(messages, str(tmp_path / f"{lang}.tkc"))
+    return load_catalogs(str(tmp_path))
+
+
+def test_lookup(catalogs):
+    zh = catalogs["zh_CN"]
+    assert not zh.loaded
+    assert zh["button.exit"] == "退出"
+    assert zh.loaded
+    # every entry is found through the hash index, collisions included
+    assert all(zh[f"k.{i}"] == f"zh_CN {i}" for i in range(2000))
+    assert zh.get("nope") is None
+    # misses leave nothing behind
+    decoded = len(zh._decoded)
+    for i in range(1000):
+        assert zh.get(f"nope.{i}") is None
+    assert len(zh._decoded) == decoded
+    assert len(zh) == 2002
+
+
+def test_key_of(catalogs):
+    de = catalogs["de_DE"]
+    assert de.key_of("Öffnen") == "button.open"
+    assert de.key_of("de_DE 1999") == "k.1999"
+    assert de.key_of("Exit") is None
+
+
+def test_patch(catalogs):
+    en = catalogs["en_US"]
+    en["button.exit"] = "Quit"
+    en["button.new"] = "New"
+    assert en["button.exit"] == "Quit"
+    assert en.key_of("Quit") == "button.exit"
+    assert en.key_of("Exit") is None
+    assert en.key_of("New") == "button.new"
+    assert "button.new" in set(en)
+
+
+def test_bad_file(tmp_path):
+    path = tmp_path / "bad.tkc"
+    path.write_bytes(b"nope" + bytes(32))
+    with pytest.raises(ValueError):
+        MappedMessages(str(path))["x"]
+
+
+def test_cli(tmp_path):
+    source = tmp_path / "en.json"
+    source.write_text('{"a": "b"}', encoding="utf-8")
+    main([str(source), str(tmp_path / "en.tkc")])
+    assert MappedMessages(str(tmp_path / "en.tkc"))["a"] == "b"
+
+
+def test_linguist_opens_only_the_chain(catalogs):
+    lin = KVPairLinguist("zh_CN", ("en_US", ), **catalogs)
+    with pytest.raises(MessageNotFound):
+        lin.translate("42")
+    assert lin.translate("Exit") == "退出"
+    assert lin.translate("button.open") == "打开"
+    assert {k for k, c in catalogs.items() if c.loaded} == {"zh_CN", "en_US"}
+    lin.language = "de_DE"
+    assert lin.translate("Exit") == "Beenden"
+    assert not catalogs["fr_FR"].loaded
@@ -0,0 +1,73 @@
+import threading
+import time
+import tkinter as tk
+
+from tkreform import Window
+
+
+def run_until(root, done, timeout=5):
+    end = time.time() + timeout
+    while not done() and time.time() < end:
+        root.update()
+        time.sleep(0.001)
+
+
+def test_progress_then_result(root):
+    win = Window(root)
+    got = []
+
+    def work(x, progress):
+        for i in range(3):
+            progress(i)
+        return x * 2
+    job = win.run_in_executor(
+        work, 21, on_done=lambda r: got.append(("done", r)),
+        on_progress=lambda v: got.append(("progress", v))
+    )
+    run_until(root, lambda: ("done", 42) in got)
+    assert got == [("progress", 0), ("progress", 1), ("progress", 2), ("done", 42)]
+    assert job.done and not job.cancelled
+
+
+def test_error(root):
+    win = Window(root)
+    errors = []
+
+    def fail():
+        raise KeyError("boom")
+    win.run_in_executor(fail, on_error=errors.append)
+    run_until(root, lambda: errors)
+    assert isinstance(errors[0], KeyError)
+
+
+def test_cancel(root):
+    win = Window(root)
+    got = []
+    started = threading.Event()
+
+    def work(progress):
+        started.set()
+        while not progress.cancelled:
+            time.sleep(0.001)
+        return "late"
+    job = win.run_in_executor(work, on_done=got.append, on_progress=got.append)
+    started.wait(5)
+    job.cancel()
+    run_until(root, lambda: job.done)
+    root.after(20)
+    root.update()
+    assert job.cancelled and got == []
+
+
+def test_owner_destroyed_before_delivery(root):
+    win = Window(root)
+    owner = win.add_widget(tk.Frame)
+    release = threading.Event()
+    got = []
+    job = win.run_in_executor(release.wait, 5, on_done=got.append, owner=owner)
+    owner.destroy()
+    release.set()
+    run_until(root, lambda: job.done)
+    root.after(20)
+    root.update()
+    assert job.cancelled and got == []
@@ -0,0 +1,38 @@
+import tkinter as tk
+
+from tkreform import Window
+from tkreform.groups import ActionGroup
+
+
+def test_group_tag_first(root):
+    win = Window(root)
+    a, b = win.add_widget(tk.Frame), win.add_widget(tk.Frame)
+    group = ActionGroup(a, b)
+    assert a.base.bindtags()[:2] == (group._tag, str(a.base))
+    group.remove(b)
+    assert group._tag not in b.base.bindtags()
+
+
+def test_break_keeps_group_handlers(root):
+    win = Window(root)
+    a = win.add_widget(tk.Frame)
+    seen = []
+    a.base.bind("<<Ping>>", lambda e: (seen.append("own"), "break")[1])
+    group = ActionGroup(a)
+    group.on("<<Ping>>")(lambda e: seen.append("group"))
+    a.base.event_generate("<<Ping>>")
+    assert seen == ["group", "own"]
+
+
+def test_recreated_widget_joins_again(root):
+    win = Window(root)
+    old = win.add_widget(tk.Label, name="member")
+    group = ActionGroup(old)
+    got = []
+    group.on("<<Ping>>")(lambda e: got.append(e.widget))
+    old.destroy()
+    new = win.add_widget(tk.Label, name="member")
+    group.add(new)
+    assert new.base.bindtags()[0] == group._tag
+    new.base.event_generate("<<Ping>>")
+    assert got == [new.base]
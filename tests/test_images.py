@@ -0,0 +1,44 @@
+from tkreform.images import ImageCache
+
+
+class Image:
+    # stand-in for a PhotoImage: 10 x 10 pixels, 400 bytes
+    def width(self):
+        return 10
+
+    def height(self):
+        return 10
+
+
+def key(name):
+    return (name, None, None, None)
+
+
+def test_add_holds_a_reference():
+    cache = ImageCache(budget=0)
+    k, image = cache.add(key("a"), Image())
+    # larger than the budget, but in use
+    assert key("a") in cache and cache.misses == 1 and cache.hits == 0
+    cache.release(k)
+    assert key("a") not in cache and cache.evictions == 1
+
+
+def test_add_of_a_cached_image():
+    cache = ImageCache()
+    _, first = cache.add(key("a"), Image())
+    _, second = cache.add(key("a"), Image())
+    assert second is first
+    assert (cache.misses, cache.hits, cache.size, cache.bytes) == (1, 1, 1, 400)
+
+
+def test_lru_budget():
+    cache = ImageCache(budget=800)
+    keys = [cache.add(key(n), Image())[0] for n in "abc"]
+    for k in keys:
+        cache.release(k)
+    # the least recently released is dropped first
+    assert key("a") not in cache and key("b") in cache and key("c") in cache
+    cache.add(key("b"), Image())
+    cache.clear()
+    assert key("b") in cache and key("c") not in cache
+    assert cache.bytes == 400
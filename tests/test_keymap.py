@@ -0,0 +1,110 @@
+from types import SimpleNamespace
+
+import pytest
+
+from tkreform.events import CTRL, FN, SHIFT
+from tkreform.keymap import _CONTROL, _SHIFT, Keymap, stroke
+
+
+class FakeWindow:
+    """Stand-in for a window: keeps its binding and `after` jobs."""
+    def __init__(self):
+        self.bound = None
+        self.jobs = []
+
+    def __str__(self):
+        return "."
+
+    def bind(self, seq, fn, add=None):
+        self.bound = (seq, fn)
+
+    def after(self, ms, fn, *args):
+        self.jobs.append((ms, fn, args))
+
+
+def press(keys, keysym, state=0, widget="."):
+    return keys._dispatch(SimpleNamespace(keysym=keysym, state=state, widget=widget))
+
+
+def test_stroke():
+    assert stroke(CTRL + "s") == (_CONTROL, "s")
+    assert stroke(CTRL + SHIFT + "S") == (_CONTROL | _SHIFT, "s")
+    assert stroke(FN(5)) == (0, "F5")
+    assert stroke("Escape") == (0, "Escape")
+
+
+def test_one_binding():
+    win = FakeWindow()
+    keys = Keymap(win)
+    assert win.bound[0] == "<KeyPress>"
+    got = []
+    keys.bind(CTRL + "s")(got.append)
+    assert press(keys, "s", _CONTROL) == "break"
+    assert press(keys, "s") is None
+    assert press(keys, "Control_L", _CONTROL) is None  # modifier alone
+    assert len(got) == 1 and (keys.hits, keys.misses) == (1, 1)
+
+
+def test_chord_trie():
+    win = FakeWindow()
+    keys = Keymap(win, timeout=500)
+    got = []
+    keys.bind(CTRL + "k", CTRL + "s")(lambda e: got.append("all"))
+    keys.bind(CTRL + "k", CTRL + "c")(lambda e: got.append("comment"))
+    assert press(keys, "k", _CONTROL) == "break" and not got
+    press(keys, "c", _CONTROL)
+    assert got == ["comment"]
+    # the chord is over: the second stroke alone does nothing
+    assert press(keys, "s", _CONTROL) is None
+    with pytest.raises(ValueError):
+        keys.bind(CTRL + "k")(print)  # prefix of a chord
+    with pytest.raises(ValueError):
+        keys.bind(CTRL + "k", CTRL + "s", "x")(print)  # extends a shortcut
+
+
+def test_chord_timeout():
+    win = FakeWindow()
+    keys = Keymap(win, timeout=500)
+    got = []
+    keys.bind(CTRL + "k", CTRL + "s")(got.append)
+    press(keys, "k", _CONTROL)
+    ms, expire, args = win.jobs.pop()
+    assert ms == 500
+    expire(*args)
+    press(keys, "s", _CONTROL)
+    assert not got
+
+
+def test_scopes():
+    win = FakeWindow()
+    keys = Keymap(win)
+    got = []
+    keys.bind(CTRL + "f")(lambda e: got.append("window"))
+    keys.bind(CTRL + "f", scope=".editor")(lambda e: got.append("editor"))
+    press(keys, "f", _CONTROL, ".editor.text")
+    press(keys, "f", _CONTROL, ".sidebar")
+    assert got == ["editor", "window"]
+    keys.clear(".editor")
+    press(keys, "f", _CONTROL, ".editor.text")
+    assert got[-1] == "window"
+
+
+def test_shift_picking_a_symbol():
+    win = FakeWindow()
+    keys = Keymap(win)
+    got = []
+    keys.bind(CTRL + "plus")(got.append)
+    press(keys, "plus", _CONTROL | _SHIFT)
+    assert len(got) == 1
+
+
+def test_rebind_and_unbind():
+    win = FakeWindow()
+    keys = Keymap(win)
+    got = []
+    keys.bind(CTRL + "s")(lambda e: got.append(1))
+    keys.bind(CTRL + "s")(lambda e: got.append(2))
+    press(keys, "s", _CONTROL)
+    keys.unbind(CTRL + "s")
+    press(keys, "s", _CONTROL)
+    assert got == [2]
@@ -0,0 +1,36 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+
+def loaded(statement):
+    """Modules loaded by a statement run in a fresh interpreter."""
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    out = subprocess.run(
+        [sys.executable, "-c", f"import sys\n{statement}\nprint(' '.join(sys.modules))"],
+        env=env, stdout=subprocess.PIPE, universal_newlines=True, check=True
+    ).stdout
+    return set(out.split())
+
+
+def test_import_alone_is_light():
+    modules = loaded("import tkreform")
+    assert not {"tkinter", "typing", "asyncio", "tkreform.base"} & modules
+
+
+def test_names_load_on_access():
+    modules = loaded("import tkreform\ntkreform.Gridder")
+    assert "tkreform.declarative" in modules and "tkreform.groups" not in modules
+
+
+def test_access():
+    import tkreform
+    from tkreform import base, declarative
+    assert tkreform.Window is base.Window and tkreform.dec is declarative
+    assert set(tkreform.__all__) <= set(dir(tkreform))
+    with pytest.raises(AttributeError):
+        tkreform.nothing
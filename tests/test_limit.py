@@ -0,0 +1,128 @@
+import itertools
+import tkinter as tk
+from types import SimpleNamespace
+
+import pytest
+
+from tkreform import limit
+from tkreform.limit import Limiter
+
+
+class FakeWidget:
+    """Stand-in for a widget: `after` jobs run on a fake clock."""
+    def __init__(self):
+        self.now = 0.0
+        self.jobs = {}
+        self.delays = []
+        self.bindings = {}
+        self._ids = itertools.count()
+
+    def after(self, ms, fn):
+        id = f"after#{next(self._ids)}"
+        self.jobs[id] = (self.now + ms / 1000, fn)
+        self.delays.append(ms)
+        return id
+
+    def after_idle(self, fn):
+        return self.after(0, fn)
+
+    def after_cancel(self, id):
+        del self.jobs[id]
+
+    def bind(self, seq, fn, add=None):
+        self.bindings.setdefault(seq, []).append(fn)
+
+    def advance(self, seconds):
+        end = self.now + seconds
+        while True:
+            due = [(t, id) for id, (t, _) in self.jobs.items() if t <= end]
+            if not due:
+                break
+            t, id = min(due)
+            self.now = max(self.now, t)
+            self.jobs.pop(id)[1]()
+        self.now = end
+
+
+@pytest.fixture
+def widget(monkeypatch):
+    w = FakeWidget()
+    monkeypatch.setattr(limit, "time", SimpleNamespace(perf_counter=lambda: w.now))
+    return w
+
+
+def burst(widget, limiter, count, every):
+    for i in range(count):
+        limiter(i)
+        widget.advance(every)
+
+
+def test_throttle(widget):
+    got = []
+    limiter = Limiter(widget, got.append, throttle=20)
+    burst(widget, limiter, 20, 0.005)  # 100 ms
+    widget.advance(0.1)
+    assert got[0] == 0 and got[-1] == 19
+    assert len(got) == 6 and limiter.dropped == 14
+
+
+def test_debounce(widget):
+    got = []
+    limiter = Limiter(widget, got.append, debounce=20)
+    burst(widget, limiter, 20, 0.005)
+    assert got == []
+    widget.advance(0.02)
+    assert got == [19] and limiter.handled == 1 and limiter.dropped == 19
+
+
+def test_coalesce(widget):
+    got = []
+    limiter = Limiter(widget, got.append, coalesce="idle")
+    for i in range(10):
+        limiter(i)
+    widget.advance(0)
+    assert got == [9] and limiter.received == 10
+
+
+def test_delays_are_rounded_up(widget):
+    limiter = Limiter(widget, lambda e: None, throttle=20)
+    limiter(0)
+    widget.advance(0.0195)
+    limiter(1)
+    # 0.5 ms left: never scheduled before the deadline
+    assert widget.delays == [1]
+
+
+def test_cancel(widget):
+    got = []
+    limiter = Limiter(widget, got.append, debounce=20)
+    limiter(0)
+    limiter.cancel()
+    assert widget.jobs == {} and widget.bindings == {}
+    widget.advance(1)
+    assert got == [] and limiter.dropped == 1
+
+
+def test_destroy_cancels(root):
+    from tkreform import Window
+
+    win = Window(root)
+    label = win.add_widget(tk.Label)
+    got = []
+    label.on("<<Tick>>", debounce=50)(got.append)
+    label.on("<<Tick>>", debounce=50)(got.append)  # replaces the first one
+    label.on("<<Tock>>", throttle=50)(got.append)
+    label.base.event_generate("<<Tick>>")
+    assert len(label.limiters["<<Tick>>"]) == 1
+    destroy_tags = [t for t in label.base.bindtags() if t.startswith("tkreform_destroy")]
+    assert len(destroy_tags) == 1
+    label.destroy()
+    assert label.limiters["<<Tick>>"][0]._job is None
+    root.after(100)
+    root.update()
+    assert got == []
+
+
+def test_exactly_one_mode(widget):
+    with pytest.raises(ValueError):
+        Limiter(widget, print, throttle=10, debounce=10)
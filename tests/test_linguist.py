@@ -1,9 +1,11 @@
 import tkinter as tk
+
+import pytest
+
 from tkreform import Window
 from tkreform.declarative import W, Gridder, Packer
 from tkreform import linguist
-
-win = Window(tk.Tk())
+from tkreform.exceptions import MessageNotFound
 
 en_US = linguist.Messages(
     {
@@ -25,28 +27,122 @@ zh_CN = linguist.Messages(
     }
 )
 
-lin = linguist.KVPairLinguist("en_US", ("en_US", ), en_US=en_US, zh_CN=zh_CN)
-win.linguist = lin
-
-win.title = "Window Title"
-win.size = 600, 400
-win.resizable = False
-win.top = True
-
-win /= (
-    W(tk.Label, bg="gray", width=25, height=40) * Gridder(),
-    W(tk.Frame, width=350, height=400) * Gridder(column=1, row=0, sticky="nw") / (
-        W(tk.Frame, width=350, height=350) * Gridder() / (
-            W(tk.Label, text="Title", font=("Microsoft Yahei UI", 20)) * Gridder(padx=5, pady=5, sticky="nw"),
-            W(tk.Message, text="abcd\nefgh", font=("Microsoft Yahei UI", 12), width=380) * Gridder(row=1, padx=5, pady=5, sticky="nw")
-        ),
-        W(tk.Frame, width=350, height=50) * Gridder(row=1, sticky="se", padx=5, pady=5) / (
-            W(tk.Button, text="Exit", font=("Microsoft Yahei UI", )) * Packer(side="right"),
-            W(tk.Button, text="Continue", font=("Microsoft Yahei UI", )) * Packer(side="right")
+
+def make():
+    return linguist.KVPairLinguist(
+        "en_US", ("en_US", ), en_US=linguist.Messages(en_US), zh_CN=linguist.Messages(zh_CN)
+    )
+
+
+def test_reverse_lookup():
+    lin = make()
+    assert lin.key_of("button.exit") == "button.exit"
+    assert lin.key_of("Exit") == "button.exit"
+    assert lin.key_of("继续") == "button.continue"
+    assert lin.translate("退出") == "Exit"
+    lin.language = "zh_CN"
+    assert lin.translate("Exit") == "退出"
+    assert lin.translate("win.title") == "窗口标题"
+
+
+def test_misses_are_not_kept():
+    lin = make()
+    for i in range(10000):
+        assert lin.key_of(str(i)) is None
+    with pytest.raises(MessageNotFound):
+        lin.translate("42")
+    assert len(lin._sources) == 0
+
+
+def test_patch():
+    lin = make()
+    assert lin.key_of("Exit") == "button.exit"
+    lin.patch("en_US", "button.exit", "Quit")
+    assert lin.translate("button.exit") == "Quit"
+    assert lin.key_of("Quit") == "button.exit"
+    assert lin.key_of("Exit") is None
+    assert lin.key_of("退出") == "button.exit"
+    lin.patch("de_DE", "button.exit", "Beenden")
+    assert lin.key_of("Beenden") == "button.exit"
+
+
+@pytest.mark.parametrize("change", [
+    lambda m: m.__setitem__("new", "Neu"),
+    lambda m: m.update(new="Neu"),
+    lambda m: m.setdefault("new", "Neu"),
+    lambda m: m.__ior__({"new": "Neu"}),
+])
+def test_messages_index_follows_additions(change):
+    m = linguist.Messages(en_US)
+    assert m.key_of("Neu") is None
+    change(m)
+    assert m.key_of("Neu") == "new"
+
+
+@pytest.mark.parametrize("change", [
+    lambda m: m.__delitem__("button.exit"),
+    lambda m: m.pop("button.exit"),
+    lambda m: m.clear(),
+    lambda m: [m.popitem() for _ in range(len(m))],
+])
+def test_messages_index_follows_removals(change):
+    m = linguist.Messages(en_US)
+    assert m.key_of("Exit") == "button.exit"
+    change(m)
+    assert m.key_of("Exit") is None
+
+
+def test_reconciled_text_is_retranslated(root):
+    win = Window(root)
+    lin = make()
+    win.linguist = lin
+    win.reconciling = True
+    win /= (W(tk.Label, text="Exit") @ "b" * Packer(), )
+    label = win[0].base
+    win /= (W(tk.Label, text="Continue") @ "b" * Packer(), )
+    assert win[0].base is label and label.cget("text") == "Continue"
+    lin.language = "zh_CN"
+    assert label.cget("text") == "继续"
+
+
+def test_reconciled_text_is_batched(root):
+    win = Window(root)
+    win.reconciling = True
+    win /= (W(tk.Label, text="a") @ "b" * Packer(), )
+    with win.batch():
+        win /= (W(tk.Label, text="b") @ "b" * Packer(), )
+        assert win[0].base.cget("text") == "a"
+    assert win[0].base.cget("text") == "b"
+
+
+def demo():
+    win = Window(tk.Tk())
+    lin = linguist.KVPairLinguist("en_US", ("en_US", ), en_US=en_US, zh_CN=zh_CN)
+    win.linguist = lin
+
+    win.title = "Window Title"
+    win.size = 600, 400
+    win.resizable = False
+    win.top = True
+
+    win /= (
+        W(tk.Label, bg="gray", width=25, height=40) * Gridder(),
+        W(tk.Frame, width=350, height=400) * Gridder(column=1, row=0, sticky="nw") / (
+            W(tk.Frame, width=350, height=350) * Gridder() / (
+                W(tk.Label, text="Title", font=("Microsoft Yahei UI", 20)) * Gridder(padx=5, pady=5, sticky="nw"),
+                W(tk.Message, text="abcd\nefgh", font=("Microsoft Yahei UI", 12), width=380) * Gridder(row=1, padx=5, pady=5, sticky="nw")
+            ),
+            W(tk.Frame, width=350, height=50) * Gridder(row=1, sticky="se", padx=5, pady=5) / (
+                W(tk.Button, text="Exit", font=("Microsoft Yahei UI", )) * Packer(side="right"),
+                W(tk.Button, text="Continue", font=("Microsoft Yahei UI", )) * Packer(side="right")
+            )
         )
     )
-)
 
-win[1][1][0].callback(win.destroy)  # type: ignore
+    win[1][1][0].callback(win.destroy)  # type: ignore
+
+    win.loop()
+
 
-win.loop()
\ No newline at end of file
+if __name__ == "__main__":
+    demo()
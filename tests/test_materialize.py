@@ -0,0 +1,66 @@
+import tkinter as tk
+from tkinter import ttk
+
+from tkreform import Window
+from tkreform.declarative import Lazy, NotebookAdder, Packer, W, compile
+
+
+def built(w):
+    return len(w.base.children)
+
+
+def test_lazy_built_on_demand(root):
+    win = Window(root)
+    win /= (W(tk.Frame) / Lazy((W(tk.Label, text="a"), W(tk.Label, text="b"))), )
+    frame, = win
+    assert built(frame) == 0 and frame._pending is not None
+    frame.materialize()
+    assert built(frame) == 2 and frame._pending is None
+    frame.materialize()  # only once
+    assert built(frame) == 2
+
+
+def test_lazy_built_when_mapped(root):
+    root.deiconify()
+    win = Window(root)
+    win /= (W(tk.Frame) * Packer() / Lazy((W(tk.Label, text="a") * Packer(), )), )
+    frame, = win
+    assert built(frame) == 0
+    root.update()
+    assert built(frame) == 1
+
+
+def test_lazy_stamped(root):
+    win = Window(root)
+    frame, = compile((W(tk.Frame) / Lazy((W(tk.Label, text="a"), )), )).stamp(win)
+    assert built(frame) == 0
+    frame.materialize()
+    assert built(frame) == 1
+
+
+def tabs(root, prebuild=False):
+    book = Window(root).add_widget(ttk.Notebook)
+    book /= tuple(
+        W(ttk.Frame) * NotebookAdder(text=str(i), lazy=True, prebuild=prebuild)
+        / (W(ttk.Label, text=str(i)), )
+        for i in range(4)
+    )
+    return book
+
+
+def test_tabs_built_when_selected(root):
+    book = tabs(root)
+    root.update()
+    assert [built(t) for t in book] == [1, 0, 0, 0]
+    book.base.select(2)
+    root.update()
+    assert [built(t) for t in book] == [1, 0, 1, 0]
+
+
+def test_tabs_prebuilt(root):
+    book = tabs(root, prebuild=True)
+    root.update()
+    assert [built(t) for t in book] == [1, 1, 0, 0]
+    book.base.select(2)
+    root.update()
+    assert [built(t) for t in book] == [1, 1, 1, 1]
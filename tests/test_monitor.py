@@ -0,0 +1,79 @@
+import time
+import tkinter as tk
+
+from tkreform.monitor import Histogram, Monitor
+from tkreform.trace import unwrap
+
+
+def test_histogram_percentiles():
+    h = Histogram()
+    for ms in range(1, 101):
+        h.add(ms)
+    assert len(h) == h.count == 100
+    assert 50 <= h.percentile(50) <= 50 * 10 ** (1 / 8)
+    assert h.percentile(100) == 100
+    assert Histogram().percentile(50) == 0.0
+
+
+def test_histogram_window():
+    h = Histogram(window=10)
+    for _ in range(100):
+        h.add(1000)
+    for _ in range(10):
+        h.add(1)
+    assert h.count == 110 and len(h) == 10
+    assert h.percentile(99) <= 10 ** (1 / 8)
+    data = h.dump()
+    assert data["count"] == 110 and data["max"] == 1 and sum(data["bins"].values()) == 10
+
+
+def slow():
+    time.sleep(0.04)
+
+
+def test_callbacks_timed():
+    r = tk.Tcl()
+    real = r.tk
+    stalls = []
+    with Monitor(r, budgets=(10, 1000), on_stall=stalls.append) as m:
+        assert unwrap(r.tk) is real and r.tk is not real
+        r.after(0, slow)
+        r.update()
+    assert r.tk is real
+    assert m.by_name["slow"][0] == 1 and m.durations.count == 1
+    stall, = stalls
+    assert stall.name == "slow" and stall.duration >= 40 and stall.budget == 10
+    assert any("slow" in line for line in stall.stack)
+
+
+def test_only_the_monitored_interpreter():
+    call = tk.CallWrapper.__call__
+    r, other = tk.Tcl(), tk.Tcl()
+    with Monitor(r) as m:
+        assert tk.CallWrapper.__call__ is call
+        other.after(0, slow)
+        other.update()
+        assert m.durations.count == 0
+
+
+def test_callbacks_after_stop_run_untimed():
+    r = tk.Tcl()
+    got = []
+    m = Monitor(r).start()
+    r.after(10, got.append, 1)
+    m.stop()
+    time.sleep(0.02)
+    r.update()
+    assert got == [1] and m.durations.count == 0
+
+
+def test_replaced():
+    r = tk.Tcl()
+    first = Monitor(r).start()
+    second = Monitor(r).start()
+    assert not first.running and second.running
+    r.after(0, slow)
+    r.update()
+    second.stop()
+    assert (first.durations.count, second.durations.count) == (0, 1)
+    assert r.tk is unwrap(r.tk)
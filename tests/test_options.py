@@ -0,0 +1,30 @@
+import tkinter as tk
+
+from tkreform import Window
+
+
+def test_writes_through_the_cache(root):
+    label = Window(root).add_widget(tk.Label, text="a")
+    label.cache_options({"text": "a"})
+    label.text = "b"
+    label.width = 5
+    assert label.options.invalidations == 0
+    assert label.text == "b" and label.options.hits == 1
+
+
+def test_other_writes_drop_the_values(root):
+    label = Window(root).add_widget(tk.Label, text="a")
+    label.cache_options({"text": "a"})
+    label.base.configure(text="b")
+    assert label.options.invalidations == 1 and label.text == "b"
+    root.tk.eval(f"{label.base} configure -text c")
+    assert label.text == "c"
+
+
+def test_text_of_a_linked_variable(root):
+    var = tk.StringVar(root, "a")
+    label = Window(root).add_widget(tk.Label, textvariable=var)
+    label.cache_options({"textvariable": var})
+    assert label.text == "a"
+    var.set("b")
+    assert label.text == "b"
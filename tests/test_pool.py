@@ -0,0 +1,54 @@
+import tkinter as tk
+
+from tkreform import Window
+from tkreform.declarative import W
+from tkreform.pool import WidgetPool
+
+
+def labels(n):
+    return tuple(W(tk.Label, text=str(i)) for i in range(n))
+
+
+def test_reuse(root):
+    win = Window(root)
+    win.pool = WidgetPool(cap=4)
+    win /= labels(3)
+    made = {str(c.base) for c in win}
+    win /= labels(2)
+    assert {str(c.base) for c in win} <= made
+    assert win.pool.hits == 2 and win.pool.size == 1
+
+
+def test_parent_destroyed_outside_the_pool(root):
+    win = Window(root)
+    win.pool = WidgetPool(cap=4)
+    frame = win.add_widget(tk.Frame, name="box")
+    frame /= labels(3)
+    frame /= ()
+    assert win.pool.size == 3
+    frame.base.destroy()  # not through the pool
+    frame = win.add_widget(tk.Frame, name="box")  # the same path
+    frame /= labels(1)
+    assert frame[0].base.winfo_exists()
+    assert win.pool.size == 0 and win.pool.hits == 0
+
+
+def test_reused_widget_leaves_its_group(root):
+    from tkreform.groups import ActionGroup
+
+    win = Window(root)
+    win.pool = WidgetPool(cap=4)
+    win /= labels(1)
+    old = win[0]
+    group = ActionGroup(old)
+    got = []
+    group.on("<<Ping>>")(got.append)
+    old.on("<<Ping>>", debounce=10)(got.append)
+    win /= labels(1)
+    new = win[0]
+    assert new.base is old.base and win.pool.hits == 1
+    assert new.base.bindtags() == (str(new.base), "Label", ".", "all")
+    new.base.event_generate("<<Ping>>")
+    root.after(50)
+    root.update()
+    assert got == []
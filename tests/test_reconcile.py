@@ -0,0 +1,74 @@
+import tkinter as tk
+
+from tkreform import Window
+from tkreform.declarative import Packer, Param, W, compile
+
+
+def rows(keys):
+    return tuple(W(tk.Label, text=k) @ k * Packer(side="top") for k in keys)
+
+
+def test_nodes_not_kept_without_reconciling(root):
+    win = Window(root)
+    win /= rows("abc")
+    assert win._nodes is None
+    assert all(c._node is None and c._nodes is None for c in win)
+
+
+def test_keyed_reconcile_keeps_widgets(root):
+    win = Window(root)
+    win.reconciling = True
+    win /= rows("abc")
+    made = {c._node.key: c.base for c in win}
+
+    win /= rows("cab")  # reorder
+    assert [c._node.key for c in win] == list("cab")
+    assert all(c.base is made[c._node.key] for c in win)
+    assert [str(w) for w in root.pack_slaves()] == [str(made[k]) for k in "cab"]
+
+    win /= rows("cxab")  # insert
+    assert [c.base is made.get(c._node.key) for c in win] == [True, False, True, True]
+
+    win /= rows("cb")  # delete
+    assert [c._node.key for c in win] == list("cb")
+    assert all(c.base is made[c._node.key] for c in win)
+    assert not made["a"].winfo_exists()
+
+
+def test_nested_reconcile_keeps_widgets(root):
+    win = Window(root)
+    win.reconciling = True
+    win /= (W(tk.Frame) @ "f" * Packer() / rows("ab"), )
+    frame = win[0]
+    made = {c._node.key: c.base for c in frame}
+    win /= (W(tk.Frame) @ "f" * Packer() / rows("ba"), )
+    assert win[0] is frame
+    assert [c.base is made[c._node.key] for c in frame] == [True, True]
+
+
+def test_stamped_widgets_are_reconciled(root):
+    template = compile((W(tk.Label, text=Param("text")) @ "t" * Packer(padx=Param("padx", 0)), ))
+    win = Window(root)
+    win.reconciling = True
+    label = template.stamp(win, text="hi", padx=3)[0]
+    assert label._node.kwargs == {"text": "hi"} and label._node.controller.padx == 3
+    win /= (W(tk.Label, text="hi") @ "t" * Packer(padx=3), )
+    assert win[0] is label
+
+
+def test_inline_callbacks_do_not_leak_commands(root):
+    win = Window(root)
+    win.reconciling = True
+    got = []
+
+    def render(i):
+        win.__truediv__((W(tk.Button, command=lambda: got.append(i)) @ "b" * Packer(), ))
+    render(0)
+    button = win[0].base
+    commands = len(root.tk.splitlist(root.tk.call("info", "commands")))
+    for i in range(1, 20):
+        render(i)
+    assert len(root.tk.splitlist(root.tk.call("info", "commands"))) == commands
+    assert win[0].base is button
+    button.invoke()
+    assert got == [19]
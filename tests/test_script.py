@@ -0,0 +1,81 @@
+import tkinter as tk
+
+import pytest
+
+from tkreform.exceptions import ScriptReadError
+from tkreform.script import TclScript, _word
+
+
+@pytest.fixture
+def interp():
+    # an interpreter without Tk, with a stand-in widget class command
+    r = tk.Tcl()
+    r.tk.eval("proc label {path args} {lappend ::made $path; return $path}")
+    return r
+
+
+@pytest.mark.parametrize("value", [
+    "plain", "", "two words", "[error boom]", "$undefined", "a;b", "#x",
+    "{", "}", "{}", "a\\", "back\\slash {", 'say "hi"', "line\nbreak\ttab",
+    ("a b", "[c]"), 3, 1.5,
+])
+def test_words_are_not_substituted(interp, value):
+    result = interp.tk.eval("set v " + _word(value))
+    if isinstance(value, tuple):
+        assert interp.tk.splitlist(result) == value
+    else:
+        assert result == str(value)
+
+
+def test_reads_raise(interp):
+    script = TclScript(interp.tk)
+    for read in ((".l", "cget", "-text"), (".l", "configure", "-text"), ("winfo", "exists", ".l")):
+        with pytest.raises(ScriptReadError):
+            script.call(*read)
+    script.call(".l", "configure", "-text", "x")
+    script.call("label", ".l", "-text", "x")
+    assert script.calls == 2
+
+
+def test_flush(interp):
+    script = TclScript(interp.tk, chunk=2)
+    for i in range(5):
+        script.call("label", f".l{i}", "-text", f"{i}\n[x]")
+    script.flush()
+    assert interp.tk.splitlist(interp.tk.getvar("made")) == tuple(f".l{i}" for i in range(5))
+    assert script.evals == 3
+
+
+def test_errors_name_the_call(interp):
+    script = TclScript(interp.tk, chunk=3)
+    script.call("label", ".a", "-text", "one\ntwo")
+    script.call("label", ".b")
+    script.call("label", ".c")
+    script.call("label", ".d", "-text", "three\nfour")
+    script.call(".missing", "configure", "-text", "x")
+    with pytest.raises(tk.TclError, match=r"recorded call 4: \.missing configure"):
+        script.flush()
+
+
+def test_after_is_not_recorded(interp):
+    script = TclScript(interp.tk)
+    id = script.call("after", "idle", "set ::ran 1")
+    assert id.startswith("after#") and not script.commands
+    interp.update_idletasks()
+    assert interp.tk.getvar("ran") == "1"
+
+
+def test_lazy_tabs(root):
+    from tkinter import ttk
+
+    from tkreform import Window
+    from tkreform.declarative import NotebookAdder, W
+
+    win = Window(root)
+    book = win.add_widget(ttk.Notebook)
+    book.load_script(tuple(
+        W(ttk.Frame) * NotebookAdder(text=str(i), lazy=True) / (W(ttk.Label, text=str(i)), )
+        for i in range(3)
+    ))
+    root.update()
+    assert [len(tab.base.children) for tab in book] == [1, 0, 0]
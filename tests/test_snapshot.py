@@ -0,0 +1,60 @@
+import tkinter as tk
+
+import pytest
+
+from tkreform.snapshot import record, snapshot
+from tkreform.trace import Tracer
+
+
+@pytest.fixture
+def interp():
+    # an interpreter without Tk, with a stand-in `winfo` over a fixed tree
+    r = tk.Tcl()
+    r.tk.eval("""
+        array set ::children {. {.a .b} .a {.a.x} .a.x {} .b {}}
+        proc winfo {field w} {
+            switch $field {
+                children {return $::children($w)}
+                width {return [string length $w]}
+                ismapped {return [expr {$w ne ".b"}]}
+                class {return Frame}
+            }
+        }
+    """)
+    return r
+
+
+def test_fields(interp):
+    rec, = snapshot(interp, ("width", "ismapped", "class"))
+    assert rec == (".", 1, True, "Frame")
+    assert rec.class_ == "Frame" and type(rec) is record(("width", "ismapped", "class"))
+
+
+def test_subtree_depth_first(interp):
+    recs = snapshot(interp, ("width", "ismapped"), subtree=True)
+    assert [r.path for r in recs] == [".", ".a", ".a.x", ".b"]
+    assert [r.ismapped for r in recs] == [True, True, True, False]
+
+
+def test_one_evaluation(interp):
+    snapshot(interp, ("width", ))  # defines the procedure
+    with Tracer(interp) as tracer:
+        snapshot(interp, ("width", ), subtree=True)
+    assert sum(count for count, _ in tracer.calls.values()) == 1
+
+
+def test_unknown_field(interp):
+    with pytest.raises(ValueError, match="nope"):
+        snapshot(interp, ("width", "nope"))
+
+
+def test_window(root):
+    from tkreform import Window
+
+    win = Window(root)
+    frame = win.add_widget(tk.Frame, width=40, height=30)
+    frame.pack()
+    root.update()
+    rec, = frame.snapshot("reqwidth", "reqheight", "manager")
+    assert (rec.path, rec.reqwidth, rec.reqheight, rec.manager) == (str(frame.base), 40, 30, "pack")
+    assert [r.path for r in win.snapshot(subtree=True)] == [".", str(frame.base)]
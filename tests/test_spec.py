@@ -0,0 +1,100 @@
+import tkinter as tk
+from tkinter import ttk
+
+import pytest
+
+from tkreform.declarative import (
+    Gridder, Lazy, M, NotebookAdder, Packer, Param, W, compile, dumps, load, loads, register,
+    registry
+)
+from tkreform.exceptions import SpecError
+from tkreform.menu import MenuCascade, MenuCommand
+
+TREE = (
+    W(tk.Frame) @ "main" * Gridder(row=0, sticky="nw") / (
+        W(tk.Label, text=Param("title"), font=("Segoe UI", 20)) * Packer(side="left"),
+        W(ttk.Entry, width=Param("width", 20)) * Packer(side="right", padx=4),
+        W(ttk.Notebook) * Packer() / (
+            W(tk.Frame) * NotebookAdder(text="A", lazy=True) / Lazy((
+                W(tk.Label, text="x") * Packer(side="right"),
+            )),
+        ),
+    ),
+    W(tk.Menu) / (
+        M(MenuCascade(label="File"), tearoff=False) / (MenuCommand(label="New"), ),
+    ),
+)
+
+
+@pytest.fixture
+def spec(tmp_path):
+    path = tmp_path / "layout.json"
+    path.write_text(dumps(TREE), encoding="utf-8")
+    return str(path)
+
+
+def test_round_trip():
+    assert dumps(loads(dumps(TREE))) == dumps(TREE)
+
+
+def test_cache_round_trip(spec, tmp_path):
+    cache = str(tmp_path / "cache")
+    first = load(spec, cache)
+    second = load(spec, cache)  # from the cache
+    assert len(list((tmp_path / "cache").iterdir())) == 1
+    assert dumps(first) == dumps(second) == dumps(TREE)
+    frame = second[0]
+    assert frame.key == "main" and frame.controller == Gridder(row=0, sticky="nw")
+    assert isinstance(frame.sub[2].sub[0].sub, Lazy)
+    assert frame.sub[1].kwargs["width"] == Param("width", 20)
+
+
+def test_required_param_survives_cache(spec, tmp_path):
+    cache = str(tmp_path / "cache")
+    for _ in range(2):
+        tree = load(spec, cache)
+        assert tree[0].sub[0].kwargs["text"].default is Param._required
+        with pytest.raises(TypeError, match="title"):
+            compile(tree).stamp(None)  # type: ignore
+
+
+def test_damaged_cache_is_parsed_again(spec, tmp_path):
+    cache = tmp_path / "cache"
+    load(spec, str(cache))
+    for f in cache.iterdir():
+        f.write_bytes(b"garbage")
+    assert dumps(load(spec, str(cache))) == dumps(TREE)
+
+
+@pytest.mark.parametrize("text, error", [
+    ('{"tkreform": 1, "tree": [{"widget": "Nope"}]}', "unknown widget class"),
+    ('{"tkreform": 1, "tree": [{"widget": "Frame", "pack": {"sid": 1}}]}', "tree\\[0\\].pack"),
+    ('{"tkreform": 2, "tree": []}', "spec version"),
+    ('{"tkreform": 1, "tree": [{"widget": "Frame", "children": [{"bogus": 1}]}]}',
+     "tree\\[0\\].children\\[0\\]: unknown field"),
+    ('{"tkreform": 1, "tree": [{"widget": "Frame", "key": [1]}]}', "tree\\[0\\]: key must be"),
+    ('{"tkreform": 1, "tree": [{"widget": "Frame", "key": true}]}', "key must be"),
+    ('{"tkreform": 1, "tree": [{"widget": "Frame", "key": {"$param": "k"}}]}', "key must be"),
+    ("{x", "invalid JSON"),
+])
+def test_invalid(text, error):
+    with pytest.raises(SpecError, match=error):
+        loads(text)
+
+
+def test_key_not_serializable():
+    with pytest.raises(SpecError, match="cannot be serialized"):
+        dumps((W(tk.Frame) @ ("a", 1), ))
+
+
+def test_registry():
+    @register
+    class Card(tk.Frame):
+        pass
+    try:
+        assert loads('{"tkreform": 1, "tree": [{"widget": "Card"}]}')[0].widget is Card
+        assert '"Card"' in dumps((W(Card), ))
+    finally:
+        del registry["Card"]
+    with pytest.raises(SpecError, match="not registered"):
+        dumps((W(Card), ))
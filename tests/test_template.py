@@ -0,0 +1,76 @@
+import tkinter as tk
+
+import pytest
+
+from tkreform.declarative import Gridder, Packer, Param, Template, W, compile
+
+
+class FakeBase:
+    """Stand-in for a Tk widget, keeping its options and geometry calls."""
+    def __init__(self, **options):
+        self.options = options
+        self.geometry = []
+
+    def pack(self, **kw):
+        self.geometry.append(("pack", kw))
+
+    def grid(self, **kw):
+        self.geometry.append(("grid", kw))
+
+
+class FakeWidget:
+    """Stand-in for a `Widget`, creating fake children."""
+    def __init__(self, cls=tk.Frame, **options):
+        self.cls = cls
+        self.base = FakeBase(**options)
+        self.children = []
+
+    def add_widget(self, cls, **options):
+        child = FakeWidget(cls, **options)
+        self.children.append(child)
+        return child
+
+
+def row():
+    return (
+        W(tk.Frame) * Packer(fill="x") / (
+            W(tk.Label, text=Param("name")) * Gridder(row=Param("at"), column=0),
+            W(tk.Button, text="Edit", command=Param("edit", None)) * Gridder(row=0, column=1),
+        ),
+    )
+
+
+def test_stamp():
+    tpl = Template(row())
+    assert set(tpl.params) == {"name", "at", "edit"}
+    parent = FakeWidget()
+    top = tpl.stamp(parent, name="Ada", at=3)
+    assert top == parent.children
+    frame, = top
+    (how, kw), = frame.base.geometry
+    assert how == "pack" and kw["fill"] == "x"
+    label, button = frame.children
+    assert (label.cls, label.base.options) == (tk.Label, {"text": "Ada"})
+    (how, kw), = label.base.geometry
+    assert how == "grid" and (kw["row"], kw["column"]) == (3, 0)
+    assert button.base.options == {"text": "Edit", "command": None}
+
+
+def test_stamps_are_independent():
+    tpl = Template(row())
+    parent = FakeWidget()
+    tpl.stamp(parent, name="a", at=0)
+    tpl.stamp(parent, name="b", at=1)
+    names = [f.children[0].base.options["text"] for f in parent.children]
+    assert names == ["a", "b"]
+
+
+def test_missing_param():
+    with pytest.raises(TypeError, match="name"):
+        Template(row()).stamp(FakeWidget(), at=0)
+
+
+def test_compile_caches_by_structure():
+    assert compile(row()) is compile(row())
+    other = (W(tk.Label, text=Param("name")), )
+    assert compile(other) is not compile(row())
@@ -0,0 +1,40 @@
+import tkinter as tk
+
+import pytest
+
+from tkreform.trace import Tracer, TracingTk, unwrap
+
+
+@pytest.fixture
+def interp():
+    # an interpreter without Tk: no display needed
+    return tk.Tcl()
+
+
+@pytest.mark.parametrize("order", [(0, 1), (1, 0)])
+def test_nested_tracers_restore_the_interpreter(interp, order):
+    real = interp.tk
+    tracers = [Tracer(interp).start(), Tracer(interp).start()]
+    assert isinstance(interp.tk, TracingTk) and interp.tk.tk is real
+    interp.tk.call("set", "x", 1)
+    assert [t.count for t in tracers] == [1, 1]
+    tracers[order[0]].stop()
+    assert isinstance(interp.tk, TracingTk)
+    assert Tracer.active is tracers[order[1]]
+    tracers[order[1]].stop()
+    assert interp.tk is real and Tracer.active is None
+
+
+def test_objects_created_while_tracing(interp):
+    real = interp.tk
+    with Tracer(interp) as tracer:
+        var = tk.StringVar(interp)
+        var.set("a")
+    assert tracer.count >= 1
+    # the variable keeps the stand-in, untimed now
+    assert unwrap(var._tk) is real
+    count = tracer.count
+    var.set("b")
+    assert var.get() == "b" and tracer.count == count
+    with Tracer(interp):
+        assert interp.tk is var._tk  # the same stand-in
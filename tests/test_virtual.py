@@ -0,0 +1,66 @@
+import tkinter as tk
+from types import SimpleNamespace
+
+from tkreform import Window
+from tkreform.declarative import W
+from tkreform.virtual import VirtualList
+
+
+def make(root, count=100):
+    bound = []
+
+    def bind(row, index):
+        bound.append(index)
+        row.text = str(index)
+    rows = VirtualList(Window(root), W(tk.Label), count, bind, row_height=20)
+    rows._resize(SimpleNamespace(height=100))
+    return rows, bound
+
+
+def test_pool_fills_viewport(root):
+    rows, bound = make(root)
+    assert len(rows._rows) == 7
+    assert bound == list(range(7))
+    assert [r.base.cget("text") for r in rows._rows] == [str(i) for i in range(7)]
+
+
+def test_scroll_reuses_rows(root):
+    rows, bound = make(root)
+    pool = list(rows._rows)
+    ys = list(rows._ys)
+    sheet = rows._sheet_at
+    del bound[:]
+
+    rows.scroll_to(20)  # one row down
+    assert bound == [7]
+    assert rows._rows == pool
+    assert rows._rows[0].base.cget("text") == "7"
+    assert rows._sheet_at != sheet  # the sheet moved as a whole
+    assert rows._ys[1:] == ys[1:]  # other rows were not placed again
+
+    rows.scroll_to(25)  # within a row, nothing is rebound
+    assert bound == [7]
+
+
+def test_resize_grows_pool(root):
+    rows, bound = make(root)
+    pool = list(rows._rows)
+    rows._resize(SimpleNamespace(height=200))
+    assert len(rows._rows) == 12
+    assert rows._rows[:7] == pool
+    assert sorted(rows._bound) == list(range(12))
+
+    rows._resize(SimpleNamespace(height=60))  # the pool is not shrunk
+    assert len(rows._rows) == 12
+
+
+def test_count_clamps_offset(root):
+    rows, bound = make(root)
+    rows.scroll_to(10 ** 6)
+    assert rows._offset == 100 * 20 - 100
+    rows.count = 10
+    assert rows._offset == 100
+    assert all(i is None or i < 10 for i in rows._bound)
+    assert all(
+        (i is None) == (y is None) for i, y in zip(rows._bound, rows._ys)
+    )
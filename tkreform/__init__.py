@@ -22,11 +22,51 @@ Example (Hello, World):
 >>> window.loop()
 """
 
-from tkreform import base, declarative, groups
-from tkreform.base import dec, Widget, Window
-from tkreform.declarative import Gridder, Packer, Placer
+import sys
+
+# not imported from typing, which alone takes longer to import than tkreform
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Any, List
+
+    from tkreform import base, declarative, groups, linguist
+    from tkreform.base import dec, Widget, Window
+    from tkreform.declarative import Gridder, Packer, Placer
 
 __all__ = [
-    "base", "dec", "declarative", "groups", "Widget", "Window", "Gridder",
+    "base", "dec", "declarative", "groups", "linguist", "Widget", "Window", "Gridder",
     "Packer", "Placer"
 ]
+
+# Submodules and names are imported at their first access, so that importing
+# tkreform alone does not load tkinter, asyncio or the widget classes.
+_SUBMODULES = ("base", "declarative", "groups", "linguist")
+_NAMES = {
+    "dec": "tkreform.declarative",
+    "Widget": "tkreform.base",
+    "Window": "tkreform.base",
+    "Gridder": "tkreform.declarative",
+    "Packer": "tkreform.declarative",
+    "Placer": "tkreform.declarative",
+}
+
+
+def _load(module: str):
+    __import__(module)
+    return sys.modules[module]
+
+
+def __getattr__(name: str) -> "Any":
+    if name in _SUBMODULES:
+        value = _load(f"tkreform.{name}")
+    elif name in _NAMES:
+        module = _load(_NAMES[name])
+        value = module if name == "dec" else getattr(module, name)
+    else:
+        raise AttributeError(f"module 'tkreform' has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> "List[str]":
+    return sorted(set(globals()) | set(__all__))
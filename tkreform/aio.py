@@ -0,0 +1,203 @@
+"""
+TkReform asyncio integration.
+
+`TkEventLoop` is an asyncio event loop whose selector waits in the Tcl
+event loop: the file descriptors asyncio watches are registered as Tcl file
+handlers and its timeouts as Tcl timers, so that Tk events and asyncio I/O
+share one wait, and nothing polls while the application is idle.
+Coroutines run in the Tcl thread and may update widgets directly.
+
+Example:
+>>> async def main():
+...     reader, writer = await asyncio.open_connection(host, port)
+...     async for line in reader:
+...         label.text = line.decode()
+>>> window.run_async(main())  # or `await window.async_loop()` in `main`
+
+File handlers are not supported on Windows (`HAS_FILEHANDLER`): there,
+`run` uses a default asyncio event loop instead, and `Window.async_loop`
+falls back to updating the window periodically from it.
+"""
+
+import asyncio
+import os
+import selectors
+import tkinter as tk
+from typing import Any, Awaitable, Dict, Iterator, List, Mapping, Optional, Tuple, TypeVar
+
+from tkreform.calls import when_destroyed
+from tkreform.trace import unwrap
+
+_R = TypeVar("_R")
+
+_DONT_WAIT = 2  # TCL_DONT_WAIT
+# Tk events handled at most per select, so that asyncio is not starved
+_MAX_PENDING = 100
+_TO_TCL = {selectors.EVENT_READ: tk.READABLE, selectors.EVENT_WRITE: tk.WRITABLE}
+
+HAS_FILEHANDLER = os.name != "nt"
+"""Whether Tk has file handlers, which `TkSelector` waits with."""
+
+
+def _fd(fileobj: Any) -> int:
+    try:
+        fd = fileobj if isinstance(fileobj, int) else fileobj.fileno()
+    except (AttributeError, TypeError, ValueError):
+        raise ValueError(f"Invalid file object: {fileobj!r}") from None
+    if not isinstance(fd, int) or fd < 0:
+        raise ValueError(f"Invalid file object: {fileobj!r}")
+    return fd
+
+
+class _Keys(Mapping[int, selectors.SelectorKey]):
+    """Keys of a `TkSelector` by file object, as `BaseSelector.get_map`."""
+    def __init__(self, selector: "TkSelector") -> None:
+        self._selector = selector
+
+    def __len__(self) -> int:
+        return len(self._selector._keys)
+
+    def __getitem__(self, fileobj: Any) -> selectors.SelectorKey:
+        return self._selector._keys[_fd(fileobj)]
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._selector._keys)
+
+
+class TkSelector(selectors.BaseSelector):
+    """Selector waiting in the Tcl event loop."""
+    def __init__(self, tkapp: Any) -> None:
+        """
+        - tkapp: `_tkinter.tkapp` - the interpreter, `widget.tk`
+        """
+        if not HAS_FILEHANDLER:
+            raise RuntimeError(
+                "Tk has no file handlers on this platform: use `tkreform.aio.run`, "
+                "which falls back to a default event loop."
+            )
+        self._tk = tkapp
+        self._keys: Dict[int, selectors.SelectorKey] = {}
+        self._map: Optional[_Keys] = _Keys(self)
+        self._ready: Dict[int, int] = {}
+
+    def register(self, fileobj: Any, events: int, data: Any = None):
+        if not events or events & ~(selectors.EVENT_READ | selectors.EVENT_WRITE):
+            raise ValueError(f"Invalid events: {events!r}")
+        fd = _fd(fileobj)
+        if fd in self._keys:
+            raise KeyError(f"{fileobj!r} (FD {fd}) is already registered")
+        key = self._keys[fd] = selectors.SelectorKey(fileobj, fd, events, data)
+        mask = sum(m for e, m in _TO_TCL.items() if events & e)
+        self._tk.createfilehandler(fd, mask, self._handle)
+        return key
+
+    def unregister(self, fileobj: Any):
+        try:
+            key = self._keys.pop(_fd(fileobj))
+        except KeyError:
+            raise KeyError(f"{fileobj!r} is not registered") from None
+        self._tk.deletefilehandler(key.fd)
+        self._ready.pop(key.fd, None)
+        return key
+
+    def get_map(self):
+        return self._map
+
+    def _handle(self, fd: int, mask: int):
+        events = sum(e for e, m in _TO_TCL.items() if mask & m)
+        self._ready[fd] = self._ready.get(fd, 0) | events
+
+    def select(self, timeout: Optional[float] = None) -> List[Tuple[Any, int]]:
+        self._ready.clear()
+        if timeout is not None and timeout <= 0:
+            self._tk.dooneevent(_DONT_WAIT)
+        else:
+            timer = None
+            if timeout is not None:
+                timer = self._tk.createtimerhandler(max(1, int(timeout * 1000)), _nothing)
+            # wakes up for a Tk event, a file handler or the timer
+            self._tk.dooneevent(0)
+            if timer is not None:
+                timer.deletetimerhandler()
+        # run the Tk events that are pending as well, but return as soon as a
+        # file is ready: it stays ready until asyncio handles it
+        for _ in range(_MAX_PENDING):
+            if self._ready or not self._tk.dooneevent(_DONT_WAIT):
+                break
+        ready = []
+        for fd, events in self._ready.items():
+            key = self._keys.get(fd)
+            if key is not None and key.events & events:
+                ready.append((key, key.events & events))
+        return ready
+
+    def close(self):
+        for fd in self._keys:
+            self._tk.deletefilehandler(fd)
+        self._keys.clear()
+        self._map = None
+
+
+def _nothing():
+    pass
+
+
+class TkEventLoop(asyncio.SelectorEventLoop):  # type: ignore
+    """Asyncio event loop sharing its wait with the Tcl event loop."""
+    def __init__(self, widget: tk.Misc) -> None:
+        """
+        - widget: `WindowType | WidgetType` - any widget of the interpreter
+        """
+        self.tkapp = unwrap(widget.tk)
+        super().__init__(TkSelector(self.tkapp))
+
+
+def run(main: Awaitable[_R], widget: tk.Misc) -> _R:
+    """
+    Run a coroutine to completion in a `TkEventLoop`, like `asyncio.run`.
+    Without file handlers in Tk, a default event loop is used instead.
+
+    - main: `Awaitable` - the coroutine
+    - widget: `WindowType | WidgetType` - any widget of the interpreter
+
+    Returns: the result of the coroutine
+    """
+    loop = TkEventLoop(widget) if HAS_FILEHANDLER else asyncio.new_event_loop()
+    try:
+        asyncio.set_event_loop(loop)
+        return loop.run_until_complete(main)
+    finally:
+        try:
+            loop.run_until_complete(loop.shutdown_asyncgens())
+        finally:
+            asyncio.set_event_loop(None)
+            loop.close()
+
+
+async def mainloop(widget: tk.Misc, poll: float = 0.01):
+    """
+    Wait until the window is destroyed, while it keeps responding.
+
+    In a `TkEventLoop` of the same interpreter, this only waits; in another
+    loop, the window is updated every `poll` seconds.
+
+    - widget: `WindowType | WidgetType` - the window, or widget, to wait for
+    - poll: `float` - update interval, in seconds, in other event loops
+    """
+    loop = asyncio.get_running_loop()
+    done = loop.create_future()
+
+    def destroyed():
+        if not done.done():
+            done.set_result(None)
+
+    when_destroyed(widget, destroyed)
+    if isinstance(loop, TkEventLoop) and loop.tkapp is unwrap(widget.tk):
+        await done
+        return
+    while not done.done():
+        try:
+            widget.update()
+        except tk.TclError:  # destroyed meanwhile
+            break
+        await asyncio.sleep(poll)
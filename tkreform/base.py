@@ -1,39 +1,72 @@
 from abc import ABCMeta, abstractmethod
+from concurrent.futures import Executor, Future
+from functools import partial
+import re
 import sys
+import threading
 import tkinter as tk
 from tkinter import TclError, ttk
 
+from tkreform.batch import Batch
+from tkreform.calls import CallQueue, when_destroyed
 from tkreform.exceptions import MessageNotFound, WidgetNotArranged
+from tkreform.executor import Job, submit
+from tkreform.images import ImageKey, has_pil, images, loader
+from tkreform.keymap import Keymap
+from tkreform.limit import Limiter
+from tkreform.linguist import Linguist
 from tkreform.menu import MenuItem
+from tkreform.monitor import Monitor, Stall
+from tkreform.options import OptionCache
+from tkreform.script import TclScript
+from tkreform.snapshot import DEFAULT_FIELDS, snapshot
+from tkreform.trace import Tracer, label as trace_label, unwrap
 from . import declarative as dec
 from typing import (
-    Any, Callable, Generic, Iterable, List, Optional, Tuple, Type, TypeVar, Union, cast,
-    overload
+    TYPE_CHECKING, Any, Awaitable, Callable, Dict, Generic, Iterable, List, Optional, Set,
+    Tuple, Type, TypeVar, Union, cast, overload
 )
 
+if TYPE_CHECKING:
+    from tkinter import PhotoImage
+    from tkreform.pool import WidgetPool
+
 # use Literal type
 if sys.version_info >= (3, 8):
     from typing import Literal
 else:
     from typing_extensions import Literal
 
-# attempt to use PIL
-try:
-    from PIL.ImageTk import PhotoImage
-    HAS_PIL = True
-except ImportError:
-    from tkinter import PhotoImage
-    HAS_PIL = False
-
 WidgetType = Union[tk.Widget, ttk.Widget]
 WindowType = Union[tk.Tk, tk.Toplevel]
 
+
+def __getattr__(name: str) -> Any:
+    # PIL is only looked for when these are first used
+    if name == "HAS_PIL":
+        return has_pil()
+    if name == "PhotoImage":
+        if has_pil():
+            from PIL.ImageTk import PhotoImage
+            return PhotoImage
+        return tk.PhotoImage
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 _T = TypeVar("_T", bound=Union[WidgetType, WindowType])
+_R = TypeVar("_R")
 _WidgetT = TypeVar("_WidgetT", bound=WidgetType)
 _WindowT = TypeVar("_WindowT", bound=WindowType)
+# no sub widgets, until `_add_sub` creates the list
+_NO_WIDGETS = cast(List["Widget"], ())
 
 
 class _Base(Generic[_T], metaclass=ABCMeta):
+    __slots__ = (
+        "base", "reconciling", "pool", "caching", "_sub_widget", "_nodes", "_limiters",
+        "_limiting", "_writes", "options", "_linguist", "_raw", "_keys", "__weakref__"
+    )
+
     def __init__(self, base: _T) -> None:
         """
         Base type of Window / Widget.
@@ -41,7 +74,28 @@ class _Base(Generic[_T], metaclass=ABCMeta):
         - base: `WindowType | WidgetType` - base window / widget type
         """
         self.base = base
-        self._sub_widget: List["Widget"] = []
+        self.reconciling = False
+        """Whether `/` reconciles sub widgets instead of rebuilding them."""
+        self.pool: Optional["WidgetPool"] = None
+        """Pool reusing destroyed sub widgets, inherited by added widgets."""
+        self.caching = False
+        """Whether added widgets cache their option values, inherited by them."""
+        # most widgets have no sub widgets: the list is created with the first
+        # one, as the containers below are on first use
+        self._sub_widget: List["Widget"] = _NO_WIDGETS
+        # the nodes built from, kept only for reconciliation: while
+        # `reconciling` is on, and in the widgets built meanwhile
+        self._nodes: Optional[List[Union[dec.W, MenuItem]]] = None
+        self._limiters: Optional[Dict[str, List[Limiter]]] = None
+        # whether the limiters are cancelled when the window / widget is destroyed
+        self._limiting = False
+        # property writes pending in a batch
+        self._writes: Optional[Dict[str, Any]] = None
+        self.options: Optional[OptionCache] = None
+        self._linguist: Optional[Linguist] = None
+        # untranslated texts, and the message keys they were found as
+        self._raw: Optional[Dict[str, str]] = None
+        self._keys: Optional[Dict[str, str]] = None
 
     @overload
     def __getitem__(self, it: int) -> "Widget":
@@ -60,12 +114,25 @@ class _Base(Generic[_T], metaclass=ABCMeta):
     def __iter__(self):
         return iter(self._sub_widget)
 
-    def on(self, seq: str, append: bool = False):
+    def on(
+        self, seq: str, append: bool = False, throttle: Optional[int] = None,
+        debounce: Optional[int] = None, coalesce: Optional[Literal["idle"]] = None
+    ):
         """
         Register response function on event sequence.
 
         - seq: `str` - event sequence
         - append: `bool` - decide to override or append function to target
+        - throttle: `int | None` - run the function at most once every
+            `throttle` ms, with the latest event
+        - debounce: `int | None` - run the function once events stop for
+            `debounce` ms, with the latest event
+        - coalesce: `Literal["idle"] | None` - run the function once when
+            idle, with the latest event
+
+        With any of the last three, the `Limiter` counting received and
+        dropped events is kept in the list `limiters[seq]`, replaced unless
+        appending.
 
         Returns: `Wrapper(func: (Event) -> Any)`
 
@@ -76,10 +143,34 @@ class _Base(Generic[_T], metaclass=ABCMeta):
         ...     ...
         """
         def __wrapper(func: Callable[[tk.Event], Any]):
-            self.base.bind(seq, func, append)
+            handler: Callable[[tk.Event], Any] = func
+            if not append:
+                # their bindings are replaced
+                for old in self._limiters.pop(seq, ()) if self._limiters else ():
+                    old.cancel()
+            if throttle is not None or debounce is not None or coalesce is not None:
+                if not self._limiting:
+                    self._limiting = True
+                    when_destroyed(self.base, self._cancel_limiters)
+                limiter = Limiter(self.base, func, throttle, debounce, coalesce)
+                self.limiters.setdefault(seq, []).append(limiter)
+                handler = limiter
+            self.base.bind(seq, handler, append)
             return func
         return __wrapper
 
+    @property
+    def limiters(self) -> Dict[str, List[Limiter]]:
+        """The limiters of the bindings made by `on`, by event sequence."""
+        if self._limiters is None:
+            self._limiters = {}
+        return self._limiters
+
+    def _cancel_limiters(self):
+        for limiters in (self._limiters or {}).values():
+            for limiter in limiters:
+                limiter.cancel()
+
     def add_widget(self, sw: Type[_WidgetT], *args, **kwargs) -> "Widget[_WidgetT]":
         """
         Add a widget to window / widget.
@@ -89,56 +180,431 @@ class _Base(Generic[_T], metaclass=ABCMeta):
 
         Returns: `Widget`
         """
-        w = sw(self.base, *args, **kwargs)
+        raw = kwargs.get("text")
+        if self._linguist is not None and isinstance(raw, str):
+            kwargs["text"] = self._linguist_text(raw)
+        w = None
+        if self.pool is not None and not args:
+            w = self.pool.acquire(self.base, sw, kwargs)
+        if w is None:
+            w = sw(self.base, *args, **kwargs)
         cw = Widget(w)
-        self._sub_widget.append(cw)
+        if self.pool is not None:
+            cw.pool = self.pool
+        if self.caching:
+            cw.caching = True
+            cw.cache_options(kwargs)
+        cw._linguist = self._linguist
+        if isinstance(raw, str):
+            cw._translated("text", raw)
+        self._add_sub(cw)
         return cw
 
+    def _add_sub(self, w: "Widget"):
+        if not self._sub_widget:
+            self._sub_widget = []
+        self._sub_widget.append(w)
+
     def load_sub(self, sub: Iterable[Union[dec.W, MenuItem]]):
         """
         Load sub widgets recursively.
 
         - sub: `Iterable[dec.W]` - sub widget tree
         """
+        sub = tuple(sub)
+        if self._keeps_nodes:
+            if self._nodes is None:
+                self._nodes = []
+            self._nodes.extend(sub)
         for w in sub:
             if isinstance(w, MenuItem):
                 self.base.add(w.type, **w.data)  # type: ignore
             else:
-                _widget = self.add_widget(w.widget, **w.kwargs)
-                if isinstance(self.base, tk.Menu) and isinstance(w, dec.M):
-                    self.base.add(w.it.type, menu=_widget.base, **w.it.data)
-                elif isinstance(self.base, tk.PanedWindow):
-                    self.base.add(_widget.base)
-                elif isinstance(self.base, ttk.Notebook):
-                    w.controller = cast(dec.NotebookAdder, w.controller)
-                    self.base.add(
-                        _widget.base,
-                        **{k: getattr(w.controller, k) for k in w.controller.__dataclass_fields__}
-                    )
-                _widget.load_sub(w.sub)
-                if w.controller is not None:
-                    _widget.apply(w.controller)
+                self._load_node(w)
+
+    def load_script(self, sub: Iterable[Union[dec.W, MenuItem]], chunk: int = 1000):
+        """
+        Load sub widgets recursively, creating them through batched Tcl
+        scripts instead of one interpreter call per widget.
+
+        Only this window / widget and the new widgets record their calls,
+        which must not need a result (see `TclScript`).
+
+        - sub: `Iterable[dec.W]` - sub widget tree
+        - chunk: `int` - number of Tcl commands evaluated at most at once
+
+        Returns: `TclScript` - the recorder, for inspection
+        """
+        script = TclScript(self.base.tk, chunk)
+        before = set(self.base.children)
+        # new widgets take the recorder from their parent
+        self.base.tk = script
+        try:
+            self.load_sub(sub)
+        finally:
+            self.base.tk = script.tk
+            todo = [c for k, c in self.base.children.items() if k not in before]
+            while todo:
+                c = todo.pop()
+                c.tk = script.tk
+                todo.extend(c.children.values())
+        script.flush()
+        return script
+
+    def _load_node(self, w: dec.W) -> "Widget":
+        tracer = Tracer.active
+        if tracer is None:
+            return self._build_node(w)
+        tracer.enter(trace_label(w))
+        try:
+            return self._build_node(w)
+        finally:
+            tracer.leave()
+
+    @property
+    def _keeps_nodes(self) -> bool:
+        return self.reconciling or self._nodes is not None
+
+    def _build_node(self, w: dec.W) -> "Widget":
+        _widget = self.add_widget(w.widget, **w.kwargs)
+        if self._keeps_nodes:
+            _widget._node = w
+            _widget._nodes = []
+        if isinstance(self.base, tk.Menu) and isinstance(w, dec.M):
+            self.base.add(w.it.type, menu=_widget.base, **w.it.data)
+        elif isinstance(self.base, tk.PanedWindow):
+            self.base.add(_widget.base)
+        elif isinstance(self.base, ttk.Notebook):
+            w.controller = cast(dec.NotebookAdder, w.controller)
+            self.base.add(_widget.base, **dec._tab_options(w.controller))
+        if dec._is_lazy(w):
+            _widget._defer(
+                self, partial(_widget.load_sub, w.sub),
+                isinstance(w.controller, dec.NotebookAdder) and w.controller.prebuild
+            )
+        else:
+            _widget.load_sub(w.sub)
+        if w.controller is not None:
+            _widget.apply(w.controller)
+        return _widget
 
     def __truediv__(self, other: Iterable[Union[dec.W, MenuItem]]):
+        if self.reconciling:
+            return self.reconcile(other)
         for old in self._sub_widget:
             old.destroy()
         self._sub_widget = []
+        if self._nodes is not None:
+            self._nodes = []
         self.load_sub(other)
         return self
 
+    def reconcile(self, sub: Iterable[Union[dec.W, MenuItem]]):
+        """
+        Update sub widgets to match a new declarative tree.
+
+        Instead of destroying and rebuilding every sub widget, nodes are
+        matched against the live widgets by key (see `dec.W.__matmul__`) or
+        by position, and matching widgets of the same class are reused: only
+        changed options and geometry are reconfigured. Menus are compared as
+        a whole and rebuilt only if anything changed. Widgets built while
+        neither `reconciling` was on nor any reconciliation ran keep no
+        node to be matched with, and are rebuilt.
+
+        - sub: `Iterable[dec.W]` - sub widget tree
+
+        Usage:
+        >>> window.reconciling = True  # make `window /= (...)` reconcile
+        >>> window /= (W(tk.Label, text=str(n)) @ "counter" * Packer(), )
+        """
+        sub = tuple(sub)
+        if self._nodes is None:
+            self._nodes = []  # keep the nodes of the widgets built now
+        if isinstance(self.base, tk.Menu):
+            if _menu_signature(sub) != _menu_signature(self._nodes or ()):
+                self.base.delete(0, "end")
+                for old in self._sub_widget:
+                    old.destroy()
+                self._sub_widget = []
+                self._nodes = []
+                self.load_sub(sub)
+            self._nodes = list(sub)
+            return self
+        nodes = [w for w in sub if isinstance(w, dec.W)]
+        live = {}
+        for idx, child in enumerate(self._sub_widget):
+            if child._node is not None:
+                key = _node_key(child._node, idx)
+                live[key if key not in live else object()] = (idx, child)
+        plan: List[Tuple[dec.W, Optional[Tuple[int, Widget]]]] = []
+        for idx, w in enumerate(nodes):
+            found = live.pop(_node_key(w, idx), None)
+            if found is not None and not _reusable(found[1]._node, w):
+                live[object()] = found
+                found = None
+            plan.append((w, found))
+        for _, child in live.values():
+            child.destroy()
+        for child in self._sub_widget:
+            if child._node is None:
+                child.destroy()
+        # new widgets are attached at the end, and reused ones keep their
+        # place, so the stacking only has to be redone if that is not enough
+        restack, created, prev = False, False, -1
+        for _, found in plan:
+            if found is None:
+                created = True
+            else:
+                restack = restack or created or found[0] < prev
+                prev = found[0]
+        self._sub_widget = []
+        for w, found in plan:
+            if found is None:
+                self._load_node(w)
+            else:
+                self._sub_widget.append(found[1])
+                found[1]._update_node(self, w)
+        if restack:
+            self._restack()
+        self._nodes = list(sub)
+        return self
+
+    def _restack(self):
+        if isinstance(self.base, ttk.Notebook):
+            for child in self._sub_widget:
+                self.base.insert("end", child.base)
+        elif isinstance(self.base, tk.PanedWindow):
+            for child in self._sub_widget:
+                self.base.forget(child.base)
+                self.base.add(child.base)
+        packed = [
+            child for child in self._sub_widget
+            if isinstance(child._node.controller, dec.Packer)  # type: ignore
+        ]
+        for child in packed:
+            child.base.pack_forget()
+        for child in packed:
+            child.apply(child._node.controller)  # type: ignore
+
     def destroy(self):
         """Destroy window / widget."""
         self.base.destroy()
 
+    def snapshot(self, *fields: str, subtree: bool = False) -> List[Any]:
+        """
+        Query geometry and `winfo` fields in one Tcl evaluation.
+
+        - *fields: `str` - `winfo` fields, such as `"width"`, `"rootx"` or
+            `"ismapped"`, defaults to the size, root position, mapping and
+            requested size
+        - subtree: `bool` - whether to query every descendant as well, in
+            depth-first order
+
+        Returns: `list[Snapshot]`, records with the widget `path` and the
+            fields
+
+        Usage:
+        >>> for rec in window.snapshot("width", "ismapped", subtree=True):
+        ...     rec.path, rec.width, rec.ismapped
+        """
+        return snapshot(self.base, fields or DEFAULT_FIELDS, subtree)
+
+    def batch(self, idle: bool = False) -> Batch:
+        """
+        Coalesce property writes: while the batch is active, writes are
+        recorded, superseded values dropped, and each window / widget
+        configured in one call when the batch is flushed.
+
+        - idle: `bool` - keep the batch active and flush it whenever idle,
+            instead of using it as a context manager
+
+        Returns: `Batch`
+
+        Usage:
+        >>> with window.batch():
+        ...     label.text = "..."
+        ...     label.width = 20
+        """
+        b = Batch(self.base, idle)
+        return b.start() if idle else b
+
+    def cache_options(self, known: Optional[Dict[str, Any]] = None) -> OptionCache:
+        """
+        Cache the option values of the window / widget, so that reading its
+        properties doesn't query Tcl. Configuring it other than through
+        tkreform properties drops the cached values.
+
+        - known: `dict | None` - option values known already, such as the
+            ones it was created with
+
+        Returns: `OptionCache`, also kept in `options`
+        """
+        self.options = OptionCache.of(self.base, known or {})
+        return self.options
+
+    def _configure(self, **options: Any):
+        if self.options is None:
+            self.base.configure(**options)
+        else:
+            self.options.write(self.base, options)
+
+    def _set(self, **options: Any):
+        batch = Batch.of(self.base)
+        if batch is None:
+            self._configure(**options)
+            return
+        if not self._writes:
+            batch.record(self)
+            self._writes = {}
+        self._writes.update(options)
+        batch.writes += len(options)
+
+    def _get(self, option: str):
+        if self._writes and option in self._writes:
+            return self._writes[option]
+        if self.options is not None:
+            return self.options.get(option, self.base.cget)
+        return self.base[option]
+
+    def _flush_writes(self):
+        writes, self._writes = self._writes, None
+        if writes:
+            self._configure(**writes)
+
+    @property
+    def linguist(self) -> Optional[Linguist]:
+        """
+        The linguist translating texts of the window / widget and its sub
+        widgets, inherited by added widgets.
+        """
+        return self._linguist
+
+    @linguist.setter
+    def linguist(self, lin: Optional[Linguist]):
+        if self._linguist is not None and self._keys:
+            for option, key in self._keys.items():
+                self._linguist.detach(self, option, key)
+            self._keys = None
+        self._linguist = lin
+        for w in self._sub_widget:
+            w.linguist = lin
+        for option in self._raw or ():
+            self._retranslate(option)
+
+    def _linguist_text(self, raw: str) -> str:
+        try:
+            return cast(Linguist, self._linguist).translate(raw)
+        except MessageNotFound:
+            return raw
+
+    def _translated(self, option: str, raw: str) -> str:
+        # keep the raw text, and index it by message key
+        if self._raw is None:
+            self._raw = {}
+        self._raw[option] = raw
+        lin = self._linguist
+        if lin is None:
+            return raw
+        key = lin.key_of(raw)
+        old = self._keys.pop(option, None) if self._keys else None
+        if old is not None and old != key:
+            lin.detach(self, option, old)
+        if key is None:
+            return raw
+        if self._keys is None:
+            self._keys = {}
+        self._keys[option] = key
+        lin.attach(self, option, key)
+        try:
+            return lin.lookup(key)
+        except MessageNotFound:
+            return raw
+
+    def _untranslated(self, option: str):
+        # the option is no longer set from a text to translate
+        if self._raw:
+            self._raw.pop(option, None)
+        key = self._keys.pop(option, None) if self._keys else None
+        if key is not None and self._linguist is not None:
+            self._linguist.detach(self, option, key)
+
+    def _retranslate(self, option: str):
+        try:
+            self._show(option, self._translated(option, cast(Dict[str, str], self._raw)[option]))
+        except TclError:  # destroyed meanwhile
+            if self._linguist is not None and self._keys and option in self._keys:
+                self._linguist.detach(self, option, self._keys.pop(option))
+
+    def _show(self, option: str, text: str):
+        self._set(**{option: text})
+
     @abstractmethod
     def update_translation(self):
         raise NotImplementedError
 
 
+_MISSING = object()
+_GEOMETRY = re.compile(r"^(=?\d+x\d+)?([+-]-?\d+[+-]-?\d+)?$")
+_POSITION = object()
+
+# options that can only be given when a widget is created
+_CREATION_ONLY = ("name", "class_", "container", "colormap", "screen", "use", "visual")
+
+_MANAGERS = {dec.Gridder: "grid", dec.Packer: "pack", dec.Placer: "place"}
+
+
+_calls_lock = threading.Lock()
+
+
+def _calls_of(widget: tk.Misc, start: bool = False) -> CallQueue:
+    # one call queue per Tcl interpreter, shared by its windows / widgets;
+    # started right away in the Tcl thread, for other threads to wake it
+    root = widget._root()
+    calls = getattr(root, "_tkreform_calls", None)
+    if calls is None:
+        with _calls_lock:
+            calls = getattr(root, "_tkreform_calls", None)
+            if calls is None:
+                calls = root._tkreform_calls = CallQueue(root)  # type: ignore
+    if start:
+        calls.start()
+    return calls
+
+
+def _routed(route: List[Any]) -> Callable[..., Any]:
+    def call(*args: Any):
+        return route[0](*args)
+    return call
+
+
+def _node_key(w: dec.W, idx: int):
+    return w.key if w.key is not None else (_POSITION, idx)
+
+
+def _reusable(old: dec.W, new: dec.W):
+    return (
+        type(old) is type(new) and old.widget is new.widget
+        and all(old.kwargs.get(k, _MISSING) == new.kwargs.get(k, _MISSING) for k in _CREATION_ONLY)
+    )
+
+
+def _menu_signature(sub: Iterable[Union[dec.W, MenuItem]]) -> tuple:
+    return tuple(
+        (w.type, w.data) if isinstance(w, MenuItem) else (
+            w.widget, w.kwargs, w.controller, _menu_signature(w.sub),
+            (w.it.type, w.it.data) if isinstance(w, dec.M) else None
+        ) for w in sub
+    )
+
+
 class Widget(_Base, Generic[_WidgetT]):
     """
     Reformed Widget type based on `tkinter`.
     """
+    __slots__ = (
+        "_image_slot", "_node", "_pending", "_prebuild", "_watching_tabs", "_jobs",
+        "_image_key", "_image_job", "_watching_destroy", "_callbacks"
+    )
     base: _WidgetT
 
     def __init__(self, widget: _WidgetT) -> None:
@@ -146,6 +612,23 @@ class Widget(_Base, Generic[_WidgetT]):
         # reference to the image so that the image wouldn't be recycled by GC
         # at the moment the image adder finishes its work.
         self._image_slot = None
+        # the declarative node this widget was built from, if any
+        self._node: Optional[dec.W] = None
+        # builder of the sub widgets, while they are loaded lazily
+        self._pending: Optional[Callable[[], Any]] = None
+        self._prebuild = False
+        self._watching_tabs = False
+        # background jobs cancelled when the widget is destroyed, created
+        # with the first one
+        self._jobs: Optional[Set["Job"]] = None
+        # reference to the cached image, released when the widget is destroyed
+        self._image_key: Optional[ImageKey] = None
+        # pending image load: a decoding job, or an `after` id without PIL
+        self._image_job: Union[Job, str, None] = None
+        self._watching_destroy = False
+        # callable options replaced by reconciliation: their current
+        # function, and the Tcl command calling it
+        self._callbacks: Optional[Dict[str, List[Any]]] = None
         super().__init__(widget)
         self.base = widget
 
@@ -258,6 +741,9 @@ class Widget(_Base, Generic[_WidgetT]):
             )
         elif isinstance(geo, dec.MenuBinder):
             if geo.win is not None:
+                script = self.base.tk
+                if isinstance(script, TclScript) and geo.win.base.tk is not script:
+                    script.flush()  # the menu must exist first
                 geo.win.menu = self.base
         elif isinstance(geo, dec.NotebookAdder):
             ...
@@ -267,6 +753,150 @@ class Widget(_Base, Generic[_WidgetT]):
                 "packer or placer."
             )
 
+    def destroy(self):
+        """Destroy the widget, or keep it in the pool if there is one."""
+        self._release()
+        if self.pool is not None and self.pool.release(self):
+            return
+        self.base.destroy()
+
+    def _adopt(self, job: "Job"):
+        self._watch_destroy()
+        if self._jobs is None:
+            self._jobs = set()
+        self._jobs.add(job)
+        job.owner = self
+
+    def _watch_destroy(self):
+        if not self._watching_destroy:
+            self._watching_destroy = True
+            self.base.bind("<Destroy>", self._destroyed, "+")
+
+    def _destroyed(self, event: tk.Event):
+        if str(event.widget) == str(self.base):
+            self._release()
+
+    def _release(self):
+        # what the widget holds beyond its own lifetime
+        self._cancel_limiters()
+        self._cancel_image_job()
+        for job in list(self._jobs or ()):
+            job.cancel()
+        if self._image_key is not None:
+            key, self._image_key = self._image_key, None
+            images.release(key)
+
+    def forget(self, geo: Union[dec.Gridder, dec.Packer, dec.Placer, None] = None):
+        """
+        Unmap the widget from its geometry manager.
+
+        - geo: `dec.Gridder | dec.Packer | dec.Placer | None` - the
+            arrangement to undo, defaults to the current one
+        """
+        if geo is None:
+            manager = self.base.winfo_manager()
+        else:
+            manager = _MANAGERS.get(type(geo))
+        if manager == "grid":
+            self.base.grid_forget()
+        elif manager == "pack":
+            self.base.pack_forget()
+        elif manager == "place":
+            self.base.place_forget()
+
+    def _update_node(self, parent: _Base, w: dec.W):
+        old, self._node = cast(dec.W, self._node), w
+        options = {
+            k: v for k, v in w.kwargs.items() if old.kwargs.get(k, _MISSING) != v
+        }
+        for k in old.kwargs.keys() - w.kwargs.keys():
+            spec = self.base.configure(k.rstrip("_"))
+            if len(spec) == 2:  # alias such as "bg"
+                spec = self.base.configure(spec[1])
+            options[k] = spec[3]
+        if isinstance(options.get("text"), str) and "text" in w.kwargs:
+            options["text"] = self._translated("text", options["text"])
+        elif "text" in options:
+            self._untranslated("text")
+        stale = self._route_callbacks(old, options)
+        if stale:
+            # not batched: the commands must be unused before deletion
+            self._configure(**{k: options.pop(k) for k in stale})
+            for name in stale.values():
+                if name in (self.base._tclCommands or ()):  # registered by tkinter
+                    self.base.deletecommand(name)
+        if options:
+            self._set(**options)
+        if w.controller != old.controller:
+            if isinstance(parent.base, ttk.Notebook):
+                parent.base.tab(
+                    self.base, **dec._tab_options(cast(dec.NotebookAdder, w.controller))
+                )
+            else:
+                self.forget(old.controller)  # type: ignore
+                if w.controller is not None:
+                    self.apply(w.controller)
+        if self._pending is not None:
+            self._pending = partial(self.load_sub, w.sub)
+        else:
+            self.reconcile(w.sub)
+
+    def _route_callbacks(self, old: dec.W, options: Dict[str, Any]) -> Dict[str, str]:
+        # functions given inline differ on every render: a function replacing
+        # another one only changes what one Tcl command calls, instead of
+        # registering a command per render. Returns the Tcl commands to
+        # delete, by the option no longer using them.
+        stale = {}
+        for k, v in list(options.items()):
+            route = self._callbacks.get(k) if self._callbacks is not None else None
+            if not callable(v):
+                if route is not None:
+                    stale[k] = self._callbacks.pop(k)[1]  # type: ignore
+                continue
+            if route is not None:
+                route[0] = v
+                del options[k]
+            elif callable(old.kwargs.get(k)):
+                if self._callbacks is None:
+                    self._callbacks = {}
+                # the command registered when the widget was built
+                stale[k] = str(self.base.cget(k))
+                route = self._callbacks[k] = [v, ""]
+                route[1] = options[k] = self.base._register(_routed(route))
+        return stale
+
+    def _defer(self, parent: _Base, build: Callable[[], Any], prebuild: bool = False):
+        self._pending = build
+        self._prebuild = prebuild
+        if isinstance(parent, Widget) and isinstance(parent.base, ttk.Notebook):
+            parent._watch_tabs()
+        else:
+            self.base.bind("<Map>", lambda _: self.materialize(), "+")
+
+    def materialize(self):
+        """Build the sub widgets of a lazy container now, if not built yet."""
+        build, self._pending = self._pending, None
+        if build is not None and self.base.winfo_exists():
+            build()
+
+    def _watch_tabs(self):
+        if not self._watching_tabs:
+            self._watching_tabs = True
+            self.base.bind("<<NotebookTabChanged>>", self._tab_changed, "+")
+            # the tab selected at first may not be announced
+            self.base.after_idle(self._tab_changed)
+
+    def _tab_changed(self, event: Optional[tk.Event] = None):
+        try:
+            current = self.base.index("current")
+        except TclError:  # no tab, or destroyed meanwhile
+            return
+        for idx, child in enumerate(self._sub_widget):
+            if idx == current:
+                child.materialize()
+            elif abs(idx - current) == 1 and child._pending is not None and child._prebuild:
+                self.base.after_idle(child.materialize)
+
     def sync(self):
         if isinstance(self.base, tk.PanedWindow):
             for x in self._sub_widget:
@@ -281,50 +911,123 @@ class Widget(_Base, Generic[_WidgetT]):
         return self
 
     def update_translation(self):
-        # if not self._sub_widget and hasattr(self, "_raw_text"):
-        #     self.text = self._raw_text
-        pass
+        """Translate the texts of the widget and its sub widgets again."""
+        for option in self._raw or ():
+            self._retranslate(option)
+        for w in self._sub_widget:
+            w.update_translation()
 
     @property
     def text(self) -> str:
         """The text of the widget."""
-        return self.base["text"]
+        return self._get("text")
 
     @text.setter
     def text(self, txt: str):
-        try:
-            self.base["text"] = txt
-        except MessageNotFound:
-            pass
+        self._set(text=self._translated("text", txt))
 
     @property
-    def image(self) -> PhotoImage:  # type: ignore
+    def image(self) -> "PhotoImage":  # type: ignore
         """The image of the widget."""
-        return self.base["image"]
+        return self._get("image")
 
     @image.setter
-    def image(self, img: Union[str, PhotoImage]):  # type: ignore
-        _img = (PhotoImage(file=img) if isinstance(img, str) else img)
-        self._image_slot = _img
-        self.base["image"] = _img
+    def image(self, img: Union[str, "PhotoImage"]):  # type: ignore
+        self.set_image(img)
+
+    def set_image(
+        self, img: Union[str, "PhotoImage"], size: Optional[Tuple[int, int]] = None,  # type: ignore
+        mode: Optional[str] = None
+    ):
+        """
+        Set the image of the widget. Images given by path are taken from the
+        shared image cache.
+
+        - img: `str | PhotoImage` - image file, or image
+        - size: `tuple[int, int] | None` - resize the image file (requires
+            PIL)
+        - mode: `str | None` - convert the image file to a PIL mode (requires
+            PIL)
+        """
+        key = None
+        if isinstance(img, str):
+            key, img = images.acquire(img, self.base, size, mode)
+        self._use_image(key, img)
+
+    def _use_image(self, key: Optional[ImageKey], img: Any):
+        # show an image, holding the cache reference `key` if any
+        self._cancel_image_job()
+        if key is not None:
+            self._watch_destroy()
+        old, self._image_key = self._image_key, key
+        self._image_slot = img
+        self._set(image=img)
+        if old is not None:
+            images.release(old)
+
+    def _cancel_image_job(self):
+        job, self._image_job = self._image_job, None
+        if isinstance(job, str):
+            try:
+                self.base.after_cancel(job)
+            except TclError:  # the interpreter is gone
+                pass
+        elif job is not None:
+            job.cancel()
+
+    def load_image(
+        self, path: str, size: Optional[Tuple[int, int]] = None, mode: Optional[str] = None,
+        placeholder: Union[str, "PhotoImage", None] = None  # type: ignore
+    ) -> Optional[Job]:
+        """
+        Set the image of the widget to an image file decoded in a worker
+        thread (with PIL; otherwise, the image is set when idle).
+
+        Images of visible widgets are decoded first, and the load is
+        cancelled if the widget is destroyed or set another image meanwhile.
+
+        - path: `str` - image file
+        - size: `tuple[int, int] | None` - resize the image
+        - mode: `str | None` - convert the image to a PIL mode
+        - placeholder: `str | PhotoImage | None` - image shown meanwhile
+
+        Returns: `Job | None`, `None` if the image was cached already
+        """
+        if (path, size, mode, unwrap(self.base.tk)) in images:
+            self.set_image(path, size, mode)
+            return None
+        if placeholder is not None:
+            self.set_image(placeholder)
+        if not has_pil():
+            def idle():
+                self._image_job = None
+                self.set_image(path, size, mode)
+            self._cancel_image_job()
+            self._watch_destroy()
+            self._image_job = self.base.after_idle(idle)
+            return None
+        self._cancel_image_job()
+        job = loader.load(self, _calls_of(self.base, True), path, size, mode)
+        self._image_job = job
+        return job
 
     @property
     def width(self) -> int:
         """The width of the widget."""
-        return self.base["width"]
+        return self._get("width")
 
     @width.setter
     def width(self, w: int):
-        self.base["width"] = w
+        self._set(width=w)
 
     @property
     def height(self) -> int:
         """The height of the widget."""
-        return self.base["height"]
+        return self._get("height")
 
     @height.setter
     def height(self, h: int):
-        self.base["height"] = h
+        self._set(height=h)
 
     @property
     def size(self):
@@ -333,30 +1036,31 @@ class Widget(_Base, Generic[_WidgetT]):
 
     @size.setter
     def size(self, si: Tuple[int, int]):
-        self.width, self.height = si
+        self._set(width=si[0], height=si[1])
 
     @property
     def font(self) -> str:
         """The text font of the widget."""
-        return self.base["font"]
+        return self._get("font")
 
     @font.setter
     def font(self, fon: Union[str, Tuple[str, int], Tuple[str, int, str]]):
-        self.base["font"] = fon
+        self._set(font=fon)
 
     @property
     def disabled(self) -> bool:
-        return self.base["state"] == "disabled"
+        return self._get("state") == "disabled"
 
     @disabled.setter
     def disabled(self, st: bool):
-        self.base["state"] = "disabled" if st else "normal"
+        self._set(state="disabled" if st else "normal")
 
 
 class Window(_Base, Generic[_WindowT]):
     """
     Reformed Window type based on `tkinter`.
     """
+    __slots__ = ("executor", "_icon_keys", "_keymap")
     base: _WindowT
 
     def __init__(self, base: _WindowT) -> None:
@@ -366,14 +1070,172 @@ class Window(_Base, Generic[_WindowT]):
         - base: `tk.Tk | tk.Toplevel` - base window type
         """
         super().__init__(base)
-        self._raw_title = self.title
+        self._raw = {"title": self.title}
+        self.executor: Optional[Executor] = None
+        """Executor of `run_in_executor`, e.g. a `ProcessPoolExecutor`."""
+        # references to the cached icon images
+        self._icon_keys: List[ImageKey] = []
+        self._keymap: Optional[Keymap] = None
+
+    @property
+    def calls(self) -> CallQueue:
+        """Call queue of the Tcl interpreter, created on first use."""
+        return _calls_of(self.base)
+
+    def call_soon_threadsafe(self, fn: Callable[..., Any], *args: Any):
+        """
+        Call a function in the Tcl thread as soon as possible. Safe to use
+        from any thread.
+
+        - fn: `func: (*args) -> Any` - the function to call
+        - *args - its arguments
+        """
+        self.calls.put(fn, *args)
+
+    def post(self, fn: Callable[..., Any], *args: Any) -> "Future[Any]":
+        """
+        Call a function in the Tcl thread, and get its result as a future.
+        Safe to use from any thread.
+
+        - fn: `func: (*args) -> Any` - the function to call
+        - *args - its arguments
+
+        Returns: `concurrent.futures.Future`
+
+        Usage:
+        >>> def worker():
+        ...     text = window.post(lambda: entry.base.get()).result()
+        """
+        return self.calls.future(fn, *args)
+
+    def run_in_executor(
+        self, fn: Callable[..., Any], *args: Any,
+        on_done: Optional[Callable[[Any], Any]] = None,
+        on_error: Optional[Callable[[BaseException], Any]] = None,
+        on_progress: Optional[Callable[[Any], Any]] = None,
+        owner: Optional["Widget"] = None
+    ) -> Job:
+        """
+        Run a function in `executor` (unless set otherwise, a thread pool
+        shut down with the window), with its callbacks called in the Tcl
+        thread.
+
+        - fn: `func: (*args) -> Any` - the function; with `on_progress`, it
+            also gets a `progress` keyword argument, to be called with
+            progress values, whose `cancelled` attribute tells whether to
+            stop
+        - *args - its arguments
+        - on_done: `func: (result) -> Any` - called with the result
+        - on_error: `func: (BaseException) -> Any` - called with the
+            exception raised, reported as a callback exception otherwise
+        - on_progress: `func: (value) -> Any` - called with progress values
+        - owner: `Widget | None` - cancel the job when it is destroyed
+
+        Returns: `Job` - handle to cancel the job
+        """
+        if self.executor is None:
+            from concurrent.futures import ThreadPoolExecutor
+            pool = self.executor = ThreadPoolExecutor(thread_name_prefix="tkreform")
+            # the pool made here ends with the window
+            when_destroyed(self.base, lambda: pool.shutdown(wait=False))
+        return submit(
+            self.executor, _calls_of(self.base, True), fn, *args, on_done=on_done,
+            on_error=on_error, on_progress=on_progress, owner=owner
+        )
 
     def loop(self):
         """
         Run window mainloop.
         """
+        calls = getattr(self.base._root(), "_tkreform_calls", None)
+        if calls is not None:
+            calls.start()
+            if len(calls):
+                calls.wake()  # calls queued before the loop could be woken
         self.base.mainloop()
 
+    async def async_loop(self):
+        """
+        Run window mainloop in asyncio, until the window is destroyed.
+
+        Run in a `tkreform.aio.TkEventLoop` (see `run_async`), Tk events and
+        asyncio share one wait; in other loops the window is updated
+        periodically.
+        """
+        from tkreform import aio
+        await aio.mainloop(self.base)
+
+    def run_async(self, main: Awaitable[_R]) -> _R:
+        """
+        Run a coroutine to completion in an asyncio event loop driven by the
+        Tcl event loop, so that coroutines may update widgets directly.
+        Where Tk has no file handlers (Windows), a default event loop is
+        used, and `async_loop` updates the window periodically.
+
+        - main: `Awaitable` - the coroutine
+
+        Returns: the result of the coroutine
+
+        Usage:
+        >>> async def main():
+        ...     asyncio.create_task(fetch_updates())
+        ...     await window.async_loop()
+        >>> window.run_async(main())
+        """
+        from tkreform import aio
+        return aio.run(main, self.base)
+
+    def trace(self) -> Tracer:
+        """
+        Trace the Tcl calls and callbacks of the window's interpreter, by
+        declarative node and callback.
+
+        Returns: `Tracer`, to use as a context manager (or `start` / `stop`)
+
+        Usage:
+        >>> with window.trace() as tracer:
+        ...     window /= render(model)
+        >>> print(tracer.table())
+        """
+        return Tracer(self.base)
+
+    def monitor(
+        self, budgets: Tuple[float, ...] = (16, 100),
+        on_stall: Optional[Callable[[Stall], Any]] = None
+    ) -> Monitor:
+        """
+        Time the callbacks of the window's interpreter registered from now
+        on, and watch for callbacks stalling the event loop: create the
+        monitor before building the widgets.
+
+        - budgets: `tuple[float]` - ms a callback may run before it is
+            reported as a stall
+        - on_stall: `func: (Stall) -> Any | None` - called with every stall
+
+        Returns: `Monitor`, running (see `stop`)
+
+        Usage:
+        >>> monitor = window.monitor(on_stall=lambda s: print(s.format()))
+        >>> ...
+        >>> monitor.durations.percentile(99)
+        """
+        return Monitor(self.base, budgets, on_stall).start()
+
+    @property
+    def keymap(self) -> Keymap:
+        """
+        The shortcuts of the window, dispatched from one binding (created at
+        the first access).
+
+        Usage:
+        >>> @window.keymap.bind(CTRL + "k", CTRL + "s")
+        ... def save_all(event: Event):
+        ...     ...
+        """
+        if self._keymap is None:
+            self._keymap = Keymap(self.base)
+        return self._keymap
+
     def sub_window(self):
         """
         Create a sub window.
@@ -425,9 +1287,17 @@ class Window(_Base, Generic[_WindowT]):
         return __wrapper
 
     def update_translation(self):
-        self.title = self._raw_title
-        # for w in self._sub_widget:
-        #     w.linguist = self.linguist
+        """Translate the title and texts of the window and its widgets again."""
+        for option in self._raw or ():
+            self._retranslate(option)
+        for w in self._sub_widget:
+            w.update_translation()
+
+    def _show(self, option: str, text: str):
+        if option == "title":
+            self.base.title(text)
+        else:
+            super()._show(option, text)
 
     @property
     def title(self):
@@ -436,20 +1306,60 @@ class Window(_Base, Generic[_WindowT]):
 
     @title.setter
     def title(self, title: str):
-        self._raw_title = title
-        try:
-            self.base.title(title)
-        except MessageNotFound:
-            pass
+        self.base.title(self._translated("title", title))
 
     @property
     def geometry(self):
         """Geometry string."""
+        if self._writes:
+            self._flush_writes()
         return self.base.geometry()
 
     @geometry.setter
     def geometry(self, geo: str):
-        self.base.geometry(geo)
+        batch = Batch.of(self.base)
+        if batch is None:
+            self.base.geometry(geo)
+            return
+        if not self._writes:
+            batch.record(self)
+            self._writes = {}
+        # size and position written apart are merged
+        m = _GEOMETRY.match(geo)
+        size, pos = m.groups() if m else (geo, None)
+        if size:
+            self._writes["@size"] = size
+        if pos:
+            self._writes["@pos"] = pos
+        batch.writes += 1
+
+    def _set_attribute(self, name: str, value: Any):
+        batch = Batch.of(self.base)
+        if batch is None:
+            self.base.attributes(name, value)
+            return
+        if not self._writes:
+            batch.record(self)
+            self._writes = {}
+        self._writes[name] = value
+        batch.writes += 1
+
+    def _get_attribute(self, name: str):
+        if self._writes and name in self._writes:
+            return self._writes[name]
+        return self.base.attributes(name)
+
+    def _flush_writes(self):
+        writes, self._writes = self._writes or {}, None
+        geometry = writes.pop("@size", "") + writes.pop("@pos", "")
+        attributes = [x for k, v in writes.items() if k.startswith("-") for x in (k, v)]
+        options = {k: v for k, v in writes.items() if not k.startswith("-")}
+        if options:
+            self._configure(**options)
+        if attributes:
+            self.base.attributes(*attributes)
+        if geometry:
+            self.base.geometry(geometry)
 
     @property
     def xgeo(self):
@@ -493,23 +1403,34 @@ class Window(_Base, Generic[_WindowT]):
     def icon(self, ic: str):
         self.base.iconbitmap(ic, ic)
 
-    def xicon(self, *ic: PhotoImage, inherit: bool = True):
+    def xicon(self, *ic: Union[str, "PhotoImage"], inherit: bool = True):  # type: ignore
         """
         Advanced icon setter.
 
-        - *ic: `PhotoImage` - icon images
+        - *ic: `str | PhotoImage` - icon images, or image files taken from
+            the shared image cache
         - inherit: `bool` - whether the icon applies to sub windows
         """
-        self.base.iconphoto(inherit, *ic)  # type: ignore
+        keys = []
+        icons = []
+        for img in ic:
+            if isinstance(img, str):
+                key, img = images.acquire(img, self.base)
+                keys.append(key)
+            icons.append(img)
+        self.base.iconphoto(inherit, *icons)  # type: ignore
+        for key in self._icon_keys:
+            images.release(key)
+        self._icon_keys = keys
 
     @property
     def bgcolor(self) -> str:
         """Window background color."""
-        return self.base["background"]
+        return self._get("background")
 
     @bgcolor.setter
     def bgcolor(self, bg: str):
-        self.base["background"] = bg
+        self._set(background=bg)
 
     @property
     def resizable(self):
@@ -550,29 +1471,29 @@ class Window(_Base, Generic[_WindowT]):
     @property
     def alpha(self) -> float:
         """Window alpha."""
-        return self.base.attributes("-alpha")
+        return self._get_attribute("-alpha")
 
     @alpha.setter
     def alpha(self, a: float):
-        self.base.attributes("-alpha", a)
+        self._set_attribute("-alpha", a)
 
     @property
     def top(self) -> bool:
         """Whether the window lies on the toppest."""
-        return self.base.attributes("-topmost")
+        return self._get_attribute("-topmost")
 
     @top.setter
     def top(self, t: bool):
-        self.base.attributes("-topmost", t)
+        self._set_attribute("-topmost", t)
 
     @property
     def fullscreen(self) -> bool:
         """Whether the window occupies a whole screen."""
-        return self.base.attributes("-fullscreen")
+        return self._get_attribute("-fullscreen")
 
     @fullscreen.setter
     def fullscreen(self, f: bool):
-        self.base.attributes("-fullscreen", f)
+        self._set_attribute("-fullscreen", f)
 
     @property
     def screenwh(self):
@@ -0,0 +1,111 @@
+"""
+TkReform coalesced property writes.
+
+While a `Batch` is active on a Tcl interpreter, property writes on windows / widgets (`text`,
+`width`, `bgcolor`, `alpha`, `geometry`, ...) are recorded instead of being
+sent to Tcl at once. A value written again replaces the former one, and
+every window / widget gets its writes in one `configure` call (plus one
+`wm attributes` and one `wm geometry` call for windows) when the batch is
+flushed. Reading a property returns its pending value.
+
+Example:
+>>> with window.batch():
+...     for w, row in zip(widgets, model):
+...         w.text = row.name
+...         w.disabled = not row.enabled
+>>> window.batch(idle=True)  # or flush automatically whenever idle
+"""
+
+import tkinter as tk
+from typing import Any, ClassVar, List, Optional
+
+
+class Batch:
+    """Recorder of property writes, flushed once per batch / idle time."""
+    # the number of active batches, so that writes skip looking for one
+    # while there are none
+    _running: ClassVar[int] = 0
+
+    @staticmethod
+    def of(widget: tk.Misc) -> Optional["Batch"]:
+        """
+        Get the batch active on the interpreter of a widget.
+
+        - widget: `WindowType | WidgetType` - the widget
+
+        Returns: `Batch | None`
+        """
+        if not Batch._running:
+            return None
+        return getattr(widget._root(), "_tkreform_batch", None)
+
+    def __init__(self, widget: tk.Misc, idle: bool = False) -> None:
+        """
+        - widget: `WindowType | WidgetType` - widget used for scheduling
+        - idle: `bool` - flush whenever idle, instead of at the end of a
+            `with` block
+        """
+        self.widget = widget
+        self.idle = idle
+        self.writes = 0
+        self.flushes = 0
+        self._dirty: List[Any] = []
+        self._scheduled = False
+        self._owner = False
+
+    def start(self):
+        """
+        Make writes in the interpreter go to this batch, unless another one
+        is active there.
+        """
+        root = self.widget._root()
+        if getattr(root, "_tkreform_batch", None) is None:
+            root._tkreform_batch = self  # type: ignore
+            Batch._running += 1
+            self._owner = True
+        return self
+
+    def stop(self):
+        """Flush, and stop recording writes."""
+        if self._owner:
+            self.widget._root()._tkreform_batch = None  # type: ignore
+            Batch._running -= 1
+            self._owner = False
+        self.flush()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc: Any):
+        self.stop()
+
+    def record(self, target: Any):
+        """Note a window / widget about to get its first pending write."""
+        self._dirty.append(target)
+        if self.idle and not self._scheduled:
+            self._scheduled = True
+            self.widget.after_idle(self.flush)
+
+    def flush(self):
+        """Send every pending write to Tcl."""
+        self._scheduled = False
+        dirty, self._dirty = self._dirty, []
+        error: Optional[tk.TclError] = None
+        for target in dirty:
+            try:
+                target._flush_writes()
+            except tk.TclError as e:
+                target._writes = None
+                # only errors of widgets destroyed meanwhile are dropped
+                if error is None and _exists(target.base):
+                    error = e
+        self.flushes += 1
+        if error is not None:
+            raise error
+
+
+def _exists(widget: tk.Misc) -> bool:
+    try:
+        return bool(widget.winfo_exists())
+    except tk.TclError:  # the interpreter is gone
+        return False
@@ -0,0 +1,179 @@
+"""
+TkReform thread-safe call queue.
+
+tkinter must only be used from the thread running the Tcl interpreter.
+`CallQueue` lets other threads hand calls over to it: calls are queued, the
+Tcl event loop is woken through a self-pipe (or through an `after` call,
+where file handlers are not supported), and queued calls are run in
+batches, within a time budget per tick so that floods of calls don't
+freeze input handling.
+
+Every window shares the queue of its Tcl interpreter, created on first
+use and closed when the root window is destroyed, see
+`Window.call_soon_threadsafe` and `Window.post`.
+"""
+
+from collections import deque
+from concurrent.futures import Future
+import itertools
+import os
+import sys
+import threading
+import time
+import tkinter as tk
+from typing import Any, Callable, Deque, Optional, Tuple
+
+
+_tags = itertools.count()
+
+
+def when_destroyed(widget: tk.Misc, callback: Callable[[], Any]):
+    """
+    Call a function when a widget is destroyed. Unlike a `<Destroy>`
+    binding of a window, the binding tag used doesn't run for every
+    descendant destroyed.
+
+    - widget: `WindowType | WidgetType` - the widget
+    - callback: `func: () -> Any` - the function
+    """
+    tag = f"tkreform_destroy{next(_tags)}"
+    widget.bind_class(tag, "<Destroy>", lambda _: callback())
+    widget.bindtags((tag, ) + widget.bindtags())
+
+
+class CallQueue:
+    """Queue of calls to run in the Tcl thread."""
+    def __init__(self, widget: tk.Misc, budget: float = 0.008) -> None:
+        """
+        May be created in any thread: nothing is set up in Tcl until the
+        first call is queued.
+
+        - widget: `WindowType` - root window, used for scheduling
+        - budget: `float` - seconds spent at most running calls per tick
+        """
+        self.widget = widget
+        self.budget = budget
+        self._calls: Deque[Tuple[Callable[..., Any], Tuple[Any, ...]]] = deque()
+        self._lock = threading.Lock()
+        self._woken = False
+        self._started = False
+        self._pipe: Optional[Tuple[int, int]] = None
+        self._closed = False
+
+    def __len__(self):
+        return len(self._calls)
+
+    def put(self, fn: Callable[..., Any], *args: Any):
+        """
+        Queue a call, from any thread.
+
+        - fn: `func: (*args) -> Any` - the function to call
+        - *args - its arguments
+        """
+        if self._closed:
+            return
+        self._calls.append((fn, args))
+        self.wake()
+
+    def wake(self):
+        """
+        Wake the event loop to run queued calls, from any thread. Calls
+        queued from other threads before the main loop runs wait for the
+        next wake, done by `Window.loop`.
+        """
+        with self._lock:
+            if self._woken or self._closed:
+                return
+            self._woken = True
+        if self._pipe is not None:
+            try:
+                os.write(self._pipe[1], b"\0")
+            except (BlockingIOError, OSError):  # full, or closed
+                pass
+            return
+        # from other threads, a threaded Tcl runs the call in its own thread
+        try:
+            self.widget.after(0, self._start if not self._started else self.drain)
+        except (RuntimeError, tk.TclError):  # main loop not running (yet)
+            with self._lock:
+                self._woken = False
+
+    def future(self, fn: Callable[..., Any], *args: Any) -> "Future[Any]":
+        """
+        Queue a call, from any thread, and get its result as a future.
+
+        - fn: `func: (*args) -> Any` - the function to call
+        - *args - its arguments
+
+        Returns: `concurrent.futures.Future`
+        """
+        fut: "Future[Any]" = Future()
+
+        def run():
+            if fut.set_running_or_notify_cancel():
+                try:
+                    fut.set_result(fn(*args))
+                except BaseException as e:
+                    fut.set_exception(e)
+        self.put(run)
+        return fut
+
+    def drain(self):
+        """Run queued calls, until the queue is empty or the budget is used."""
+        with self._lock:
+            self._woken = False
+        deadline = time.perf_counter() + self.budget
+        while self._calls:
+            fn, args = self._calls.popleft()
+            try:
+                fn(*args)
+            except Exception:
+                self.widget._root().report_callback_exception(*sys.exc_info())
+            if self._calls and time.perf_counter() >= deadline:
+                # let pending input events run first
+                self.widget.after(0, self.drain)
+                break
+
+    def close(self):
+        """
+        Stop waking the event loop, done when the root window is destroyed.
+        Queued calls are dropped.
+        """
+        self._closed = True
+        self._calls.clear()
+        if self._pipe is not None:
+            pipe, self._pipe = self._pipe, None
+            self.widget.tk.deletefilehandler(pipe[0])
+            for fd in pipe:
+                os.close(fd)
+
+    def start(self):
+        """
+        Set up waking the event loop, if not done yet. Must be called in the
+        Tcl thread; otherwise the first wake does it, which from other
+        threads needs the main loop to be running.
+        """
+        if self._started or self._closed:
+            return
+        self._started = True
+        widget = self.widget
+        when_destroyed(widget, self.close)
+        if os.name != "nt" and hasattr(widget.tk, "createfilehandler"):
+            pipe = os.pipe()
+            for fd in pipe:
+                os.set_blocking(fd, False)
+            widget.tk.createfilehandler(pipe[0], tk.READABLE, self._readable)
+            self._pipe = pipe
+
+    def _start(self):
+        # in the Tcl thread, on the first wake
+        self.start()
+        self.drain()
+
+    def _readable(self, fd: int, mask: int):
+        try:
+            while os.read(fd, 4096):
+                pass
+        except BlockingIOError:
+            pass
+        self.drain()
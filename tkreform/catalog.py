@@ -0,0 +1,230 @@
+"""
+TkReform compiled message catalogs.
+
+Large catalogs can be compiled to a binary file, in the spirit of gettext
+`.mo` files, and used as `Messages` without loading them: `MappedMessages`
+maps the file into memory at its first access, finds messages through hash
+indexes of keys and of texts, and decodes strings only when they are read.
+
+File layout (little endian):
+
+- header: magic `TKRC`, version `u16`, reserved `u16`, entry count `u32`,
+    bucket count `u32`
+- entries: key offset, key length, text offset, text length, `u32` each,
+    relative to the strings
+- key index, then text index: one `u32` per bucket, entry number + 1, or 0
+    for empty buckets; open addressing with linear probing on the CRC-32 of
+    the UTF-8 string
+- strings: UTF-8
+
+Compile catalogs with:
+
+```console
+python -m tkreform.catalog zh_CN.json locale/zh_CN.tkc
+```
+
+Example:
+>>> catalogs = load_catalogs("locale")  # {"zh_CN": MappedMessages, ...}
+>>> win.linguist = KVPairLinguist("zh_CN", ("en_US", ), **catalogs)
+"""
+
+import mmap
+import os
+import struct
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Sequence, cast
+import zlib
+
+MAGIC = b"TKRC"
+VERSION = 1
+SUFFIX = ".tkc"
+
+_HEADER = struct.Struct("<4sHHII")
+_ENTRY = struct.Struct("<IIII")
+_SLOT = struct.Struct("<I")
+
+
+def _buckets(count: int) -> int:
+    n = 8
+    while n < count * 2:
+        n *= 2
+    return n
+
+
+def _index(hashes: List[int], buckets: int) -> List[int]:
+    slots = [0] * buckets
+    for i, h in enumerate(hashes):
+        slot = h & (buckets - 1)
+        while slots[slot]:
+            slot = (slot + 1) & (buckets - 1)
+        slots[slot] = i + 1
+    return slots
+
+
+def compile_catalog(messages: Mapping[str, str], path: str):
+    """
+    Compile messages to a catalog file.
+
+    - messages: `Mapping[str, str]` - message keys and texts
+    - path: `str` - the catalog file
+    """
+    keys = [k.encode("utf-8") for k in messages]
+    texts = [v.encode("utf-8") for v in messages.values()]
+    buckets = _buckets(len(keys))
+    blob = bytearray()
+    entries = bytearray()
+    for k, v in zip(keys, texts):
+        entries += _ENTRY.pack(len(blob), len(k), len(blob) + len(k), len(v))
+        blob += k + v
+    with open(path, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, VERSION, 0, len(keys), buckets))
+        f.write(entries)
+        for index in (_index([zlib.crc32(k) for k in keys], buckets),
+                      _index([zlib.crc32(v) for v in texts], buckets)):
+            f.write(struct.pack(f"<{buckets}I", *index))
+        f.write(blob)
+
+
+class MappedMessages(Mapping[str, str]):
+    """Message catalog read from a compiled file, mapped into memory."""
+    def __init__(self, path: str) -> None:
+        """
+        The file is opened at the first access.
+
+        - path: `str` - the catalog file
+        """
+        self.path = path
+        self._map: Optional[mmap.mmap] = None
+        self._count = 0
+        self._buckets = 0
+        self._entries = 0
+        self._strings = 0
+        # decoded and patched messages
+        self._decoded: Dict[str, str] = {}
+        self._patched: Dict[str, str] = {}
+
+    def _open(self) -> mmap.mmap:
+        with open(self.path, "rb") as f:
+            m = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, _, count, buckets = _HEADER.unpack_from(m, 0)
+        if magic != MAGIC or version != VERSION:
+            m.close()
+            raise ValueError(f"{self.path} is not a catalog of version {VERSION}.")
+        self._count = count
+        self._buckets = buckets
+        self._entries = _HEADER.size
+        self._strings = self._entries + count * _ENTRY.size + 2 * buckets * _SLOT.size
+        self._map = m
+        return m
+
+    def _find(self, data: bytes, second: bool) -> int:
+        # entry number of a key (or of a text), -1 if missing
+        m = self._map if self._map is not None else self._open()
+        index = self._entries + self._count * _ENTRY.size + second * self._buckets * _SLOT.size
+        mask = self._buckets - 1
+        slot = zlib.crc32(data) & mask
+        while True:
+            entry, = _SLOT.unpack_from(m, index + slot * _SLOT.size)
+            if not entry:
+                return -1
+            fields = _ENTRY.unpack_from(m, self._entries + (entry - 1) * _ENTRY.size)
+            off, size = fields[2:] if second else fields[:2]
+            start = self._strings + off
+            if size == len(data) and m[start:start + size] == data:
+                return entry - 1
+            slot = (slot + 1) & mask
+
+    def _string(self, entry: int, second: bool) -> str:
+        m = cast(mmap.mmap, self._map)
+        fields = _ENTRY.unpack_from(m, self._entries + entry * _ENTRY.size)
+        off, size = fields[2:] if second else fields[:2]
+        start = self._strings + off
+        return m[start:start + size].decode("utf-8")
+
+    def __getitem__(self, key: str) -> str:
+        try:
+            return self._decoded[key]
+        except KeyError:
+            pass
+        # misses are not remembered: any text may be looked up as a key
+        entry = self._find(key.encode("utf-8"), False)
+        if entry < 0:
+            raise KeyError(key)
+        text = self._decoded[key] = self._string(entry, True)
+        return text
+
+    def __setitem__(self, key: str, text: str):
+        # patches stay in memory
+        self._decoded[key] = text
+        self._patched[key] = text
+
+    def __iter__(self) -> Iterator[str]:
+        if self._map is None:
+            self._open()
+        keys = [self._string(i, False) for i in range(self._count)]
+        known = set(keys)
+        return iter(keys + [k for k in self._decoded if k not in known])
+
+    def __len__(self):
+        return len(list(iter(self)))
+
+    def key_of(self, text: str) -> Optional[str]:
+        """
+        Get the key of a message text.
+
+        - text: `str` - the text
+
+        Returns: `str | None`
+        """
+        for key, patched in self._patched.items():
+            if patched == text:
+                return key
+        entry = self._find(text.encode("utf-8"), True)
+        if entry < 0:
+            return None
+        key = self._string(entry, False)
+        # the text in the file is no longer the message of a patched key
+        return None if key in self._patched else key
+
+    @property
+    def loaded(self) -> bool:
+        """Whether the file is mapped."""
+        return self._map is not None
+
+    def close(self):
+        """Unmap the file; it is mapped again when needed."""
+        if self._map is not None:
+            m, self._map = self._map, None
+            m.close()
+
+
+def load_catalogs(directory: str) -> Dict[str, MappedMessages]:
+    """
+    Get the catalogs of a directory, by language; no file is read.
+
+    - directory: `str` - directory of `<language>.tkc` files
+
+    Returns: `dict[str, MappedMessages]`
+    """
+    return {
+        name[:-len(SUFFIX)]: MappedMessages(os.path.join(directory, name))
+        for name in sorted(os.listdir(directory)) if name.endswith(SUFFIX)
+    }
+
+
+def main(argv: Optional[Sequence[str]] = None):
+    import argparse
+    import json
+
+    parser = argparse.ArgumentParser(
+        prog="python -m tkreform.catalog", description="Compile a message catalog."
+    )
+    parser.add_argument("source", help="JSON object of message keys and texts")
+    parser.add_argument("target", help=f"the catalog file, usually <language>{SUFFIX}")
+    args = parser.parse_args(argv)
+    with open(args.source, encoding="utf-8") as f:
+        messages: Any = json.load(f)
+    compile_catalog(messages, args.target)
+
+
+if __name__ == "__main__":
+    main()
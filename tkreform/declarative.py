@@ -18,18 +18,30 @@ Example (Hello, World):
 >>> )
 >>> window[0][1].callback(window.destroy)
 >>> window.loop()
+
+Trees may also be kept as JSON data (see `from_data` for the format), with
+widget classes named in `registry`:
+>>> open("hello.json", "w").write(dumps(tree))
+>>> window /= load("hello.json")  # parsed once, then read from a cache
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, fields, replace
+from functools import partial
+import os
 import sys
 import tkinter as tk
 from tkinter import ttk, Menu
-from typing import TYPE_CHECKING, Any, Iterable, Optional, Tuple, Type, Union
+from typing import (
+    TYPE_CHECKING, Any, Dict, Hashable, Iterable, List, Optional, Tuple, Type, TypeVar, Union,
+    cast
+)
+from weakref import WeakValueDictionary
 
+from tkreform.exceptions import SpecError
 from tkreform.menu import MenuItem
 
 if TYPE_CHECKING:
-    from tkreform.base import Window
+    from tkreform.base import Widget, Window, _Base
 
 WidgetType = Union[tk.Widget, ttk.Widget]
 WindowType = Union[tk.Tk, tk.Toplevel]
@@ -43,8 +55,11 @@ Direction = Literal["n", "ne", "e", "se", "s", "sw", "w", "nw"]
 Compound = Literal["top", "left", "center", "right", "bottom", "none"]
 LiteralFloat = Union[str, float]
 Padding = Union[LiteralFloat, Tuple[LiteralFloat, ...]]
+_C = TypeVar("_C")
 
-@dataclass
+
+# Geometry specs are immutable, so that identical ones are shared between nodes.
+@dataclass(frozen=True)
 class Gridder:
     column: Optional[int] = None
     columnspan: Optional[int] = None
@@ -58,7 +73,7 @@ class Gridder:
     sticky: Optional[Direction] = None
 
 
-@dataclass
+@dataclass(frozen=True)
 class Packer:
     after: Optional[WidgetType] = None
     anchor: Optional[Literal[Direction, "center"]] = None
@@ -73,7 +88,7 @@ class Packer:
     side: Optional[Literal["top", "bottom", "left", "right"]] = None
 
 
-@dataclass
+@dataclass(frozen=True)
 class Placer:
     x: Optional[int] = None
     y: Optional[int] = None
@@ -102,26 +117,737 @@ class NotebookAdder:
     image: Any = ""
     compound: Compound = "none"
     underline: int = 0
+    # build the sub widgets of the tab when it is first selected
+    lazy: bool = False
+    # with `lazy`, build them while idle once a neighbouring tab is selected
+    prebuild: bool = False
+
+
+_TAB_OPTIONS = ("state", "sticky", "padding", "text", "image", "compound", "underline")
+
+
+def _tab_options(adder: NotebookAdder):
+    return {k: getattr(adder, k) for k in _TAB_OPTIONS}
+
+
+def _is_lazy(w: "W"):
+    return isinstance(w.sub, Lazy) or (
+        isinstance(w.controller, NotebookAdder) and w.controller.lazy
+    )
+
+
+class Lazy(tuple):
+    """
+    Sub widget tree loaded only when its container is mapped (shown) for the
+    first time.
+
+    Usage:
+    >>> W(tk.Frame) * Packer() / Lazy((
+    >>>     W(tk.Label, text="Expensive") * Packer(),
+    >>> ))
+    """
+
+
+_specs: "WeakValueDictionary[Tuple[Any, ...], Any]" = WeakValueDictionary()
+
+
+def intern(spec: Any):
+    """
+    Get the shared instance of a geometry spec equal to `spec`.
+
+    - spec: `Gridder | Packer | Placer | Any` - the spec; other controllers
+        and specs with unhashable values are returned as is
+
+    Returns: the shared spec
+    """
+    if not isinstance(spec, (Gridder, Packer, Placer)):
+        return spec
+    key = (type(spec), ) + tuple(vars(spec).values())  # field values, in order
+    try:
+        return _specs.setdefault(key, spec)
+    except TypeError:
+        return spec
 
 
 class W:
     """Widget data pre-storage."""
+    __slots__ = ("widget", "kwargs", "controller", "key", "sub")
+
     def __init__(self, widget: Type[WidgetType], **kwargs: Any) -> None:
         self.widget = widget
         self.kwargs = kwargs
         self.controller = None
+        self.key: Optional[Hashable] = None
         self.sub: Iterable[Union["W", MenuItem]] = ()
 
+    def __matmul__(self, key: Hashable):
+        """
+        Give the node a key, so that reconciliation matches it by key
+        instead of by position among its siblings.
+        """
+        self.key = key
+        return self
+
     def __mul__(self, other: Union[Gridder, Packer, Placer, MenuBinder, NotebookAdder]):
-        self.controller = other
+        self.controller = intern(other)
         return self
 
     def __truediv__(self, other: Iterable[Union["W", MenuItem]]):
-        self.sub = other
+        self.sub = other if isinstance(other, Lazy) else tuple(other)
         return self
 
 
 class M(W):
+    __slots__ = ("it", )
+
     def __init__(self, it: MenuItem, **kwargs) -> None:
         super().__init__(Menu, **kwargs)
         self.it = it
+
+
+class _Required:
+    # default of required params, kept a singleton through copies and pickles
+    def __repr__(self) -> str:
+        return "<required>"
+
+    def __reduce__(self):
+        return "_REQUIRED"
+
+
+_REQUIRED = _Required()
+
+
+class Param:
+    """Placeholder for a per-instance value of a `Template`."""
+    _required = _REQUIRED
+
+    def __init__(self, name: str, default: Any = _required) -> None:
+        self.name = name
+        self.default = default
+
+    def __repr__(self) -> str:
+        return f"Param({self.name!r})"
+
+    def __eq__(self, other: object) -> bool:
+        return (
+            isinstance(other, Param) and self.name == other.name
+            and self.default == other.default
+        )
+
+    def __hash__(self):
+        return hash((Param, self.name))
+
+
+Options = Tuple[Dict[str, Any], Tuple[Tuple[str, str], ...]]
+
+# how a widget is attached to its parent besides its own controller
+_PLAIN, _CASCADE, _PANE, _TAB = range(4)
+# template build steps
+_ITEM, _WIDGET, _GEOMETRY, _APPLY, _DEFER = range(5)
+
+
+def _split(options: Dict[str, Any]) -> Options:
+    """Split options into static ones and `(option, param name)` pairs."""
+    return (
+        {k: v for k, v in options.items() if not isinstance(v, Param)},
+        tuple((k, v.name) for k, v in options.items() if isinstance(v, Param))
+    )
+
+
+def _attach_kind(parent: Type[Any], cascade: bool):
+    if issubclass(parent, Menu):
+        return _CASCADE if cascade else _PLAIN
+    if issubclass(parent, tk.PanedWindow):
+        return _PANE
+    if issubclass(parent, ttk.Notebook):
+        return _TAB
+    return _PLAIN
+
+
+class Template:
+    """
+    Compiled declarative tree, stamped out many times with per-instance
+    parameters. The tree is analysed only once; prefer `compile`, which also
+    caches templates by structure.
+
+    Usage:
+    >>> row = compile((
+    >>>     W(tk.Frame) * Packer(fill="x") / (
+    >>>         W(tk.Label, text=Param("name")) * Packer(side="left"),
+    >>>         W(tk.Button, text="Edit", command=Param("edit")) * Packer(side="right")
+    >>>     ),
+    >>> ))
+    >>> for rec in records:
+    >>>     row.stamp(window, name=rec.name, edit=rec.edit)
+    """
+    def __init__(self, sub: Iterable[Union[W, MenuItem]]) -> None:
+        self.sub = tuple(sub)
+        self.params: Dict[str, Param] = {}
+        self._widgets: List[Type[WidgetType]] = []
+        # (op, widget slot, ...) in creation order, the slot of the target
+        # being -1
+        self._steps: List[Tuple[Any, ...]] = []
+        self._compile(self.sub, -1, None)
+
+    def _options(self, options: Dict[str, Any]) -> Options:
+        for v in options.values():
+            if isinstance(v, Param):
+                self.params.setdefault(v.name, v)
+        return _split(options)
+
+    def _compile(self, sub: Tuple[Union[W, MenuItem], ...], parent: int, parent_type):
+        for w in sub:
+            if isinstance(w, MenuItem):
+                self._steps.append((_ITEM, parent, w.type, self._options(w.data)))
+                continue
+            kind = isinstance(w, M) if parent_type is None else _attach_kind(
+                parent_type, isinstance(w, M)
+            )
+            if isinstance(w, M):
+                attach = self._options(dict(w.it.data, type=w.it.type))
+            elif isinstance(w.controller, NotebookAdder):
+                attach = self._options(_tab_options(w.controller))
+            else:
+                attach = ({}, ())
+            slot = len(self._widgets)
+            self._widgets.append(w.widget)
+            self._steps.append((_WIDGET, parent, w.widget, self._options(w.kwargs), kind, attach))
+            if _is_lazy(w):
+                nested = Template(w.sub)
+                for name, p in nested.params.items():
+                    self.params.setdefault(name, p)
+                prebuild = isinstance(w.controller, NotebookAdder) and w.controller.prebuild
+                self._steps.append((_DEFER, slot, parent, prebuild, nested))
+            else:
+                self._compile(tuple(w.sub), slot, w.widget)
+            geo: Any = w.controller
+            if isinstance(geo, (Gridder, Packer, Placer)):
+                self._steps.append((_GEOMETRY, slot, {
+                    Gridder: "grid", Packer: "pack", Placer: "place"
+                }[type(geo)], self._options({
+                    f.name: getattr(geo, f.name) for f in fields(geo)
+                    if getattr(geo, f.name) is not None
+                })))
+            elif geo is not None:
+                self._steps.append((_APPLY, slot, geo))
+
+    def stamp(self, parent: "_Base", **params: Any) -> List["Widget"]:
+        """
+        Create a copy of the tree in a window / widget.
+
+        - parent: `Window | Widget` - where to add the widgets
+        - **params: values of the `Param` placeholders
+
+        Returns: `List[Widget]` - the widgets created at the top level
+        """
+        for name, p in self.params.items():
+            if name not in params:
+                if p.default is Param._required:
+                    raise TypeError(f"missing template parameter {name!r}")
+                params[name] = p.default
+        if getattr(parent, "_keeps_nodes", False):
+            # reconciliation matches widgets with the nodes they were built
+            # from, so build them from the tree with the values filled in
+            before = len(parent._sub_widget)
+            parent.load_sub(_bound(self.sub, params))
+            return parent._sub_widget[before:]
+
+        def resolve(options: Options):
+            static, dynamic = options
+            if not dynamic:
+                return static
+            return dict(static, **{k: params[name] for k, name in dynamic})
+
+        made: List["Widget"] = []
+        top: List["Widget"] = []
+        for step in self._steps:
+            op = step[0]
+            if op == _GEOMETRY:
+                getattr(made[step[1]].base, step[2])(**resolve(step[3]))
+                continue
+            if op == _APPLY:
+                made[step[1]].apply(step[2])
+                continue
+            if op == _DEFER:
+                _, at, up, prebuild, nested = step
+                made[at]._defer(
+                    parent if up < 0 else made[up],
+                    partial(nested.stamp, made[at], **params), prebuild
+                )
+                continue
+            owner = parent if step[1] < 0 else made[step[1]]
+            if op == _ITEM:
+                owner.base.add(step[2], **resolve(step[3]))
+                continue
+            _, at, cls, kwargs, kind, attach = step
+            widget = owner.add_widget(cls, **resolve(kwargs))
+            made.append(widget)
+            if at < 0:
+                # the target type is only known now
+                top.append(widget)
+                kind = _attach_kind(type(owner.base), kind)
+            if kind == _CASCADE:
+                opts = resolve(attach)
+                owner.base.add(opts.pop("type"), menu=widget.base, **opts)
+            elif kind == _PANE:
+                owner.base.add(widget.base)
+            elif kind == _TAB:
+                owner.base.add(widget.base, **resolve(attach))
+        return top
+
+
+def _bound(
+    sub: Iterable[Union[W, MenuItem]], params: Dict[str, Any]
+) -> Tuple[Union[W, MenuItem], ...]:
+    """Copy of a tree with the `Param` placeholders replaced by values."""
+    def value(v: Any):
+        return params[v.name] if isinstance(v, Param) else v
+
+    def options(d: Dict[str, Any]):
+        return {k: value(v) for k, v in d.items()}
+
+    def item(it: MenuItem):
+        if any(isinstance(v, Param) for v in it.data.values()):
+            return MenuItem(it.type, **options(it.data))
+        return it
+
+    out: List[Union[W, MenuItem]] = []
+    for w in sub:
+        if isinstance(w, MenuItem):
+            out.append(item(w))
+            continue
+        node = M(item(w.it), **options(w.kwargs)) if isinstance(w, M) else W(
+            w.widget, **options(w.kwargs)
+        )
+        geo: Any = w.controller
+        if isinstance(geo, (Gridder, Packer, Placer, NotebookAdder)):
+            geo = intern(replace(geo, **{
+                f.name: value(getattr(geo, f.name)) for f in fields(geo)
+                if isinstance(getattr(geo, f.name), Param)
+            }))
+        node.controller = geo
+        node.key = w.key
+        nested = _bound(w.sub, params)
+        node.sub = Lazy(nested) if isinstance(w.sub, Lazy) else nested
+        out.append(node)
+    return tuple(out)
+
+
+_templates: Dict[Hashable, Template] = {}
+_TEMPLATE_CACHE_SIZE = 256
+
+
+def _structure(sub: Iterable[Union[W, MenuItem]]) -> Hashable:
+    def options(d: Dict[str, Any]):
+        return tuple(sorted(d.items()))
+
+    def controller(c: Any):
+        if c is None:
+            return None
+        return (type(c), tuple(getattr(c, f.name) for f in fields(c)))
+
+    return tuple(
+        (MenuItem, w.type, options(w.data)) if isinstance(w, MenuItem) else (
+            type(w), w.widget, options(w.kwargs), controller(w.controller),
+            (w.it.type, options(w.it.data)) if isinstance(w, M) else None,
+            isinstance(w.sub, Lazy), _structure(w.sub)
+        ) for w in sub
+    )
+
+
+def compile(sub: Iterable[Union[W, MenuItem]]) -> Template:
+    """
+    Compile a declarative tree into a `Template`. Trees of the same structure
+    and options share one compiled template.
+
+    - sub: `Iterable[W | MenuItem]` - sub widget tree, using `Param` for
+        per-instance values
+    """
+    sub = tuple(sub)
+    try:
+        key = _structure(sub)
+        hash(key)
+    except TypeError:  # unhashable option values, cannot be cached
+        return Template(sub)
+    tpl = _templates.get(key)
+    if tpl is None:
+        if len(_templates) >= _TEMPLATE_CACHE_SIZE:
+            del _templates[next(iter(_templates))]
+        tpl = _templates[key] = Template(sub)
+    return tpl
+
+
+SPEC_VERSION = 1
+"""Version of the serialized tree format."""
+# bumped when trees are cached differently
+_CACHE_VERSION = 1
+CACHE_DIR = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.environ.get("LOCALAPPDATA")
+    or os.path.join(os.path.expanduser("~"), ".cache"), "tkreform", "specs"
+)
+"""Default directory of the parsed tree cache of `load`."""
+
+registry: Dict[str, Type[WidgetType]] = {}
+"""Widget classes of serialized trees, by name; add classes with `register`."""
+_registry_key: List[Optional[str]] = [None]
+
+_CONTROLLERS: Dict[str, Type[Any]] = {
+    "grid": Gridder, "pack": Packer, "place": Placer, "tab": NotebookAdder,
+    "menubar": MenuBinder,
+}
+_NODE_FIELDS = {"widget", "menu", "item", "options", "key", "children", "lazy"} | set(_CONTROLLERS)
+
+
+def register(cls: Type[_C], name: Optional[str] = None) -> Type[_C]:
+    """
+    Make a widget class available to serialized trees.
+
+    - cls: `type` - the widget class
+    - name: `str | None` - its name in trees, the class name by default
+
+    Returns: the class, so that it may be used as a decorator
+
+    Usage:
+    >>> @register
+    >>> class Card(tk.Frame):
+    >>>     ...
+    """
+    registry[name or cls.__name__] = cls  # type: ignore
+    _registry_key[0] = None
+    return cls
+
+
+for _module, _prefix in ((tk, ""), (ttk, "ttk.")):
+    for _name, _cls in vars(_module).items():
+        if (
+            isinstance(_cls, type) and issubclass(_cls, tk.Widget)
+            and _cls not in (tk.Widget, ttk.Widget) and not _name.startswith("_")
+        ):
+            registry[_prefix + _name] = _cls
+del _module, _prefix, _name, _cls
+
+
+def _value(data: Any, where: str) -> Any:
+    # JSON value to option value: lists are tuples, {"$param": ...} a Param
+    if isinstance(data, list):
+        return tuple(_value(x, where) for x in data)
+    if isinstance(data, dict):
+        if "$param" in data:
+            if "default" in data:
+                return Param(data["$param"], _value(data["default"], where))
+            return Param(data["$param"])
+        return {k: _value(v, where) for k, v in data.items()}
+    return data
+
+
+_SCALARS = (str, int, float, bool, type(None))
+# types of node keys in serialized trees, matched by equality when reconciling
+_KEYS = (str, int)
+
+
+def _options(data: Any, where: str) -> Dict[str, Any]:
+    if not isinstance(data, dict):
+        raise SpecError(f"{where}: options must be an object.")
+    return {
+        k: v if v.__class__ in _SCALARS else _value(v, where) for k, v in data.items()
+    }
+
+
+def _node(data: Any, where: str, specs: Dict[Any, Any]) -> Union[W, MenuItem]:
+    if not isinstance(data, dict):
+        raise SpecError(f"{where}: a node must be an object.")
+    unknown = set(data) - _NODE_FIELDS
+    if unknown:
+        raise SpecError(f"{where}: unknown field(s) {', '.join(sorted(unknown))}.")
+    options = _options(data.get("options", {}), where)
+    if "item" in data:
+        return MenuItem(data["item"], **options)
+    if "menu" in data:
+        item = data["menu"]
+        if not isinstance(item, dict) or "item" not in item:
+            raise SpecError(f"{where}: menu must be a menu item node.")
+        w: W = M(MenuItem(item["item"], **_options(item.get("options", {}), where)), **options)
+    else:
+        cls = registry.get(data.get("widget"))  # type: ignore
+        if cls is None:
+            raise SpecError(f"{where}: unknown widget class {data.get('widget')!r}.")
+        w = W(cls, **options)
+    if "key" in data:
+        if data["key"] is not None and data["key"].__class__ not in _KEYS:
+            raise SpecError(f"{where}: key must be a string, an integer or null.")
+        w @ data["key"]
+    controllers = [k for k in _CONTROLLERS if k in data]
+    if len(controllers) > 1:
+        raise SpecError(f"{where}: more than one of {', '.join(controllers)}.")
+    for k in controllers:
+        # equal controllers are made once per tree
+        try:
+            spec_key: Any = (k, tuple(sorted(data[k].items())))
+            spec = specs.get(spec_key)
+        except (AttributeError, TypeError):  # not an object, or unhashable values
+            spec_key, spec = None, None
+        if spec is None:
+            try:
+                spec = _CONTROLLERS[k](**_options(data[k], where))
+            except TypeError as e:
+                raise SpecError(f"{where}.{k}: {e}") from None
+            if spec_key is not None:
+                specs[spec_key] = spec
+        w * spec
+    children = data.get("children", [])
+    if not isinstance(children, list):
+        raise SpecError(f"{where}: children must be an array.")
+    sub = tuple(_node(x, f"{where}.children[{i}]", specs) for i, x in enumerate(children))
+    w / (Lazy(sub) if data.get("lazy") else sub)
+    return w
+
+
+def from_data(data: Any) -> Tuple[Union[W, MenuItem], ...]:
+    """
+    Build a declarative tree from its serialized form, as decoded from JSON.
+
+    - data: `dict` - `{"tkreform": SPEC_VERSION, "tree": [node, ...]}`, a
+        node being a widget `{"widget": "ttk.Button", "options": {...},
+        "key": ..., "pack" | "grid" | "place" | "tab" | "menubar": {...},
+        "children": [node, ...], "lazy": bool}`, a menu `{"menu": item,
+        "options": {...}, "children": [...]}` or a menu item `{"item":
+        "command", "options": {...}}`; arrays are read as tuples, and
+        `{"$param": name, "default": value}` as a `Param`
+
+    Returns: `tuple[W | MenuItem]`
+
+    Raises: `SpecError` if the data is not a valid tree
+    """
+    if not isinstance(data, dict) or data.get("tkreform") != SPEC_VERSION:
+        raise SpecError(f"not a tree of spec version {SPEC_VERSION}.")
+    tree = data.get("tree")
+    if not isinstance(tree, list):
+        raise SpecError("tree must be an array.")
+    specs: Dict[Any, Any] = {}
+    return tuple(_node(x, f"tree[{i}]", specs) for i, x in enumerate(tree))
+
+
+def _plain(value: Any, where: str) -> Any:
+    if isinstance(value, Param):
+        if value.default is Param._required:
+            return {"$param": value.name}
+        return {"$param": value.name, "default": _plain(value.default, where)}
+    if isinstance(value, (list, tuple)):
+        return [_plain(x, where) for x in value]
+    if isinstance(value, dict):
+        return {str(k): _plain(v, where) for k, v in value.items()}
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    raise SpecError(f"{where}: {value!r} cannot be serialized.")
+
+
+def _dump(w: Union[W, MenuItem], names: Dict[Any, str], where: str) -> Dict[str, Any]:
+    if isinstance(w, MenuItem):
+        return {"item": w.type, "options": _plain(w.data, where)}
+    data: Dict[str, Any] = {}
+    if isinstance(w, M):
+        data["menu"] = _dump(w.it, names, where)
+    elif w.widget in names:
+        data["widget"] = names[w.widget]
+    else:
+        raise SpecError(f"{where}: widget class {w.widget.__qualname__} is not registered.")
+    if w.kwargs:
+        data["options"] = _plain(w.kwargs, where)
+    if w.key is not None:
+        if w.key.__class__ not in _KEYS:
+            raise SpecError(f"{where}: key {w.key!r} cannot be serialized.")
+        data["key"] = w.key
+    if w.controller is not None:
+        if isinstance(w.controller, MenuBinder) and w.controller.win is not None:
+            raise SpecError(f"{where}: a menu bar bound to a window cannot be serialized.")
+        kind = next(k for k, c in _CONTROLLERS.items() if isinstance(w.controller, c))
+        data[kind] = {
+            f.name: _plain(getattr(w.controller, f.name), where) for f in fields(w.controller)
+            if getattr(w.controller, f.name) != f.default
+        }
+    if w.sub:
+        data["children"] = [_dump(x, names, f"{where}.children[{i}]") for i, x in enumerate(w.sub)]
+    if isinstance(w.sub, Lazy):
+        data["lazy"] = True
+    return data
+
+
+def to_data(sub: Iterable[Union[W, MenuItem]]) -> Dict[str, Any]:
+    """
+    Get the serialized form of a declarative tree, to be encoded as JSON.
+    Widget classes must be registered, and options JSON values or `Param`.
+
+    - sub: `Iterable[W | MenuItem]` - the tree
+
+    Returns: `dict`
+
+    Raises: `SpecError` if the tree cannot be serialized
+    """
+    names: Dict[Any, str] = {}
+    for name, cls in registry.items():
+        names.setdefault(cls, name)
+    return {
+        "tkreform": SPEC_VERSION,
+        "tree": [_dump(w, names, f"tree[{i}]") for i, w in enumerate(sub)],
+    }
+
+
+def dumps(sub: Iterable[Union[W, MenuItem]], **kwargs: Any) -> str:
+    """
+    Serialize a declarative tree to JSON.
+
+    - sub: `Iterable[W | MenuItem]` - the tree
+    - **kwargs: passed to `json.dumps`, e.g. `indent`
+
+    Returns: `str`
+    """
+    import json
+    return json.dumps(to_data(sub), ensure_ascii=False, **kwargs)
+
+
+def loads(text: Union[str, bytes]) -> Tuple[Union[W, MenuItem], ...]:
+    """
+    Build a declarative tree from JSON.
+
+    - text: `str | bytes` - the JSON document
+
+    Returns: `tuple[W | MenuItem]`
+    """
+    import json
+    try:
+        data = json.loads(text)
+    except ValueError as e:
+        raise SpecError(f"invalid JSON: {e}") from None
+    return from_data(data)
+
+
+# nodes of the cached form of trees
+_ITEM_NODE, _WIDGET_NODE, _MENU_NODE = range(3)
+
+
+def _pack(
+    sub: Iterable[Union[W, MenuItem]], names: Dict[Any, str], specs: List[Any],
+    index: Dict[int, int]
+) -> Tuple[Any, ...]:
+    # validated tree to nested tuples of plain values, equal specs stored once
+    out: List[Any] = []
+    for w in sub:
+        if isinstance(w, MenuItem):
+            out.append((_ITEM_NODE, w.type, _plain(w.data, "")))
+            continue
+        ctl = -1
+        if w.controller is not None:
+            c = w.controller
+            ctl = index.setdefault(id(c), len(specs))
+            if ctl == len(specs):
+                kind = next(k for k, t in _CONTROLLERS.items() if isinstance(c, t))
+                specs.append((kind, {
+                    f.name: _plain(getattr(c, f.name), "") for f in fields(c)
+                    if getattr(c, f.name) != f.default
+                }))
+        if isinstance(w, M):
+            node: Tuple[Any, ...] = (_MENU_NODE, (w.it.type, _plain(w.it.data, "")))
+        else:
+            node = (_WIDGET_NODE, names[w.widget])
+        out.append(node + (
+            _plain(w.kwargs, ""), _plain(w.key, ""), ctl,
+            _pack(w.sub, names, specs, index), isinstance(w.sub, Lazy)
+        ))
+    return tuple(out)
+
+
+def _unpack(nodes: Tuple[Any, ...], specs: List[Any]) -> Tuple[Union[W, MenuItem], ...]:
+    out: List[Union[W, MenuItem]] = []
+    for n in nodes:
+        if n[0] == _ITEM_NODE:
+            out.append(MenuItem(n[1], **_options(n[2], "")))
+            continue
+        kind, head, options, key, ctl, children, lazy = n
+        if kind == _MENU_NODE:
+            w: W = M(MenuItem(head[0], **_options(head[1], "")), **_options(options, ""))
+        else:
+            w = W(registry[head], **_options(options, ""))
+        if key is not None:
+            w.key = _value(key, "")
+        if ctl >= 0:
+            w.controller = specs[ctl]
+        sub = _unpack(children, specs)
+        w.sub = Lazy(sub) if lazy else sub
+        out.append(w)
+    return tuple(out)
+
+
+def _cache_key(content: bytes) -> str:
+    import hashlib
+    import marshal
+    if _registry_key[0] is None:
+        _registry_key[0] = repr(sorted(
+            (name, cls.__module__, cls.__qualname__) for name, cls in registry.items()
+        ))
+    h = hashlib.sha256()
+    h.update(f"{_CACHE_VERSION}:{SPEC_VERSION}:{marshal.version}:{sys.version}".encode())
+    h.update(cast(str, _registry_key[0]).encode())
+    h.update(content)
+    return h.hexdigest()
+
+
+def _read_cache(path: str) -> Tuple[Union[W, MenuItem], ...]:
+    import marshal
+    with open(path, "rb") as f:
+        version, specs, nodes = marshal.loads(f.read())
+    if version != _CACHE_VERSION:
+        raise ValueError(path)
+    specs = [intern(_CONTROLLERS[k](**_options(o, ""))) for k, o in specs]
+    return _unpack(nodes, specs)
+
+
+def _write_cache(path: str, tree: Tuple[Union[W, MenuItem], ...]):
+    import marshal
+    names: Dict[Any, str] = {}
+    for name, cls in registry.items():
+        names.setdefault(cls, name)
+    specs: List[Any] = []
+    nodes = _pack(tree, names, specs, {})
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(marshal.dumps((_CACHE_VERSION, specs, nodes)))
+    os.replace(tmp, path)
+
+
+def load(path: str, cache_dir: Optional[str] = CACHE_DIR) -> Tuple[Union[W, MenuItem], ...]:
+    """
+    Load a declarative tree from a JSON file.
+
+    Parsed and validated trees are kept in `cache_dir`, by hash of the file
+    content, format and widget registry, as plain data (`marshal`) that is
+    rebuilt into a tree without parsing or validating it again. Cache files
+    hold no code: widget classes are resolved through `registry`.
+
+    - path: `str` - the JSON file
+    - cache_dir: `str | None` - directory of the cache, or `None` not to
+        use one
+
+    Returns: `tuple[W | MenuItem]`
+
+    Raises: `SpecError` if the file is not a valid tree
+
+    Usage:
+    >>> window /= load("layouts/main.json")
+    >>> row = compile(load("layouts/row.json"))  # with "$param" options
+    """
+    with open(path, "rb") as f:
+        content = f.read()
+    if cache_dir is None:
+        return loads(content)
+    cached = os.path.join(cache_dir, _cache_key(content) + ".tkt")
+    try:
+        return _read_cache(cached)
+    except Exception:  # missing, damaged or written by another version: parse again
+        pass
+    tree = loads(content)
+    try:
+        _write_cache(cached, tree)
+    except (OSError, ValueError, KeyError, SpecError):
+        pass  # the tree is still usable, it is only parsed again next time
+    return tree
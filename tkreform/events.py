@@ -1,4 +1,4 @@
-from typing import Tuple, Union
+from typing import Optional, Tuple, Union
 
 DETAIL = 1
 TYPE = 2
@@ -26,14 +26,21 @@ class Event:
     def __init__(self, *eventdata: Tuple[str, str, int]) -> None:
         _eventdata = set(eventdata)
         self._ed = sorted(_eventdata, key=lambda x: (-x[2], x[1]))
+        # events are immutable, their strings are built once
+        self._literal: Optional[str] = None
+        self._event: Optional[str] = None
 
     @property
     def literal(self):
-        return KEY_LITERAL_SEP.join(x[0] for x in self._ed if x[0])
+        if self._literal is None:
+            self._literal = KEY_LITERAL_SEP.join(x[0] for x in self._ed if x[0])
+        return self._literal
 
     @property
     def event(self):
-        return f"<{'-'.join(x[1] for x in self._ed if x[1])}>"
+        if self._event is None:
+            self._event = f"<{'-'.join(x[1] for x in self._ed if x[1])}>"
+        return self._event
 
     def __str__(self) -> str:
         return self.event
@@ -44,6 +51,9 @@ class Event:
     def __hash__(self):
         return hash(self.event)
 
+    def __eq__(self, other: object):
+        return isinstance(other, Event) and self.event == other.event
+
     def __add__(self, other: Union["Event", int, str]):
         if not isinstance(other, Event):
             _other = str(other)
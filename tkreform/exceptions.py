@@ -8,3 +8,11 @@ class MessageNotFound(Exception):
 
 class MenuNotBinded(Exception):
     pass
+
+
+class SpecError(Exception):
+    pass
+
+
+class ScriptReadError(Exception):
+    pass
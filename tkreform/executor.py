@@ -0,0 +1,234 @@
+"""
+TkReform background jobs.
+
+`Job` runs a function in a thread or process pool and delivers its result,
+error and progress to callbacks in the Tcl thread, through the call queue
+of the window (see `Window.run_in_executor`).
+
+Example:
+>>> def download(url, progress):
+...     for n, chunk in enumerate(fetch(url)):
+...         if progress.cancelled:
+...             return None
+...         progress(n)
+...     return data
+>>> job = window.run_in_executor(
+...     download, url, on_done=show, on_progress=bar.set, owner=panel
+... )
+>>> job.cancel()  # or destroy `panel`
+"""
+
+from concurrent.futures import Executor, Future
+import itertools
+import sys
+import threading
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional
+
+from tkreform.calls import CallQueue, when_destroyed
+
+if TYPE_CHECKING:
+    from tkreform.base import Widget
+
+_ids = itertools.count()
+
+
+def _is_process_pool(executor: Executor) -> bool:
+    # without importing concurrent.futures.process (and multiprocessing):
+    # no process pool exists until it is imported
+    process = sys.modules.get("concurrent.futures.process")
+    return process is not None and isinstance(executor, process.ProcessPoolExecutor)
+
+
+class Job:
+    """Function running in an executor, reporting back to the Tcl thread."""
+    def __init__(
+        self, calls: CallQueue,
+        on_done: Optional[Callable[[Any], Any]] = None,
+        on_error: Optional[Callable[[BaseException], Any]] = None,
+        on_progress: Optional[Callable[[Any], Any]] = None
+    ) -> None:
+        self.calls = calls
+        self.on_done = on_done
+        self.on_error = on_error
+        self.on_progress = on_progress
+        self.future: Optional["Future[Any]"] = None
+        self.owner: Optional["Widget"] = None
+        self._cancelled = threading.Event()
+
+    @property
+    def cancelled(self) -> bool:
+        """Whether the job was cancelled; workers may check it to stop early."""
+        return self._cancelled.is_set()
+
+    @property
+    def done(self) -> bool:
+        """Whether the function finished running (or never will)."""
+        return self.future is not None and self.future.done()
+
+    def cancel(self):
+        """
+        Cancel the job: it does not start if it did not yet, and none of its
+        callbacks is called any more.
+        """
+        self._cancelled.set()
+        if self.future is not None:
+            self.future.cancel()
+        self._detach()
+
+    def __call__(self, value: Any):
+        """Report progress, from the worker."""
+        if self.on_progress is not None and not self.cancelled:
+            self.calls.put(self._progress, value)
+
+    def _progress(self, value: Any):
+        if not self.cancelled and self.on_progress is not None:
+            self.on_progress(value)
+
+    def _finished(self, fut: "Future[Any]"):
+        # in the worker thread (or the executor's management thread)
+        if not fut.cancelled():
+            self.calls.put(self._deliver, fut)
+
+    def _deliver(self, fut: "Future[Any]"):
+        self._detach()
+        if self.cancelled:
+            return
+        error = fut.exception()
+        if error is None:
+            if self.on_done is not None:
+                self.on_done(fut.result())
+        elif self.on_error is not None:
+            self.on_error(error)
+        else:
+            self.calls.widget._root().report_callback_exception(
+                type(error), error, error.__traceback__
+            )
+
+    def _detach(self):
+        if self.owner is not None:
+            if self.owner._jobs is not None:
+                self.owner._jobs.discard(self)
+            self.owner = None
+
+
+class _RemoteProgress:
+    """Progress reporter of jobs running in another process."""
+    def __init__(self, queue: Any, id: int) -> None:
+        self.queue = queue
+        self.id = id
+
+    @property
+    def cancelled(self) -> bool:
+        # cancellation is not forwarded to other processes
+        return False
+
+    def __call__(self, value: Any):
+        self.queue.put((self.id, value))
+
+
+_remote_jobs: Dict[int, Job] = {}
+_remote_manager: Any = None
+_remote_queue: Any = None
+# roots of the interpreters using the manager, shut down with the last one
+_remote_users = 0
+_remote_lock = threading.Lock()
+# sent after the progress of a job, once it finished
+_FINISHED = "<finished>"
+
+
+def _remote_progress(job: Job):
+    global _remote_manager, _remote_queue, _remote_users
+    root = job.calls.widget._root()
+    with _remote_lock:
+        if _remote_queue is None:
+            import multiprocessing
+            _remote_manager = multiprocessing.Manager()
+            _remote_queue = _remote_manager.Queue()
+            threading.Thread(
+                target=_forward_progress, args=(_remote_queue, ), daemon=True
+            ).start()
+        if not getattr(root, "_tkreform_remote", False):
+            root._tkreform_remote = True  # type: ignore
+            _remote_users += 1
+            when_destroyed(root, _release_manager)
+    id = next(_ids)
+    _remote_jobs[id] = job
+    return _RemoteProgress(_remote_queue, id)
+
+
+def _release_manager():
+    global _remote_manager, _remote_queue, _remote_users
+    with _remote_lock:
+        _remote_users -= 1
+        if _remote_users or _remote_manager is None:
+            return
+        manager, _remote_manager, _remote_queue = _remote_manager, None, None
+    manager.shutdown()
+
+
+def _remote_finished(progress: _RemoteProgress):
+    # queued behind the progress the worker reported, so none is dropped
+    try:
+        progress.queue.put((progress.id, _FINISHED))
+    except (EOFError, OSError):  # manager shut down
+        _remote_jobs.pop(progress.id, None)
+
+
+def _forward_progress(queue: Any):
+    while True:
+        try:
+            id, value = queue.get()
+        except (EOFError, OSError):  # manager shut down
+            return
+        if isinstance(value, str) and value == _FINISHED:
+            job = _remote_jobs.pop(id, None)
+            if job is not None and job.future is not None:
+                job._finished(job.future)
+            continue
+        job = _remote_jobs.get(id)
+        if job is not None:
+            job(value)
+
+
+def submit(
+    executor: Executor, calls: CallQueue, fn: Callable[..., Any], *args: Any,
+    on_done: Optional[Callable[[Any], Any]] = None,
+    on_error: Optional[Callable[[BaseException], Any]] = None,
+    on_progress: Optional[Callable[[Any], Any]] = None,
+    owner: Optional["Widget"] = None
+) -> Job:
+    """
+    Run a function in an executor, with callbacks run through a call queue.
+
+    - executor: `Executor` - thread or process pool
+    - calls: `CallQueue` - queue of the Tcl thread
+    - fn: `func: (*args) -> Any` - the function; with `on_progress`, it also
+        gets a `progress` keyword argument, to be called with progress
+        values, whose `cancelled` attribute tells whether to stop
+    - *args - its arguments
+    - on_done: `func: (result) -> Any` - called with the result
+    - on_error: `func: (BaseException) -> Any` - called with the exception
+        raised, which is reported as a callback exception otherwise
+    - on_progress: `func: (value) -> Any` - called with progress values
+    - owner: `Widget | None` - cancel the job when this widget is destroyed
+
+    Returns: `Job`
+    """
+    job = Job(calls, on_done, on_error, on_progress)
+    if owner is not None:
+        owner._adopt(job)
+    kwargs = {}
+    if on_progress is not None:
+        if _is_process_pool(executor):
+            kwargs["progress"] = _remote_progress(job)
+        else:
+            kwargs["progress"] = job
+    job.future = executor.submit(fn, *args, **kwargs)
+    progress = kwargs.get("progress")
+    if isinstance(progress, _RemoteProgress):
+        # the result is delivered after the last progress, by the forwarder
+        job.future.add_done_callback(lambda _: _remote_finished(progress))
+    else:
+        job.future.add_done_callback(job._finished)
+    return job
+
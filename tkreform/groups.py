@@ -1,5 +1,5 @@
 import tkinter
-from typing import Any, Callable, Dict, List, Tuple, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 from tkreform.base import Widget, Window
 from tkreform.declarative import Gridder
@@ -14,21 +14,117 @@ class Group:
 
 
 class ActionGroup(Group):
-    _contents: Tuple[Union["ActionGroup", Widget, Window]]
+    """
+    Group sharing event handlers between its members.
+
+    Member widgets get one shared bind tag, so that every event sequence is
+    bound once whatever the number of members, and events are dispatched to
+    the handlers through a table of member paths. The shared tag comes first
+    in the bind tags of a member, so that its own bindings returning "break"
+    do not stop the group handlers; these run before them. Windows are bound
+    directly, as their bindings also apply to their sub widgets.
+    """
+    _contents: Tuple[Union["ActionGroup", Widget, Window], ...]
 
     def __init__(self, *ct: Union["ActionGroup", Widget, Window]) -> None:
         self._calls: Dict[str, List[Callable[[tkinter.Event], Any]]] = {}
+        self._tag = f"ActionGroup{id(self)}"
+        self._members: Dict[str, Widget] = {}
+        self._windows: List[Window] = []
+        self._outer: List["ActionGroup"] = []
+        # any member, to reach the interpreter when binding the tag
+        self._anchor: Optional[tkinter.Misc] = None
         super().__init__(*ct)
+        for co in ct:
+            self._join(co)
+
+    def add(self, *ct: Union["ActionGroup", Widget, Window]):
+        """
+        Add members to the group, without binding anything again.
+
+        - *ct: `ActionGroup | Widget | Window` - the new members
+        """
+        self._contents += ct
+        for co in ct:
+            self._join(co)
+
+    def remove(self, *ct: Union["ActionGroup", Widget, Window]):
+        """
+        Remove members from the group, without binding anything again.
+
+        - *ct: `ActionGroup | Widget | Window` - the members to remove
+        """
+        self._contents = tuple(co for co in self._contents if co not in ct)
+        for co in ct:
+            self._leave(co)
+
+    def _flat(self) -> List[Union[Widget, Window]]:
+        return list(self._members.values()) + self._windows
+
+    def _join(self, co: Union["ActionGroup", Widget, Window]):
+        if isinstance(co, ActionGroup):
+            co._outer.append(self)
+            for m in co._flat():
+                self._join(m)
+            return
+        if isinstance(co, Window):
+            if co not in self._windows:
+                self._windows.append(co)
+                for seq in self._calls:
+                    self._bind_window(co, seq)
+        elif self._members.get(str(co.base)) is not co:
+            # a widget re-created, or reused from a pool, under the path of
+            # a destroyed member joins again
+            self._members[str(co.base)] = co
+            tags = co.base.bindtags()
+            if self._tag not in tags:
+                co.base.bindtags((self._tag, ) + tags)
+            if self._anchor is None:
+                self._anchor = co.base
+                for seq in self._calls:
+                    self._bind_tag(seq)
+        for outer in self._outer:
+            outer._join(co)
+
+    def _leave(self, co: Union["ActionGroup", Widget, Window]):
+        if isinstance(co, ActionGroup):
+            co._outer.remove(self)
+            for m in co._flat():
+                if m not in self._contents:
+                    self._leave(m)
+            return
+        if isinstance(co, Window):
+            if co in self._windows:
+                self._windows.remove(co)
+        elif self._members.pop(str(co.base), None) is not None:
+            co.base.bindtags(tuple(t for t in co.base.bindtags() if t != self._tag))
+        for outer in self._outer:
+            if co not in outer._contents:
+                outer._leave(co)
+
+    def _bind_tag(self, seq: str):
+        if self._anchor is not None:
+            self._anchor.bind_class(self._tag, seq, lambda e: self._dispatch(seq, e))
+
+    def _bind_window(self, win: Window, seq: str):
+        def call(event: tkinter.Event):
+            if win in self._windows:
+                for ca in self._calls[seq]:
+                    ca(event)
+
+        win.on(seq, append=True)(call)
+
+    def _dispatch(self, seq: str, event: tkinter.Event):
+        if str(event.widget) in self._members:
+            for ca in self._calls[seq]:
+                ca(event)
 
     def _setup_dict(self, seq: str):
         if seq not in self._calls:
-            for co in self._contents:
-                def call(event: tkinter.Event):
-                    for ca in self._calls[seq]:
-                        ca(event)
-
-                co.on(seq, append=True)(call)
             self._calls[seq] = []
+            self._bind_tag(seq)
+            for win in self._windows:
+                self._bind_window(win, seq)
 
     def on(self, seq: str, append: bool = False):
         self._setup_dict(seq)
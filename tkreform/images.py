@@ -0,0 +1,282 @@
+"""
+TkReform shared image cache.
+
+Images set by path (`Widget.image = "icon.png"`, `Window.xicon("app.png")`)
+are decoded once per path, size and mode and shared by every widget using
+them. Each widget holds a reference to its image until it gets another one
+or is destroyed; images no longer referenced are kept, least recently used
+first out, within a byte budget.
+
+With PIL, `Widget.load_image` decodes and resizes images in worker threads
+of `loader`, showing a placeholder meanwhile; only the final `PhotoImage`
+is created in the Tcl thread. Images of visible widgets are decoded first,
+and loads are cancelled for widgets destroyed meanwhile.
+
+Example:
+>>> from tkreform.images import images
+>>> images.budget = 32 << 20
+>>> button.image = "icons/save.png"
+>>> images.hit_rate, images.bytes
+>>> thumb.load_image("photos/1.jpg", size=(128, 96), placeholder="blank.png")
+"""
+
+from collections import OrderedDict
+from concurrent.futures import Future
+from functools import lru_cache
+import itertools
+import queue
+import threading
+import tkinter as tk
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
+
+from tkreform.calls import CallQueue
+from tkreform.executor import Job
+from tkreform.trace import unwrap
+
+if TYPE_CHECKING:
+    from tkreform.base import Widget
+
+ImageKey = Tuple[str, Optional[Tuple[int, int]], Optional[str], Any]
+
+
+@lru_cache(maxsize=None)
+def has_pil() -> bool:
+    """Whether PIL is available, to decode images off the Tcl thread."""
+    try:
+        from PIL import Image, ImageTk  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def _decode(path: str, size: Optional[Tuple[int, int]], mode: Optional[str]):
+    # PIL only, safe in any thread
+    from PIL import Image
+    with Image.open(path) as im:
+        out = im.convert(mode) if mode is not None else im
+        if size is not None:
+            out = out.resize(size)
+        if out is im:
+            out = im.copy()
+        return out
+
+
+def _photo(path: str, size: Optional[Tuple[int, int]], mode: Optional[str], master: tk.Misc):
+    if not has_pil():
+        if size is not None or mode is not None:
+            raise ValueError("resizing or converting images requires PIL.")
+        return tk.PhotoImage(file=path, master=master)
+    from PIL import ImageTk
+    return ImageTk.PhotoImage(_decode(path, size, mode), master=master)
+
+
+class _Entry:
+    def __init__(self, image: Any) -> None:
+        self.image = image
+        self.refs = 0
+        # RGBA pixels as held by Tk
+        self.bytes = image.width() * image.height() * 4
+
+
+class ImageCache:
+    """Reference counted image cache, with an LRU byte budget."""
+    def __init__(self, budget: int = 64 << 20) -> None:
+        """
+        - budget: `int` - bytes of images kept at most while no widget
+            uses them; images in use are never dropped
+        """
+        self.budget = budget
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.bytes = 0
+        """Bytes of every image held, in use or not."""
+        self._entries: Dict[ImageKey, _Entry] = {}
+        # images no widget uses, least recently released first
+        self._unused: "OrderedDict[ImageKey, None]" = OrderedDict()
+        self._unused_bytes = 0
+
+    @property
+    def size(self) -> int:
+        """The number of images held."""
+        return len(self._entries)
+
+    @property
+    def hit_rate(self) -> float:
+        """The ratio of requests answered without decoding."""
+        requests = self.hits + self.misses
+        return self.hits / requests if requests else 0.0
+
+    def __contains__(self, key: ImageKey):
+        return key in self._entries
+
+    def acquire(
+        self, path: str, master: tk.Misc, size: Optional[Tuple[int, int]] = None,
+        mode: Optional[str] = None
+    ):
+        """
+        Get the image of a file, and hold a reference to it.
+
+        - path: `str` - image file
+        - master: `WindowType | WidgetType` - widget of the interpreter the
+            image is used in
+        - size: `tuple[int, int] | None` - resize the image (requires PIL)
+        - mode: `str | None` - convert the image to a PIL mode, such as
+            `"RGBA"` or `"L"` (requires PIL)
+
+        Returns: `(ImageKey, PhotoImage)`, the key to `release` the image
+        """
+        key = (path, size, mode, unwrap(master.tk))
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            entry = self._entries[key] = _Entry(_photo(path, size, mode, master))
+            self.bytes += entry.bytes
+        else:
+            self.hits += 1
+            if key in self._unused:
+                del self._unused[key]
+                self._unused_bytes -= entry.bytes
+        entry.refs += 1
+        return key, entry.image
+
+    def add(self, key: ImageKey, image: Any):
+        """
+        Keep an image decoded elsewhere, and hold a reference to it (or to
+        the image cached meanwhile under the same key).
+
+        - key: `ImageKey` - its key
+        - image: `PhotoImage` - the image
+
+        Returns: `(ImageKey, PhotoImage)`, the key to `release` the image
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            entry = self._entries[key] = _Entry(image)
+            self.bytes += entry.bytes
+        else:
+            self.hits += 1
+            if key in self._unused:
+                del self._unused[key]
+                self._unused_bytes -= entry.bytes
+        entry.refs += 1
+        return key, entry.image
+
+    def release(self, key: ImageKey):
+        """
+        Drop a reference to an image.
+
+        - key: `ImageKey` - the key `acquire` returned
+        """
+        entry = self._entries.get(key)
+        if entry is None or entry.refs <= 0:
+            return
+        entry.refs -= 1
+        if entry.refs == 0:
+            self._unused[key] = None
+            self._unused_bytes += entry.bytes
+            self._evict()
+
+    def clear(self):
+        """Drop every image no widget uses."""
+        budget, self.budget = self.budget, 0
+        self._evict()
+        self.budget = budget
+
+    def _evict(self):
+        while self._unused and self._unused_bytes > self.budget:
+            key, _ = self._unused.popitem(last=False)
+            entry = self._entries.pop(key)
+            self._unused_bytes -= entry.bytes
+            self.bytes -= entry.bytes
+            self.evictions += 1
+
+
+images = ImageCache()
+"""The image cache shared by every window / widget."""
+
+
+class ImageLoader:
+    """Worker threads decoding images with PIL, visible widgets first."""
+    VISIBLE = 0
+    HIDDEN = 1
+
+    def __init__(self, workers: int = 2) -> None:
+        """
+        - workers: `int` - number of worker threads, started when needed
+        """
+        self.workers = workers
+        self._queue: "queue.PriorityQueue[Tuple[int, int, Future[Any], Callable[[], Any]]]" = \
+            queue.PriorityQueue()
+        self._seq = itertools.count()
+        self._threads: List[threading.Thread] = []
+
+    def submit(
+        self, calls: CallQueue, fn: Callable[[], Any], priority: int,
+        on_done: Callable[[Any], Any], owner: Optional["Widget"] = None
+    ) -> Job:
+        """
+        Run a function in a worker, lower priorities first.
+
+        - calls: `CallQueue` - queue of the Tcl thread
+        - fn: `func: () -> Any` - the function
+        - priority: `int` - `VISIBLE`, `HIDDEN` or any other number
+        - on_done: `func: (result) -> Any` - called in the Tcl thread
+        - owner: `Widget | None` - cancel the job when this widget is
+            destroyed
+
+        Returns: `Job`
+        """
+        job = Job(calls, on_done)
+        if owner is not None:
+            owner._adopt(job)
+        job.future = Future()
+        job.future.add_done_callback(job._finished)
+        self._queue.put((priority, next(self._seq), job.future, fn))
+        if len(self._threads) < self.workers:
+            thread = threading.Thread(target=self._work, daemon=True)
+            self._threads.append(thread)
+            thread.start()
+        return job
+
+    def _work(self):
+        while True:
+            _, _, fut, fn = self._queue.get()
+            if not fut.set_running_or_notify_cancel():
+                continue  # cancelled before it started
+            try:
+                fut.set_result(fn())
+            except BaseException as e:
+                fut.set_exception(e)
+
+    def load(
+        self, widget: "Widget", calls: CallQueue, path: str,
+        size: Optional[Tuple[int, int]] = None, mode: Optional[str] = None
+    ) -> Job:
+        """
+        Decode an image for a widget, and set it once decoded.
+
+        - widget: `Widget` - the widget
+        - calls: `CallQueue` - queue of the Tcl thread
+        - path: `str` - image file
+        - size: `tuple[int, int] | None` - resize the image
+        - mode: `str | None` - convert the image to a PIL mode
+
+        Returns: `Job`
+        """
+        key = (path, size, mode, unwrap(widget.base.tk))
+
+        def done(decoded: Any):
+            from PIL import ImageTk
+            widget._use_image(*images.add(key, ImageTk.PhotoImage(decoded, master=widget.base)))
+
+        visible = widget.base.winfo_viewable()
+        return self.submit(
+            calls, lambda: _decode(path, size, mode),
+            self.VISIBLE if visible else self.HIDDEN, done, widget
+        )
+
+
+loader = ImageLoader()
+"""The image loader shared by every widget."""
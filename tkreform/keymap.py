@@ -0,0 +1,197 @@
+"""
+TkReform compiled keymaps.
+
+`Keymap` dispatches keyboard shortcuts built with `tkreform.events` from a
+single `<KeyPress>` binding of the window: every shortcut is compiled once
+to a (modifiers, keysym) stroke, and key presses are resolved by a hash
+lookup, walking a trie for multi-stroke chords. Binding, rebinding and
+scoping shortcuts to widgets only changes the tables, not Tcl bindings.
+
+Example:
+>>> from tkreform.events import CTRL, SHIFT
+>>> keys = window.keymap
+>>> keys.bind(CTRL + "s")(save)
+>>> keys.bind(CTRL + "k", CTRL + "s")(save_all)  # chord
+>>> keys.bind(CTRL + SHIFT + "f", scope=editor)(find_in_selection)
+"""
+
+import sys
+import tkinter as tk
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from tkreform.events import DETAIL, MODIFIER, TYPE, Event
+
+Stroke = Tuple[int, str]
+Handler = Callable[[tk.Event], Any]
+
+_SHIFT = 0x1
+_CONTROL = 0x4
+if sys.platform == "win32":
+    _ALT = 0x20000
+elif sys.platform == "darwin":
+    _ALT = 0x10
+else:
+    _ALT = 0x8  # Mod1
+_MASK = _SHIFT | _CONTROL | _ALT
+# Lock is left out: shortcuts work whether Caps Lock is on or not
+_MODIFIERS = {"Shift": _SHIFT, "Control": _CONTROL, "Alt": _ALT, "Lock": 0}
+_MODIFIER_KEYS = {
+    "Shift_L", "Shift_R", "Control_L", "Control_R", "Alt_L", "Alt_R",
+    "Meta_L", "Meta_R", "Super_L", "Super_R", "Caps_Lock", "ISO_Level3_Shift",
+}
+
+
+def _keysym(name: str) -> str:
+    # Shift + letter reports the upper case keysym
+    return name.lower() if len(name) == 1 else name
+
+
+def stroke(ev: Union[Event, str]) -> Stroke:
+    """
+    Compile a key event to the stroke it is resolved by.
+
+    - ev: `Event | str` - the key event, such as `CTRL + "s"`, or a keysym
+
+    Returns: `(modifier mask, keysym)`
+    """
+    if isinstance(ev, str):
+        return 0, _keysym(ev)
+    mask = 0
+    keysym = None
+    for _, name, ord in ev._ed:
+        if ord == MODIFIER:
+            mask |= _MODIFIERS[name]
+        elif ord == DETAIL:
+            keysym = name
+        elif ord == TYPE and name in ("Key", "KeyPress"):
+            continue
+        elif ord == TYPE and name[:1] == "F" and name[1:].isdigit():
+            keysym = name
+        else:
+            raise ValueError(f"keymaps only resolve key presses, not {ev.event}.")
+    if keysym is None:
+        raise ValueError(f"no key in {ev.event}.")
+    return mask, _keysym(keysym)
+
+
+class Keymap:
+    """Shortcut tables of a window, resolved from one binding."""
+    def __init__(self, widget: tk.Misc, timeout: int = 1500) -> None:
+        """
+        - widget: `WindowType` - the window, whose widgets get the
+            shortcuts (the ones of other toplevel windows don't)
+        - timeout: `int` - ms to wait for the next stroke of a chord
+        """
+        self.widget = widget
+        self.timeout = timeout
+        self.hits = 0
+        self.misses = 0
+        # trie of strokes per scope path: a node maps strokes to handlers,
+        # or to the nodes of the next strokes
+        self._scopes: Dict[str, Dict[Stroke, Any]] = {}
+        self._pending: Optional[Dict[Stroke, Any]] = None
+        self._chord = 0
+        widget.bind("<KeyPress>", self._dispatch, "+")
+
+    def bind(self, *strokes: Union[Event, str], scope: Any = None):
+        """
+        Bind a shortcut, replacing the former one.
+
+        - *strokes: `Event | str` - the key event, or the successive key
+            events of a chord
+        - scope: `Widget | WidgetType | None` - only when the focus is in
+            this widget (or its descendants); shortcuts of inner scopes win
+
+        Returns: `Wrapper(func: (Event) -> Any)`
+        """
+        keys = [stroke(s) for s in strokes]
+        if not keys:
+            raise ValueError("a shortcut needs at least one stroke.")
+
+        def __wrapper(func: Handler):
+            node = self._scopes.setdefault(self._path(scope), {})
+            for key in keys[:-1]:
+                node = node.setdefault(key, {})
+                if not isinstance(node, dict):
+                    raise ValueError(f"{strokes} extends a bound shortcut.")
+            if isinstance(node.get(keys[-1]), dict):
+                raise ValueError(f"{strokes} is the prefix of a bound chord.")
+            node[keys[-1]] = func
+            return func
+        return __wrapper
+
+    def unbind(self, *strokes: Union[Event, str], scope: Any = None):
+        """
+        Remove a shortcut, or every chord starting with the strokes.
+
+        - *strokes: `Event | str` - the key events
+        - scope: `Widget | WidgetType | None` - the scope it was bound in
+        """
+        keys = [stroke(s) for s in strokes]
+        node = self._scopes.get(self._path(scope))
+        for key in keys[:-1]:
+            node = node.get(key) if isinstance(node, dict) else None
+        if isinstance(node, dict):
+            node.pop(keys[-1], None)
+        self._pending = None
+
+    def clear(self, scope: Any = None):
+        """
+        Remove every shortcut of a scope.
+
+        - scope: `Widget | WidgetType | None` - the scope
+        """
+        self._scopes.pop(self._path(scope), None)
+        self._pending = None
+
+    def _path(self, scope: Any) -> str:
+        if scope is None:
+            return str(self.widget)
+        return str(getattr(scope, "base", scope))
+
+    def _scopes_of(self, path: str) -> List[Dict[Stroke, Any]]:
+        out = []
+        root = str(self.widget)
+        while True:
+            node = self._scopes.get(path)
+            if node is not None:
+                out.append(node)
+            if path == root or "." not in path:
+                break
+            path = path.rsplit(".", 1)[0] or "."
+        return out
+
+    @staticmethod
+    def _lookup(node: Dict[Stroke, Any], key: Stroke):
+        found = node.get(key)
+        if found is None and key[0] & _SHIFT:
+            # Shift that only picks the symbol, as in "plus" or "question"
+            found = node.get((key[0] & ~_SHIFT, key[1]))
+        return found
+
+    def _dispatch(self, event: tk.Event):
+        keysym = event.keysym
+        if keysym in _MODIFIER_KEYS:
+            return None
+        key = (int(event.state) & _MASK, _keysym(keysym))
+        pending, self._pending = self._pending, None
+        nodes = [pending] if pending is not None else []
+        nodes += self._scopes_of(str(event.widget))
+        for node in nodes:
+            found = self._lookup(node, key)
+            if found is None:
+                continue
+            self.hits += 1
+            if isinstance(found, dict):
+                self._pending = found
+                self._chord += 1
+                self.widget.after(self.timeout, self._expire, self._chord)
+            else:
+                found(event)
+            return "break"
+        self.misses += 1
+        return None
+
+    def _expire(self, chord: int):
+        if chord == self._chord:
+            self._pending = None
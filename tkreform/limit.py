@@ -0,0 +1,118 @@
+"""
+TkReform event rate limiting.
+
+`Limiter` wraps an event handler so that bursts of high-frequency events
+(`<Motion>`, `<Configure>`, `<MouseWheel>`, ...) collapse to the latest
+event. It is usually created through `on(seq, throttle=..., debounce=...,
+coalesce=...)` of windows / widgets.
+
+Example:
+>>> @canvas.on("<Configure>", debounce=100)
+... def relayout(event):
+...     ...
+>>> canvas.limiters["<Configure>"][-1].dropped
+"""
+
+import math
+import sys
+import time
+import tkinter as tk
+from typing import Any, Callable, Optional
+
+if sys.version_info >= (3, 8):
+    from typing import Literal
+else:
+    from typing_extensions import Literal
+
+
+class Limiter:
+    """Event handler wrapper running the handler at a limited rate."""
+    def __init__(
+        self, widget: tk.Misc, func: Callable[[tk.Event], Any],
+        throttle: Optional[int] = None, debounce: Optional[int] = None,
+        coalesce: Optional[Literal["idle"]] = None
+    ) -> None:
+        """
+        Exactly one of `throttle`, `debounce` and `coalesce` must be given.
+
+        - widget: `WindowType | WidgetType` - widget used for scheduling
+        - func: `func: (Event) -> Any` - the handler
+        - throttle: `int | None` - run at most once every `throttle` ms, with
+            the latest event (the first of a burst runs at once)
+        - debounce: `int | None` - run once the events stop for `debounce`
+            ms, with the latest event
+        - coalesce: `Literal["idle"] | None` - run once when idle, with the
+            latest event
+
+        A pending run must be cancelled (`cancel`) when the widget is
+        destroyed, as `on` of windows / widgets does.
+        """
+        if sum(x is not None for x in (throttle, debounce, coalesce)) != 1:
+            raise ValueError(
+                "exactly one of 'throttle', 'debounce' and 'coalesce' is required."
+            )
+        self.widget = widget
+        self.func = func
+        self.throttle = throttle
+        self.debounce = debounce
+        self.coalesce = coalesce
+        self.received = 0
+        self.handled = 0
+        self._event: Optional[tk.Event] = None
+        # `after` id of the pending run
+        self._job: Optional[str] = None
+        # when the handler may run next (throttle), or should run (debounce)
+        self._deadline = 0.0
+
+    @property
+    def dropped(self) -> int:
+        """The number of events merged into later ones."""
+        return self.received - self.handled - (self._event is not None)
+
+    def __call__(self, event: tk.Event):
+        self.received += 1
+        now = time.perf_counter()
+        if self.throttle is not None:
+            if self._job is None and now >= self._deadline:
+                self._deadline = now + self.throttle / 1000
+                self.handled += 1
+                return self.func(event)
+            self._event = event
+            self._schedule(self._deadline - now)
+        elif self.debounce is not None:
+            self._event = event
+            self._deadline = now + self.debounce / 1000
+            self._schedule(self.debounce / 1000)
+        else:
+            self._event = event
+            if self._job is None:
+                self._job = self.widget.after_idle(self._fire)
+
+    def cancel(self):
+        """Drop the pending run, if any, and the event it would get."""
+        job, self._job = self._job, None
+        self._event = None
+        if job is not None:
+            try:
+                self.widget.after_cancel(job)
+            except tk.TclError:  # the interpreter is gone
+                pass
+
+    def _schedule(self, delay: float):
+        # a pending timer is not cancelled by new events: when it fires too
+        # early, it is scheduled again for the rest of the delay
+        if self._job is None:
+            self._job = self.widget.after(max(0, math.ceil(delay * 1000)), self._fire)
+
+    def _fire(self):
+        self._job = None
+        if self.debounce is not None:
+            rest = self._deadline - time.perf_counter()
+            if rest > 0:
+                return self._schedule(rest)
+        elif self.throttle is not None:
+            self._deadline = time.perf_counter() + self.throttle / 1000
+        event, self._event = self._event, None
+        if event is not None:
+            self.handled += 1
+            self.func(event)
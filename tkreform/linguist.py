@@ -0,0 +1,259 @@
+"""
+TkReform translation.
+
+A linguist translates the texts of windows / widgets (window titles, widget
+`text` options) once it is set to `Window.linguist`: texts which are
+messages of its catalogs are shown in the current language, falling back
+through a chain of languages.
+
+Messages are looked up through the fallback chain once, then kept in a
+table reset per language switch; catalogs compiled with `tkreform.catalog`
+are only read for the messages looked up, and those of other languages are
+not opened to find the key of a text. The linguist also keeps an index from
+every message key to the widgets showing it, so that switching the language
+or patching a message reconfigures only the widgets whose text changes.
+
+Example:
+>>> en_US = Messages({"button.exit": "Exit"})
+>>> zh_CN = Messages({"button.exit": "退出"})
+>>> win.linguist = KVPairLinguist("en_US", ("en_US", ), en_US=en_US, zh_CN=zh_CN)
+>>> button.text = "Exit"  # or "button.exit"
+>>> win.linguist.language = "zh_CN"
+"""
+
+from abc import ABCMeta, abstractmethod
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Set, Tuple, Union
+from weakref import WeakKeyDictionary
+
+from tkreform.exceptions import MessageNotFound
+
+if TYPE_CHECKING:
+    from tkreform.base import _Base
+    from tkreform.catalog import MappedMessages
+
+
+class Messages(Dict[str, str]):
+    """Message catalog of one language, mapping message keys to texts."""
+    _reverse: Optional[Dict[str, str]] = None
+
+    # every change drops the reverse index, rebuilt when needed
+    def __setitem__(self, key: str, text: str):
+        super().__setitem__(key, text)
+        self._reverse = None
+
+    def __delitem__(self, key: str):
+        super().__delitem__(key)
+        self._reverse = None
+
+    def __ior__(self, other: Any):
+        self.update(other)
+        return self
+
+    def update(self, *args: Any, **kwargs: str):
+        super().update(*args, **kwargs)
+        self._reverse = None
+
+    def setdefault(self, key: str, default: str = "") -> str:
+        self._reverse = None
+        return super().setdefault(key, default)
+
+    def pop(self, key: str, *default: Any) -> Any:
+        self._reverse = None
+        return super().pop(key, *default)
+
+    def popitem(self) -> Tuple[str, str]:
+        self._reverse = None
+        return super().popitem()
+
+    def clear(self):
+        super().clear()
+        self._reverse = None
+
+    def key_of(self, text: str) -> Optional[str]:
+        """
+        Get the key of a message text.
+
+        - text: `str` - the text
+
+        Returns: `str | None`
+        """
+        if self._reverse is None:
+            self._reverse = {v: k for k, v in reversed(self.items())}
+        return self._reverse.get(text)
+
+
+Catalog = Union[Messages, "MappedMessages"]
+
+
+class Linguist(metaclass=ABCMeta):
+    """Base type of linguists, keeping track of the widgets they translate."""
+    def __init__(self) -> None:
+        # message key -> widget -> translated options
+        self._users: Dict[str, "WeakKeyDictionary[_Base, Set[str]]"] = {}
+
+    @abstractmethod
+    def key_of(self, text: str) -> Optional[str]:
+        """
+        Get the message key of a text.
+
+        - text: `str` - message key, or message in any language
+
+        Returns: `str | None`, `None` if the text is no message
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def lookup(self, key: str) -> str:
+        """
+        Get the message of a key in the current language.
+
+        - key: `str` - message key
+
+        Returns: `str`
+
+        Raises: `MessageNotFound` - no language of the chain has it
+        """
+        raise NotImplementedError
+
+    def translate(self, text: str) -> str:
+        """
+        Translate a text to the current language.
+
+        - text: `str` - message key, or message in any language
+
+        Returns: `str`
+
+        Raises: `MessageNotFound` - the text is no message
+        """
+        key = self.key_of(text)
+        if key is None:
+            raise MessageNotFound(f"no message for {text!r}.")
+        return self.lookup(key)
+
+    def attach(self, widget: "_Base", option: str, key: str):
+        """Note that an option of a widget shows a message."""
+        self._users.setdefault(key, WeakKeyDictionary()).setdefault(widget, set()).add(option)
+
+    def detach(self, widget: "_Base", option: str, key: str):
+        """Note that an option of a widget no longer shows a message."""
+        users = self._users.get(key)
+        if users is not None and widget in users:
+            users[widget].discard(option)
+            if not users[widget]:
+                del users[widget]
+
+    def _changed(self, keys: Iterable[str]):
+        # reconfigure the widgets showing these messages
+        for key in keys:
+            for widget, options in list(self._users.get(key, {}).items()):
+                for option in tuple(options):
+                    widget._retranslate(option)
+
+
+class KVPairLinguist(Linguist):
+    """
+    Linguist of key-value catalogs; texts may be given by message key, or as
+    the message itself in any of the languages.
+    """
+    def __init__(self, language: str, fallbacks: Tuple[str, ...] = (), **catalogs: Catalog) -> None:
+        """
+        - language: `str` - current language
+        - fallbacks: `tuple[str]` - languages whose messages are used, in
+            this order, when the current one misses them
+        - **catalogs: `Messages | MappedMessages` - catalog of every language
+        """
+        super().__init__()
+        self.catalogs: Dict[str, Catalog] = catalogs
+        self.fallbacks = fallbacks
+        self._language = language
+        # messages and keys found so far
+        self._table: Dict[str, str] = {}
+        self._sources: Dict[str, str] = {}
+        self._chain: List[Catalog] = []
+        self._others: List[Catalog] = []
+        self._compile()
+
+    @property
+    def language(self) -> str:
+        """The current language; setting it retranslates affected widgets."""
+        return self._language
+
+    @language.setter
+    def language(self, language: str):
+        if language not in self.catalogs:
+            raise MessageNotFound(f"no catalog for language {language!r}.")
+        old = {k: self._find(k) for k in self._users}
+        self._language = language
+        self._compile()
+        self._changed([k for k, v in old.items() if v != self._find(k)])
+
+    @property
+    def chain(self) -> Tuple[str, ...]:
+        """The languages messages are looked up in, in order."""
+        return (self._language, ) + tuple(x for x in self.fallbacks if x != self._language)
+
+    def _compile(self):
+        chain = self.chain
+        self._chain = [self.catalogs[x] for x in chain if x in self.catalogs]
+        self._others = [c for x, c in self.catalogs.items() if x not in chain]
+        self._table = {}
+        self._sources = {}
+
+    def _find(self, key: str) -> Optional[str]:
+        try:
+            return self._table[key]
+        except KeyError:
+            pass
+        for catalog in self._chain:
+            text = catalog.get(key)
+            if text is not None:
+                self._table[key] = text
+                return text
+        return None
+
+    def key_of(self, text: str) -> Optional[str]:
+        try:
+            return self._sources[text]
+        except KeyError:
+            pass
+        key = text if self._find(text) is not None else None
+        for catalog in self._chain + self._others:
+            if key is not None:
+                break
+            # catalogs not read yet are left closed
+            if getattr(catalog, "loaded", True):
+                key = catalog.key_of(text)
+        # only messages are kept, so that the table is bounded by the
+        # catalogs, whatever texts are shown
+        if key is not None:
+            self._sources[text] = key
+        return key
+
+    def lookup(self, key: str) -> str:
+        text = self._find(key)
+        if text is None:
+            raise MessageNotFound(f"no message {key!r} in {', '.join(self.chain)}.")
+        return text
+
+    def patch(self, language: str, key: str, message: str):
+        """
+        Change one message, retranslating the widgets showing it.
+
+        - language: `str` - language of the catalog
+        - key: `str` - message key
+        - message: `str` - the new message
+        """
+        old = self._find(key)
+        replaced = self.catalogs[language].get(key) if language in self.catalogs else None
+        if language not in self.catalogs:
+            self.catalogs[language] = Messages()
+            self._compile()
+        self.catalogs[language][key] = message  # type: ignore
+        self._table.pop(key, None)
+        # the replaced text no longer stands for the key, unless another
+        # catalog still has it
+        if replaced is not None and self._sources.get(replaced) == key:
+            del self._sources[replaced]
+        self._sources.setdefault(message, key)
+        if self._find(key) != old:
+            self._changed((key, ))
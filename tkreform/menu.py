@@ -3,6 +3,8 @@ from tkreform.exceptions import MenuNotBinded
 
 
 class MenuItem:
+    __slots__ = ("type", "data", "base")
+
     def __init__(self, type: str, **kwargs):
         self.type = type
         self.data = kwargs
@@ -25,25 +27,35 @@ class MenuItem:
 
 
 class MenuCascade(MenuItem):
+    __slots__ = ()
+
     def __init__(self, **kwargs):
         super().__init__("cascade", **kwargs)
 
 
 class MenuCheckbutton(MenuItem):
+    __slots__ = ()
+
     def __init__(self, **kwargs):
         super().__init__("checkbutton", **kwargs)
 
 
 class MenuCommand(MenuItem):
+    __slots__ = ()
+
     def __init__(self, **kwargs):
         super().__init__("command", **kwargs)
 
 
 class MenuRadioButton(MenuItem):
+    __slots__ = ()
+
     def __init__(self, **kwargs):
         super().__init__("radiobutton", **kwargs)
 
 
 class MenuSeparator(MenuItem):
+    __slots__ = ()
+
     def __init__(self, **kwargs):
         super().__init__("separator", **kwargs)
@@ -0,0 +1,346 @@
+"""
+TkReform main loop monitoring.
+
+While a `Monitor` runs, the Python callbacks the Tcl event loop runs
+(event bindings, widget commands, protocol hooks, `after` jobs) are timed,
+input events are timed from the moment the X server stamped them to the
+start of their handler, and both are kept in rolling histograms. Only
+callbacks registered on the interpreter of the monitor since a monitor
+first ran there are timed: they are wrapped by a stand-in of that
+interpreter, given to its widgets while the monitor runs, so create the
+monitor before building the widgets. A watchdog thread, woken as callbacks start,
+samples the stack of the Tcl thread when one runs past a budget, so that
+stalls are reported with the code that was running, the callback and the
+widget path. It is usually created through `Window.monitor`.
+
+Example:
+>>> monitor = window.monitor(budgets=(16, 100), on_stall=print)
+>>> window /= build_ui()
+>>> window.loop()
+>>> monitor.durations.percentile(99), monitor.latency.percentile(50)
+>>> monitor.dump()
+"""
+
+from collections import deque
+import math
+import sys
+import threading
+import time
+import tkinter as tk
+import traceback
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+from tkreform.trace import callback_name, swap_interpreter
+
+# positions of %t and %W in tkinter's binding substitutions
+_TIME = 6
+_PATH = 14
+_MIN_EXP = -4  # 1e-4 ms
+_BINS = 96
+
+
+class Histogram:
+    """Histogram of the latest samples, in logarithmic bins (ms)."""
+    def __init__(self, window: int = 4096) -> None:
+        """
+        - window: `int` - number of latest samples kept
+        """
+        self.window = window
+        self.count = 0
+        """The number of samples ever added."""
+        self._samples: Deque[float] = deque()
+        self._bins = [0] * _BINS
+
+    @staticmethod
+    def _bin(ms: float) -> int:
+        # 8 bins per power of ten
+        if ms <= 0:
+            return 0
+        return max(0, min(_BINS - 1, int((math.log10(ms) - _MIN_EXP) * 8)))
+
+    def add(self, ms: float):
+        """Add a sample, dropping the oldest one if the window is full."""
+        self.count += 1
+        self._samples.append(ms)
+        self._bins[self._bin(ms)] += 1
+        if len(self._samples) > self.window:
+            self._bins[self._bin(self._samples.popleft())] -= 1
+
+    def __len__(self):
+        return len(self._samples)
+
+    def percentile(self, p: float) -> float:
+        """
+        Get a percentile of the latest samples, to the upper bound of its bin.
+
+        - p: `float` - the percentile, in 0 - 100
+
+        Returns: `float`, in ms (0 without samples)
+        """
+        total = len(self._samples)
+        if not total:
+            return 0.0
+        rank = p / 100 * total
+        seen = 0
+        for i, n in enumerate(self._bins):
+            seen += n
+            if n and seen >= rank:
+                return min(10 ** ((i + 1) / 8 + _MIN_EXP), max(self._samples))
+        return max(self._samples)
+
+    def dump(self) -> Dict[str, Any]:
+        """
+        Get the histogram as plain data.
+
+        Returns: `dict` - sample counts, percentiles and non-empty bins, as
+            `{upper bound in ms: count}`
+        """
+        return {
+            "count": self.count,
+            "window": len(self._samples),
+            "max": max(self._samples) if self._samples else 0.0,
+            **{f"p{p}": self.percentile(p) for p in (50, 90, 99, 99.9)},
+            "bins": {
+                round(10 ** ((i + 1) / 8 + _MIN_EXP), 6): n
+                for i, n in enumerate(self._bins) if n
+            },
+        }
+
+
+class Stall:
+    """A callback which ran past a budget."""
+    def __init__(
+        self, name: str, path: str, budget: float, start: float,
+        stack: Optional[List[str]] = None
+    ) -> None:
+        self.name = name
+        """The callback."""
+        self.path = path
+        """The widget path of the event or command, if any."""
+        self.budget = budget
+        """The largest budget (ms) it exceeded."""
+        self.start = start
+        self.duration = 0.0
+        """ms it ran, once it returned."""
+        self.stack = stack or []
+        """Where the Tcl thread was when the watchdog noticed the stall."""
+
+    def __repr__(self) -> str:
+        return (
+            f"Stall({self.name} on {self.path or '-'}: {self.duration:.1f} ms "
+            f"> {self.budget} ms)"
+        )
+
+    def format(self) -> str:
+        """The stall and its stack, as text."""
+        return "\n".join([repr(self)] + self.stack)
+
+
+class MonitoringTk:
+    """Interpreter stand-in, wrapping the callbacks registered for monitoring."""
+    def __init__(self, tk: Any) -> None:
+        """
+        - tk: `_tkinter.tkapp` - the interpreter
+        """
+        self.tk = tk
+        self.monitor: Optional["Monitor"] = None
+
+    def createcommand(self, name: str, func: Callable[..., Any]):
+        label = callback_name(func, name)
+        wrapper = getattr(func, "__self__", None)
+        if not isinstance(wrapper, tk.CallWrapper):
+            wrapper = None
+
+        def monitored(*args: Any):
+            monitor = self.monitor
+            if monitor is None:
+                return func(*args)
+            return monitor._run(label, wrapper, func, args)
+        monitored.__wrapped__ = func  # type: ignore
+        return self.tk.createcommand(name, monitored)
+
+    def __getattr__(self, name: str):
+        return getattr(self.tk, name)
+
+
+class Monitor:
+    """Callback timer and stall watchdog of the Tcl thread."""
+    def __init__(
+        self, widget: tk.Misc, budgets: Tuple[float, ...] = (16, 100),
+        on_stall: Optional[Callable[[Stall], Any]] = None, window: int = 4096
+    ) -> None:
+        """
+        - widget: `WindowType | WidgetType` - any widget of the interpreter
+        - budgets: `tuple[float]` - ms a callback may run; callbacks over
+            any of them are reported as stalls
+        - on_stall: `func: (Stall) -> Any | None` - called with every stall,
+            once its callback returned
+        - window: `int` - number of latest samples kept by the histograms
+        """
+        self.widget = widget._root()
+        self.budgets = tuple(sorted(budgets))
+        self.on_stall = on_stall
+        self.running = False
+        self.durations = Histogram(window)
+        """Callback run times (ms)."""
+        self.latency = Histogram(window)
+        """Input event to handler times (ms)."""
+        self.by_name: Dict[str, List[float]] = {}
+        """Count, total ms and max ms per callback."""
+        self.stalls: Deque[Stall] = deque(maxlen=100)
+        """The latest stalls."""
+        self._thread_id = threading.get_ident()
+        self._watchdog: Optional[threading.Thread] = None
+        # set as callbacks start, for the watchdog to wait on
+        self._heartbeat = threading.Event()
+        self._stopped = threading.Event()
+        # callback being run: (name, path, start), and its stall if noticed
+        self._current: Optional[Tuple[str, str, float]] = None
+        self._stall: Optional[Stall] = None
+        # the smallest X server time offset seen: the latency baseline
+        self._offset: Optional[float] = None
+
+    def start(self):
+        """
+        Start timing callbacks. A monitor started on an interpreter replaces
+        the one running there, if any.
+        """
+        if self.running:
+            return self
+        root = self.widget
+        proxy = getattr(root, "_tkreform_monitoring", None)
+        if proxy is None:
+            # one stand-in per interpreter, kept for the callbacks it wraps
+            proxy = root._tkreform_monitoring = MonitoringTk(root.tk)  # type: ignore
+        if proxy.monitor is not None:
+            proxy.monitor.stop()
+        if root.tk is not proxy:
+            proxy.tk = root.tk
+            swap_interpreter(root, proxy.tk, proxy)
+        proxy.monitor = self
+        self.running = True
+        self._thread_id = threading.get_ident()
+        self._stopped.clear()
+        self._heartbeat.clear()
+        self._watchdog = threading.Thread(target=self._watch, daemon=True)
+        self._watchdog.start()
+        return self
+
+    def stop(self):
+        """Stop timing callbacks."""
+        if not self.running:
+            return
+        self.running = False
+        proxy = self.widget._tkreform_monitoring  # type: ignore
+        if proxy.monitor is self:
+            proxy.monitor = None
+            swap_interpreter(self.widget, proxy, proxy.tk)
+        self._stopped.set()
+        self._heartbeat.set()
+        # joined, so that the interpreter is never released in its thread
+        if self._watchdog is not None:
+            self._watchdog.join(1)
+            self._watchdog = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc: Any):
+        self.stop()
+
+    def _run(
+        self, label: str, wrapper: Optional[tk.CallWrapper], func: Callable[..., Any],
+        args: Tuple[Any, ...]
+    ):
+        # a callback of the interpreter, usually a `tk.CallWrapper`
+        start = time.perf_counter()
+        if wrapper is not None and wrapper.subst is not None and len(args) > _PATH:
+            path = args[_PATH]
+            self._input_latency(args[_TIME], start)
+        else:
+            path = str(wrapper.widget) if wrapper is not None else ""
+        outer, outer_stall = self._current, self._stall
+        self._current, self._stall = (label, path, start), None
+        if not self._heartbeat.is_set():
+            self._heartbeat.set()
+        try:
+            return func(*args)
+        finally:
+            self._finished(label, time.perf_counter() - start)
+            self._current, self._stall = outer, outer_stall
+
+    def _input_latency(self, stamp: str, now: float):
+        try:
+            server = int(stamp)
+        except ValueError:  # not an input event
+            return
+        if server <= 0:
+            return
+        offset = now * 1000 - server
+        if self._offset is None or offset < self._offset:
+            self._offset = offset
+        self.latency.add(offset - self._offset)
+
+    def _finished(self, label: str, seconds: float):
+        ms = seconds * 1000
+        self.durations.add(ms)
+        stats = self.by_name.get(label)
+        if stats is None:
+            stats = self.by_name[label] = [0, 0.0, 0.0]
+        stats[0] += 1
+        stats[1] += ms
+        stats[2] = max(stats[2], ms)
+        over = [b for b in self.budgets if ms > b]
+        if not over:
+            return
+        current = self._current
+        stall = self._stall or Stall(
+            label, current[1] if current else "", over[-1], current[2] if current else 0.0
+        )
+        stall.budget = over[-1]
+        stall.duration = ms
+        self.stalls.append(stall)
+        if self.on_stall is not None:
+            self.on_stall(stall)
+
+    def _watch(self):
+        # sample the Tcl thread once per callback running past the budget,
+        # sleeping while no callback runs
+        budget = self.budgets[0] / 1000
+        while True:
+            self._heartbeat.wait()
+            if self._stopped.is_set():
+                return
+            # cleared first: callbacks starting from now on wake it again
+            self._heartbeat.clear()
+            current = self._current
+            if current is None:
+                continue
+            label, path, start = current
+            if self._stopped.wait(max(0.0, start + budget - time.perf_counter())):
+                return
+            if self._current is not current or self._stall is not None:
+                continue
+            frame = sys._current_frames().get(self._thread_id)
+            stack = traceback.format_stack(frame) if frame is not None else []
+            if self._current is current:
+                self._stall = Stall(label, path, self.budgets[0], start, stack)
+
+    def dump(self) -> Dict[str, Any]:
+        """
+        Get the histograms, callbacks and stalls as plain data.
+
+        Returns: `dict`
+        """
+        return {
+            "durations": self.durations.dump(),
+            "latency": self.latency.dump(),
+            "callbacks": {
+                name: {"count": c, "total_ms": t, "max_ms": m}
+                for name, (c, t, m) in sorted(self.by_name.items(), key=lambda x: -x[1][1])
+            },
+            "stalls": [
+                {"callback": s.name, "path": s.path, "ms": s.duration, "stack": s.stack}
+                for s in self.stalls
+            ],
+        }
@@ -0,0 +1,148 @@
+"""
+TkReform option cache.
+
+`OptionCache` keeps the option values of a window / widget in Python, so
+that property reads (`text`, `width`, `font`, `disabled`, `bgcolor`, ...)
+don't need a `cget` through the Tcl interpreter. It is filled with the
+options the widget was created with and every value written through
+tkreform; other options are fetched once. An execution trace on the widget
+command drops the cached values whenever the widget is configured in any
+other way (directly through tkinter, or from Tcl): writes through the cache
+are told apart in Tcl, without calling back into Python. The text of a
+widget with a `textvariable` follows the variable, and is always read from
+Tcl.
+
+Example:
+>>> window.caching = True  # for the widgets added later
+>>> window /= render(model)
+>>> label.cache_options()  # or for one existing widget
+>>> label.options.hit_rate
+"""
+
+import tkinter as tk
+from typing import Any, Callable, Dict
+
+from tkreform.script import define
+
+_WATCH = """
+namespace eval ::tkreform {
+    # the widget configured through its cache, if any
+    variable writing {}
+}
+proc ::tkreform::configured {callback cmd op} {
+    if {[lindex $cmd 0] ne $::tkreform::writing
+            && [lindex $cmd 1] in {configure config} && [llength $cmd] > 3} {
+        $callback
+    }
+}
+proc ::tkreform::write {w args} {
+    set outer $::tkreform::writing
+    set ::tkreform::writing $w
+    try {
+        $w configure {*}$args
+    } finally {
+        set ::tkreform::writing $outer
+    }
+}
+"""
+
+# options following a linked variable, never cached while it is set
+_LINKED = {"text": "textvariable"}
+
+
+class OptionCache:
+    """Write-through cache of the option values of one window / widget."""
+    def __init__(self, widget: tk.Misc) -> None:
+        """
+        Use `of` to get the cache of a widget.
+
+        - widget: `WindowType | WidgetType` - the cached widget
+        """
+        self.values: Dict[str, Any] = {}
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        define(widget, "options", _WATCH)
+        tkapp = widget.tk
+        callback = widget._register(self._configured)
+        tkapp.call(
+            "trace", "add", "execution", str(widget), "enter",
+            ("::tkreform::configured", callback)
+        )
+
+    @classmethod
+    def of(cls, widget: tk.Misc, values: Dict[str, Any]) -> "OptionCache":
+        """
+        Get the cache of a widget, created at the first call.
+
+        - widget: `WindowType | WidgetType` - the cached widget
+        - values: `dict` - option values known already, such as the ones
+            the widget was created with
+
+        Returns: `OptionCache`
+        """
+        cache = getattr(widget, "_tkreform_options", None)
+        if cache is None:
+            cache = widget._tkreform_options = cls(widget)  # type: ignore
+        cache.values.update((k, v) for k, v in values.items() if not k.endswith("_"))
+        return cache
+
+    @property
+    def hit_rate(self) -> float:
+        """The ratio of reads answered from the cache."""
+        reads = self.hits + self.misses
+        return self.hits / reads if reads else 0.0
+
+    def get(self, option: str, fetch: Callable[[str], Any]):
+        """
+        Get an option value, from the cache if known.
+
+        - option: `str` - the option name
+        - fetch: `func: (str) -> Any` - reads the value from Tcl otherwise
+
+        Returns: the option value
+        """
+        linked = _LINKED.get(option)
+        if linked is not None and self._linked(linked, fetch):
+            self.misses += 1
+            return fetch(option)
+        try:
+            value = self.values[option]
+        except KeyError:
+            self.misses += 1
+            value = self.values[option] = fetch(option)
+            return value
+        self.hits += 1
+        return value
+
+    def write(self, widget: tk.Misc, options: Dict[str, Any]):
+        """
+        Configure the widget, and keep the values written.
+
+        - widget: `WindowType | WidgetType` - the cached widget
+        - options: `dict` - the option values
+        """
+        widget.tk.call(("::tkreform::write", widget._w) + widget._options(options))
+        self.values.update(options)
+
+    def clear(self):
+        """Drop every cached value."""
+        self.values.clear()
+
+    def _linked(self, option: str, fetch: Callable[[str], Any]) -> bool:
+        # whether a variable is linked to the widget, through `option`
+        try:
+            value = self.values[option]
+        except KeyError:
+            try:
+                value = fetch(option)
+            except tk.TclError:  # no such option
+                value = ""
+            self.values[option] = value
+        return bool(str(value))
+
+    def _configured(self):
+        # any configuration elsewhere may change several options at once
+        # (aliases, options of ttk styles, ...)
+        self.invalidations += 1
+        self.values.clear()
@@ -0,0 +1,162 @@
+"""
+TkReform widget pool.
+
+When a window / widget has a `WidgetPool`, its destroyed sub widgets are
+unmapped and kept instead of being destroyed, and widgets of the same class
+added later under the same parent are taken from the pool: their options
+are reset to defaults and the new ones applied in one `configure` call, and
+their bindings and bind tags are reset.
+
+Example:
+>>> from tkreform.pool import WidgetPool
+>>> window.pool = WidgetPool(cap=32)
+>>> window /= render(model)  # later renders reuse the destroyed widgets
+>>> window.pool.hit_rate
+"""
+
+import sys
+import tkinter as tk
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple, Type
+
+from tkreform.base import _CREATION_ONLY
+from tkreform.batch import _exists
+from tkreform.script import TclScript
+
+if TYPE_CHECKING:
+    from tkreform.base import Widget
+
+if sys.version_info >= (3, 8):
+    from typing import Literal
+else:
+    from typing_extensions import Literal
+
+_Key = Tuple[str, type]
+
+
+class WidgetPool:
+    """Pool of unmapped widgets, per parent and widget class."""
+    def __init__(
+        self, cap: int = 16, total: int = 1024,
+        policy: Literal["oldest", "largest"] = "oldest"
+    ) -> None:
+        """
+        - cap: `int` - number of widgets kept at most per parent and class
+        - total: `int` - number of widgets kept at most
+        - policy: `Literal["oldest", "largest"]` - which widget is destroyed
+            when the pool is full: the one released first, or the oldest of
+            the parent and class with the most widgets kept
+        """
+        self.cap = cap
+        self.total = total
+        self.policy = policy
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._free: Dict[_Key, List[tk.Misc]] = {}
+        # every kept widget, in release order
+        self._released: Dict[tk.Misc, _Key] = {}
+
+    @property
+    def size(self) -> int:
+        """The number of widgets kept."""
+        return len(self._released)
+
+    @property
+    def hit_rate(self) -> float:
+        """The ratio of widgets taken from the pool among those added."""
+        return self.hits / (self.hits + self.misses) if self.hits + self.misses else 0.0
+
+    def acquire(self, parent: tk.Misc, sw: Type[tk.Misc], kwargs: Dict[str, Any]):
+        """
+        Take a widget from the pool, configured with `kwargs`.
+
+        - parent: `WindowType | WidgetType` - the parent of the widget
+        - sw: `Type[WidgetType]` - the widget class
+        - kwargs: `Dict[str, Any]` - widget options
+
+        Returns: `WidgetType | None` - `None` if there is none to reuse
+        """
+        if isinstance(parent.tk, TclScript) or any(k in kwargs for k in _CREATION_ONLY):
+            return None
+        free = self._free.get((str(parent), sw), [])
+        while free:
+            w = free.pop()
+            del self._released[w]
+            if _exists(w):
+                break
+            # destroyed outside the pool, e.g. with its parent
+            self._purge(str(w))
+        else:
+            self.misses += 1
+            return None
+        self.hits += 1
+        options = {
+            k: spec[3] for k, spec in w.configure().items()  # type: ignore
+            if len(spec) == 5 and str(spec[3]) != str(spec[4])
+        }
+        options.update(kwargs)
+        if options:
+            w.configure(**options)  # type: ignore
+        for seq in w.bind():
+            w.unbind(seq)
+        # back to the default tags, without the ones of groups and hooks
+        w.bindtags(())
+        return w
+
+    def release(self, widget: "Widget") -> bool:
+        """
+        Unmap a widget and keep it, instead of destroying it.
+
+        - widget: `Widget` - the widget to keep
+
+        Returns: `bool` - whether the widget was kept
+        """
+        w = widget.base
+        key = (str(w.master), type(w))
+        if (
+            isinstance(w, (tk.Menu, tk.Toplevel)) or self.cap <= 0 or self.total <= 0
+            or len(self._free.get(key, ())) >= self.cap
+        ):
+            return False
+        for child in widget._sub_widget:
+            child.destroy()
+        for c in list(w.children.values()):
+            if c not in self._released:
+                c.destroy()
+        manager = w.winfo_manager()
+        if manager in ("grid", "pack", "place"):
+            getattr(w, f"{manager}_forget")()
+        elif manager in ("notebook", "panedwindow"):
+            w.master.forget(w)  # type: ignore
+        while len(self._released) >= self.total:
+            self._evict()
+        self._free.setdefault(key, []).append(w)
+        self._released[w] = key
+        return True
+
+    def clear(self):
+        """Destroy every kept widget."""
+        for w in list(self._released):
+            if w in self._released:
+                self._drop(w)
+                w.destroy()
+
+    def _evict(self):
+        if self.policy == "largest":
+            w = max(self._free.values(), key=len)[0]
+        else:
+            w = next(iter(self._released))
+        self._drop(w)
+        w.destroy()
+        self.evictions += 1
+
+    def _drop(self, w: tk.Misc):
+        self._free[self._released.pop(w)].remove(w)
+        # widgets kept under `w` are destroyed together with it
+        self._purge(str(w))
+
+    def _purge(self, path: str):
+        # forget the widgets kept under a destroyed widget
+        for key in [k for k in self._free if k[0] == path or k[0].startswith(path + ".")]:
+            for c in self._free.pop(key):
+                del self._released[c]
@@ -0,0 +1,181 @@
+"""
+TkReform batched Tcl script emission.
+
+`TclScript` stands in for the Tcl interpreter of a widget tree while it is
+being built: instead of making one Python -> Tcl round trip per widget
+constructor, geometry call or `add` call, every command is recorded and the
+whole tree is created by evaluating one (or a few large) Tcl scripts.
+
+Only commands whose result is not used can be recorded: queries (`cget`,
+`winfo`, `configure` of a single option, ...) raise `ScriptReadError`.
+`after` commands go to the interpreter at once: their callbacks cannot run
+before the script is evaluated, and their ids are used.
+
+Example:
+>>> window.load_script((
+>>>     W(tk.Label, text=str(i)) * Gridder(row=i) for i in range(2000)
+>>> ))
+"""
+
+import re
+import tkinter as tk
+from tkinter import TclError
+from typing import Any, List, Tuple
+
+from tkreform.exceptions import ScriptReadError
+
+_PLAIN = re.compile(r'[^\s\[\]{}$;"\\#]+')
+_SPECIAL = re.compile(r'[\s\[\]{}$;"\\#]')
+_ESCAPES = {"\n": "\\n", "\t": "\\t", "\r": "\\r", "\v": "\\v", "\f": "\\f"}
+
+
+def _word(value: Any) -> str:
+    """Quote a value as one word of a Tcl command, substituting nothing."""
+    if isinstance(value, (list, tuple)):
+        value = " ".join(_word(v) for v in value)
+    elif isinstance(value, bool):
+        value = str(int(value))
+    else:
+        value = str(value)
+    if _PLAIN.fullmatch(value):
+        return value
+    if value and "\\" not in value and _balanced(value):
+        return "{" + value + "}"
+    if not value:
+        return "{}"
+    return _SPECIAL.sub(lambda m: _ESCAPES.get(m.group(), "\\" + m.group()), value)
+
+
+def _balanced(value: str) -> bool:
+    depth = 0
+    for c in value:
+        if c == "{":
+            depth += 1
+        elif c == "}":
+            depth -= 1
+            if depth < 0:
+                return False
+    return depth == 0
+
+
+# commands taking a widget path first, which don't create a widget
+_PATH_COMMANDS = frozenset((
+    "bind", "bindtags", "destroy", "event", "focus", "grab", "grid", "lower",
+    "pack", "place", "raise", "selection", "tk_popup", "winfo", "wm",
+))
+# widget subcommands changing the widget, and those with a query form:
+# the number of arguments before the first option
+_WIDGET_WRITES = frozenset(("add", "insert", "delete", "forget"))
+_WIDGET_CONFIGURE = {
+    "configure": 2, "config": 2, "entryconfigure": 3, "entryconfig": 3,
+    "paneconfigure": 3, "tab": 3,
+}
+_GEOMETRY_WRITES = frozenset(("configure", "forget", "remove"))
+
+
+def _is_write(args: Tuple[Any, ...]) -> bool:
+    """Whether a command only changes the interpreter, its result unused."""
+    name = str(args[0]) if args else ""
+    sub = str(args[1]) if len(args) > 1 else ""
+    if name.startswith("."):
+        if sub in _WIDGET_WRITES:
+            return True
+        options = _WIDGET_CONFIGURE.get(sub)
+        return options is not None and len(args) > options + 1
+    if name in ("grid", "pack", "place"):
+        if sub.startswith("."):
+            return True  # `grid .w ...`
+        if sub in ("columnconfigure", "rowconfigure"):
+            return len(args) > 5
+        return sub in _GEOMETRY_WRITES
+    if name == "bind":
+        return len(args) == 4
+    if name == "bindtags":
+        return len(args) == 3
+    if name == "trace":
+        return sub == "add"
+    if name == "wm":
+        return len(args) > 3
+    # widget creation: `label .path -option value ...`
+    return sub.startswith(".") and name not in _PATH_COMMANDS
+
+
+def define(widget: tk.Misc, name: str, script: str):
+    """
+    Evaluate a script defining Tcl procedures, once per interpreter.
+
+    - widget: `WindowType | WidgetType` - any widget of the interpreter
+    - name: `str` - name of the script, remembered by the root window
+    - script: `str` - the script
+    """
+    root = widget._root()
+    defined = getattr(root, "_tkreform_defined", None)
+    if defined is None:
+        defined = root._tkreform_defined = set()  # type: ignore
+    if name not in defined:
+        widget.tk.eval(script)
+        defined.add(name)
+
+
+class TclScript:
+    """Recorder collecting Tcl commands into scripts."""
+    def __init__(self, tk: Any, chunk: int = 1000) -> None:
+        """
+        - tk: `_tkinter.tkapp` - the interpreter the script is evaluated in
+        - chunk: `int` - number of commands evaluated at most per script
+        """
+        self.tk = tk
+        self.chunk = chunk
+        self.commands: List[str] = []
+        self.evals = 0
+        self.calls = 0
+        """The number of commands recorded."""
+
+    def call(self, *args: Any) -> str:
+        if len(args) == 1 and isinstance(args[0], tuple):
+            args = args[0]
+        if args and args[0] == "after":
+            return self.tk.call(*args)
+        command = " ".join(_word(a) for a in args)
+        if not _is_write(args):
+            raise ScriptReadError(f"{command!r} needs a result, and cannot be recorded")
+        self.commands.append(command)
+        self.calls += 1
+        if len(self.commands) >= self.chunk:
+            self.flush()
+        return ""
+
+    def flush(self):
+        """
+        Evaluate every recorded command.
+
+        Raises: `TclError` naming the command that failed, by its index
+            among the recorded ones
+        """
+        if not self.commands:
+            return
+        commands, self.commands = self.commands, []
+        self.evals += 1
+        # evaluated by `catch`, for the line of the error
+        failed = self.tk.getint(self.tk.call(
+            "catch", "\n".join(commands), "::tkreform_result", "::tkreform_options"
+        ))
+        if not failed:
+            return
+        message = self.tk.globalgetvar("::tkreform_result")
+        line = self.tk.getint(self.tk.call(
+            "dict", "get", self.tk.globalgetvar("::tkreform_options"), "-errorline"
+        ))
+        # commands may span several lines (quoted newlines)
+        first = 1
+        for i, command in enumerate(commands):
+            first += command.count("\n") + 1
+            if first > line:
+                break
+        index = self.calls - len(commands) + i
+        raise TclError(f"{message} (recorded call {index}: {command})")
+
+    def __getattr__(self, name: str):
+        # everything except `call` (command registration, conversions, ...)
+        # still goes to the interpreter
+        return getattr(self.tk, name)
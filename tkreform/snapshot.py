@@ -0,0 +1,97 @@
+"""
+TkReform geometry snapshots.
+
+`snapshot` queries `winfo` fields of a widget, or of every widget of a
+subtree, in one Tcl evaluation, instead of one round trip per field and
+widget. It is usually called through `snapshot()` of windows / widgets.
+
+Example:
+>>> for rec in window.snapshot("width", "height", "ismapped", subtree=True):
+...     if rec.ismapped:
+...         layout(rec.path, rec.width, rec.height)
+"""
+
+from collections import namedtuple
+from functools import lru_cache
+import keyword
+import tkinter as tk
+from typing import Any, Dict, List, Tuple
+
+from tkreform.script import define
+
+_SNAPSHOT = """
+namespace eval ::tkreform {}
+proc ::tkreform::snapshot {fields subtree path} {
+    set out {}
+    set stack [list $path]
+    while {[llength $stack]} {
+        set stack [lassign $stack w]
+        set rec [list $w]
+        foreach f $fields {
+            lappend rec [winfo $f $w]
+        }
+        lappend out $rec
+        if {$subtree} {
+            set stack [concat [winfo children $w] $stack]
+        }
+    }
+    return $out
+}
+"""
+
+_INT = int
+_BOOL = lambda v: bool(int(v))  # noqa: E731
+FIELDS: Dict[str, Any] = {
+    "width": _INT, "height": _INT, "reqwidth": _INT, "reqheight": _INT,
+    "x": _INT, "y": _INT, "rootx": _INT, "rooty": _INT,
+    "vrootx": _INT, "vrooty": _INT, "depth": _INT,
+    "ismapped": _BOOL, "viewable": _BOOL,
+    "class": str, "manager": str, "geometry": str, "toplevel": str,
+}
+"""The `winfo` fields that can be queried, with their conversions."""
+DEFAULT_FIELDS = ("width", "height", "rootx", "rooty", "ismapped", "reqwidth", "reqheight")
+
+
+@lru_cache(maxsize=64)
+def record(fields: Tuple[str, ...]) -> type:
+    """
+    Get the record type of a set of fields.
+
+    - fields: `tuple[str]` - the field names
+
+    Returns: `namedtuple` type, with `path` and the fields (`class` as
+        `class_`)
+    """
+    return namedtuple("Snapshot", ("path", ) + tuple(
+        f + "_" if keyword.iskeyword(f) else f for f in fields
+    ))
+
+
+def snapshot(
+    widget: tk.Misc, fields: Tuple[str, ...] = DEFAULT_FIELDS, subtree: bool = False
+) -> List[Any]:
+    """
+    Query `winfo` fields of a widget in one Tcl evaluation.
+
+    - widget: `WindowType | WidgetType` - the widget
+    - fields: `tuple[str]` - the fields, see `FIELDS`
+    - subtree: `bool` - whether to query every descendant as well, in
+        depth-first order
+
+    Returns: `list[Snapshot]`, with the path of the widget and the fields
+    """
+    unknown = [f for f in fields if f not in FIELDS]
+    if unknown:
+        raise ValueError(f"unknown snapshot field(s): {', '.join(unknown)}.")
+    define(widget, "snapshot", _SNAPSHOT)
+    tkapp = widget.tk
+    rows = tkapp.splitlist(
+        tkapp.call("::tkreform::snapshot", fields, int(subtree), str(widget))
+    )
+    rec = record(tuple(fields))
+    convert = [FIELDS[f] for f in fields]
+    out = []
+    for row in rows:
+        path, *values = tkapp.splitlist(row)
+        out.append(rec(str(path), *(c(v) for c, v in zip(convert, values))))
+    return out
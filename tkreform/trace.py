@@ -0,0 +1,298 @@
+"""
+TkReform Tcl call tracing.
+
+While a `Tracer` runs, every call from Python to the Tcl interpreter
+(widget creation, `configure`, `grid` / `pack` / `place`, `bind`, ...) is
+counted and timed, as well as every Python callback Tcl runs, and charged
+to the stack of declarative nodes being built (`W` nodes, named by widget
+class and key) or of callbacks running. It is usually created through
+`Window.trace`.
+
+Calls are timed by a stand-in of the interpreter, shared by the tracers of
+an interpreter and given to its widgets while any of them runs. Variables
+and images created meanwhile keep it, and call through it untimed once
+tracing stopped: compare and key interpreters by `unwrap(widget.tk)`.
+
+Example:
+>>> with window.trace() as tracer:
+...     window /= render(model)
+...     window.update()
+>>> print(tracer.table(10))  # most expensive subtrees and callbacks
+>>> open("ui.folded", "w").write(tracer.folded())  # for flamegraph.pl
+"""
+
+import time
+import tkinter as tk
+from typing import TYPE_CHECKING, Any, Callable, ClassVar, Dict, List, Optional, Tuple, cast
+
+if TYPE_CHECKING:
+    from tkreform.declarative import W
+
+Stack = Tuple[str, ...]
+
+
+def label(w: "W") -> str:
+    """The name of a declarative node in traces: widget class, and key."""
+    name = w.widget.__name__
+    return name if w.key is None else f"{name}@{w.key}"
+
+
+def _command(args: Tuple[Any, ...]) -> str:
+    if not args:
+        return "?"
+    name = str(args[0])
+    if name.startswith(".") and len(args) > 1:
+        return f"<widget> {args[1]}"  # widget command
+    return name
+
+
+def unwrap(tk: Any) -> Any:
+    """
+    Get the interpreter behind stand-ins such as the tracing one.
+
+    - tk: `_tkinter.tkapp` - the interpreter, or a stand-in of it
+
+    Returns: `_tkinter.tkapp`
+    """
+    inner = getattr(tk, "tk", None)
+    while inner is not None:
+        tk, inner = inner, getattr(inner, "tk", None)
+    return tk
+
+
+def swap_interpreter(widget: tk.Misc, old: Any, new: Any):
+    """
+    Replace the interpreter of a widget and its descendants, also where
+    another stand-in was put in front of it meanwhile.
+
+    - widget: `WindowType | WidgetType` - the widget
+    - old: `_tkinter.tkapp` - the interpreter (or stand-in) to replace
+    - new: `_tkinter.tkapp` - its replacement
+    """
+    todo = [widget]
+    while todo:
+        w = todo.pop()
+        if w.tk is old:
+            w.tk = new
+        else:
+            holder = w.tk
+            inner = getattr(holder, "tk", None)
+            while inner is not None and inner is not old:
+                holder, inner = inner, getattr(inner, "tk", None)
+            if inner is old:
+                holder.tk = new
+        todo.extend(w.children.values())
+
+
+def callback_name(func: Callable[..., Any], default: str) -> str:
+    """
+    Get the name of a callback registered to Tcl.
+
+    - func: `func: (*args) -> Any` - the command, usually a `CallWrapper`
+        of the function, or of an `after` job running it
+    - default: `str` - name used if nothing better is found
+
+    Returns: `str`
+    """
+    while hasattr(func, "__wrapped__"):  # wrapped by other stand-ins
+        func = func.__wrapped__  # type: ignore
+    target = getattr(getattr(func, "__self__", None), "func", func)
+    if getattr(target, "__qualname__", "").endswith(".after.<locals>.callit"):
+        for cell in getattr(target, "__closure__", None) or ():
+            if callable(cell.cell_contents) and not isinstance(cell.cell_contents, tk.Misc):
+                target = cell.cell_contents
+                break
+    return getattr(target, "__qualname__", default)
+
+
+class TracingTk:
+    """Interpreter stand-in, timing calls for the tracers running."""
+    def __init__(self, tk: Any) -> None:
+        """
+        - tk: `_tkinter.tkapp` - the interpreter
+        """
+        self.tk = tk
+        self.tracers: List["Tracer"] = []
+
+    def call(self, *args: Any):
+        tracers = self.tracers
+        if not tracers:
+            return self.tk.call(*args)
+        if len(args) == 1 and isinstance(args[0], tuple):
+            args = args[0]
+        start = time.perf_counter()
+        try:
+            return self.tk.call(*args)
+        finally:
+            seconds = time.perf_counter() - start
+            for tracer in tracers:
+                tracer._record(_command(args), seconds)
+
+    def eval(self, script: str):
+        tracers = self.tracers
+        if not tracers:
+            return self.tk.eval(script)
+        start = time.perf_counter()
+        try:
+            return self.tk.eval(script)
+        finally:
+            seconds = time.perf_counter() - start
+            for tracer in tracers:
+                tracer._record("eval", seconds)
+
+    def createcommand(self, name: str, func: Callable[..., Any]):
+        frame = f"callback {callback_name(func, name)}"
+
+        def traced(*args: Any):
+            tracers = self.tracers
+            if not tracers:
+                return func(*args)
+            states = [tracer._enter_callback(frame) for tracer in tracers]
+            start = time.perf_counter()
+            try:
+                return func(*args)
+            finally:
+                seconds = time.perf_counter() - start
+                for tracer, state in zip(tracers, states):
+                    tracer._leave_callback(state, seconds)
+        traced.__wrapped__ = func  # type: ignore
+        return self.tk.createcommand(name, traced)
+
+    def __getattr__(self, name: str):
+        return getattr(self.tk, name)
+
+
+class Tracer:
+    """Counter and timer of Tcl calls and callbacks, by node / callback stack."""
+    active: ClassVar[Optional["Tracer"]] = None
+    """The tracer nodes being built are reported to, if any."""
+
+    def __init__(self, widget: tk.Misc) -> None:
+        """
+        - widget: `WindowType | WidgetType` - any widget of the interpreter
+            whose calls are traced
+        """
+        self.widget = widget._root()
+        self.running = False
+        self.calls: Dict[Stack, List[Any]] = {}
+        """Count and seconds per stack, ending with the Tcl command."""
+        self._stack: List[str] = []
+        # seconds of Tcl calls made by the running callback
+        self._inner = 0.0
+        self._outer: Optional["Tracer"] = None
+
+    def start(self):
+        """Start tracing calls."""
+        if self.running:
+            return self
+        root = self.widget
+        proxy = getattr(root, "_tkreform_tracing", None)
+        if proxy is None:
+            # one stand-in per interpreter, kept for the objects holding it
+            proxy = root._tkreform_tracing = TracingTk(unwrap(root.tk))  # type: ignore
+        if not proxy.tracers:
+            swap_interpreter(root, proxy.tk, proxy)
+        # a new list, not to change the one iterated by a call in progress
+        proxy.tracers = proxy.tracers + [self]
+        self.running = True
+        self._outer, Tracer.active = Tracer.active, self
+        return self
+
+    def stop(self):
+        """Stop tracing calls."""
+        if not self.running:
+            return
+        self.running = False
+        if Tracer.active is self:
+            Tracer.active = self._outer
+        while Tracer.active is not None and not Tracer.active.running:
+            Tracer.active = Tracer.active._outer
+        proxy = cast(TracingTk, self.widget._tkreform_tracing)  # type: ignore
+        proxy.tracers = [t for t in proxy.tracers if t is not self]
+        if not proxy.tracers:
+            swap_interpreter(self.widget, proxy, proxy.tk)
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc: Any):
+        self.stop()
+
+    def enter(self, name: str):
+        """Charge the following calls to a node, until `leave`."""
+        self._stack.append(name)
+
+    def leave(self):
+        self._stack.pop()
+
+    def _record(self, command: str, seconds: float):
+        key = tuple(self._stack) + (command, )
+        entry = self.calls.get(key)
+        if entry is None:
+            entry = self.calls[key] = [0, 0.0]
+        entry[0] += 1
+        entry[1] += seconds
+        self._inner += seconds
+
+    def _enter_callback(self, frame: str) -> Tuple[List[str], float]:
+        # callbacks start their own stack, and "(python)" gets the time not
+        # spent in Tcl calls
+        state = (self._stack, self._inner)
+        self._stack, self._inner = [frame], 0.0
+        return state
+
+    def _leave_callback(self, state: Tuple[List[str], float], seconds: float):
+        self._record("(python)", seconds - self._inner)
+        self._stack, self._inner = state
+
+    @property
+    def count(self) -> int:
+        """The number of Tcl calls traced."""
+        return sum(c for s, (c, _) in self.calls.items() if s[-1] != "(python)")
+
+    def folded(self) -> str:
+        """
+        The trace in the folded stack format of flame graph tools, one
+        `frame;frame;command microseconds` line per stack.
+
+        Returns: `str`
+        """
+        return "".join(
+            f"{';'.join(stack)} {round(seconds * 1e6)}\n"
+            for stack, (_, seconds) in sorted(self.calls.items())
+        )
+
+    def subtrees(self) -> Dict[Stack, Tuple[int, float]]:
+        """
+        Get the inclusive cost of every node / callback stack.
+
+        Returns: `dict[stack, (calls, seconds)]`
+        """
+        out: Dict[Stack, List[Any]] = {}
+        for stack, (count, seconds) in self.calls.items():
+            tcl = stack[-1] != "(python)"
+            for i in range(1, len(stack)):
+                entry = out.setdefault(stack[:i], [0, 0.0])
+                entry[0] += count if tcl else 0
+                entry[1] += seconds
+        return {k: (c, s) for k, (c, s) in out.items()}
+
+    def table(self, limit: int = 20) -> str:
+        """
+        Get the most expensive subtrees and callbacks, as a text table.
+
+        - limit: `int` - number of rows
+
+        Returns: `str`
+        """
+        rows = sorted(self.subtrees().items(), key=lambda x: -x[1][1])[:limit]
+        lines = [f"{'ms':>10} {'calls':>8}  stack"]
+        lines += [
+            f"{seconds * 1e3:10.3f} {count:8d}  {' > '.join(stack)}"
+            for stack, (count, seconds) in rows
+        ]
+        return "\n".join(lines)
+
+    def clear(self):
+        """Forget every call traced so far."""
+        self.calls.clear()
@@ -0,0 +1,178 @@
+"""
+TkReform virtualized list.
+
+`VirtualList` shows a list of any length with a fixed pool of row widgets:
+only enough rows to fill the viewport are created, from a `dec.W` row
+template, and they are rebound to other data indices as the list scrolls.
+Rows sit in a sheet frame that is moved as a whole when scrolling; a row is
+placed again only when it is rebound, or once every pool size rows scrolled.
+
+Example:
+>>> import tkinter as tk
+>>> from tkreform.declarative import W, Packer
+>>> from tkreform.virtual import VirtualList
+>>> data = [f"Item {i}" for i in range(100000)]
+>>> def bind(row, index):
+...     row[0].text = data[index]
+>>> rows = VirtualList(
+...     window, W(tk.Frame) / (W(tk.Label, anchor="w") * Packer(fill="x"), ),
+...     len(data), bind, row_height=24
+... )
+>>> rows.pack(fill="both", expand=True)
+"""
+
+import tkinter as tk
+from tkinter import ttk
+from typing import Any, Callable, List, Optional, Tuple
+
+from tkreform import declarative as dec
+from tkreform.base import Widget, _Base
+
+
+class VirtualList(Widget):
+    """
+    Scrolling list of `count` rows, sharing a pool of row widgets.
+    """
+    base: tk.Frame
+
+    def __init__(
+        self, parent: _Base, row: dec.W, count: int,
+        bind: Callable[[Widget, int], Any], row_height: int, **kwargs: Any
+    ) -> None:
+        """
+        Create a virtualized list in a window / widget.
+
+        - parent: `Window | Widget` - where to add the list
+        - row: `dec.W` - row template, without geometry controller (rows are
+            placed by the list)
+        - count: `int` - number of rows
+        - bind: `(row: Widget, index: int) -> Any` - show data `index` in
+            `row`, called whenever a row is (re)bound
+        - row_height: `int` - height of every row, in pixels
+        - **kwargs - arguments for the outer frame
+        """
+        super().__init__(tk.Frame(parent.base, **kwargs))
+        parent._add_sub(self)
+        self.row_height = row_height
+        self._template = dec.compile((row, ))
+        self._bind = bind
+        self._count = count
+        self._offset = 0
+        self._height = 0
+        self._rows: List[Widget] = []
+        # data index and y position in the sheet of every row in the pool
+        self._bound: List[Optional[int]] = []
+        self._ys: List[Optional[int]] = []
+        self._sheet_at: Optional[Tuple[int, int]] = None
+        self._tag = f"VirtualList{id(self)}"
+        self.scrollbar = self.add_widget(ttk.Scrollbar, orient="vertical", command=self.yview)
+        self.scrollbar.pack(side="right", fill="y")
+        self.viewport = self.add_widget(tk.Frame)
+        self.viewport.pack(side="left", fill="both", expand=True)
+        self.sheet = self.viewport.add_widget(tk.Frame)
+        self._tag_wheel(self.viewport.base)
+        for seq in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.base.bind_class(self._tag, seq, self._wheel)
+        self.viewport.on("<Configure>")(self._resize)
+
+    @property
+    def count(self) -> int:
+        """The number of rows. Setting it rebinds every visible row."""
+        return self._count
+
+    @count.setter
+    def count(self, n: int):
+        self._count = n
+        self._offset = min(self._offset, self._max_offset())
+        self.refresh()
+
+    def refresh(self):
+        """Rebind every visible row, e.g. after the data changed."""
+        self._bound = [None] * len(self._rows)
+        self._layout()
+
+    def yview(self, *args: str):
+        """Scroll the list, following the `yview` protocol of scrollbars."""
+        if args[0] == "moveto":
+            self.scroll_to(int(float(args[1]) * self._count * self.row_height))
+        elif args[0] == "scroll":
+            step = self.row_height if args[2] == "units" else self._height
+            self.scroll_to(self._offset + int(args[1]) * step)
+
+    def scroll_to(self, offset: int):
+        """Scroll to a y offset, in pixels."""
+        offset = max(0, min(offset, self._max_offset()))
+        if offset != self._offset:
+            self._offset = offset
+            self._layout()
+
+    def see(self, index: int):
+        """Scroll so that the row `index` is visible."""
+        top = index * self.row_height
+        if top < self._offset:
+            self.scroll_to(top)
+        elif top + self.row_height > self._offset + self._height:
+            self.scroll_to(top + self.row_height - self._height)
+
+    def _max_offset(self):
+        return max(0, self._count * self.row_height - self._height)
+
+    def _tag_wheel(self, w: tk.Misc):
+        w.bindtags((self._tag, ) + w.bindtags())
+        for c in w.children.values():
+            self._tag_wheel(c)
+
+    def _wheel(self, event: tk.Event):
+        if event.num == 4:
+            units = -1
+        elif event.num == 5:
+            units = 1
+        else:
+            units = -(event.delta // 120) or (-1 if event.delta > 0 else 1)
+        self.scroll_to(self._offset + units * self.row_height)
+
+    def _resize(self, event: tk.Event):
+        self._height = event.height
+        self._offset = min(self._offset, self._max_offset())
+        size = event.height // self.row_height + 2
+        if size > len(self._rows):
+            while len(self._rows) < size:
+                row, = self._template.stamp(self.sheet)
+                self._tag_wheel(row.base)
+                self._rows.append(row)
+            # data indices map to rows by `index % size`, so all rows move
+            self._bound = [None] * size
+            self._ys = [None] * size
+        self._layout()
+
+    def _layout(self):
+        size = len(self._rows)
+        if not size:
+            return
+        first = self._offset // self.row_height
+        # rows are placed from the start of the page of `first` in the sheet
+        base = first - first % size
+        at = (base * self.row_height - self._offset, 2 * size * self.row_height)
+        if self._sheet_at != at:
+            self.sheet.base.place(x=0, y=at[0], relwidth=1, height=at[1])
+            self._sheet_at = at
+        for index in range(first, first + size):
+            slot = index % size
+            row = self._rows[slot]
+            if index >= self._count:
+                if self._ys[slot] is not None:
+                    row.base.place_forget()
+                    self._bound[slot] = self._ys[slot] = None
+                continue
+            if self._bound[slot] != index:
+                self._bind(row, index)
+                self._bound[slot] = index
+            y = (index - base) * self.row_height
+            if self._ys[slot] != y:
+                row.base.place(x=0, y=y, relwidth=1, height=self.row_height)
+                self._ys[slot] = y
+        total = self._count * self.row_height
+        if total > self._height:
+            self.scrollbar.base.set(self._offset / total, (self._offset + self._height) / total)
+        else:
+            self.scrollbar.base.set(0, 1)